@@ -11,8 +11,43 @@ import random
 import math
 import json
 import os
+import weakref
+import threading
+import cProfile
+import marshal
+import gc
+import hashlib
+import mmap
+import struct
+import zlib
+import array
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
 from typing import List, Optional, Tuple
 
+# NUMPY AVAILABILITY FLAG
+try:
+    import numpy as np
+    _HAVE_NUMPY = True
+except Exception:
+    np = None
+    _HAVE_NUMPY = False
+
+# SQLITE AVAILABILITY FLAG
+try:
+    import sqlite3
+    _HAVE_SQLITE = True
+except Exception:
+    sqlite3 = None
+    _HAVE_SQLITE = False
+
+# GFXDRAW AVAILABILITY FLAG (ALPHA-BLENDED PRIMITIVES)
+try:
+    import pygame.gfxdraw
+    _HAVE_GFXDRAW = True
+except Exception:
+    _HAVE_GFXDRAW = False
+
 # RESOURCE PATH FUNCTIONALITY
 def resource_path(relative_path):
     try:
@@ -60,6 +95,18 @@ STATE_STATS = 6
 STATE_WHACK = 7
 STATE_SETTINGS = 8
 
+STATE_NAMES = {
+    STATE_MENU: "menu",
+    STATE_DARTPOP: "dartpop",
+    STATE_HOOPSHOT: "hoopshot",
+    STATE_SPLASH: "splash",
+    STATE_SHELLGAME: "shellgame",
+    STATE_PRIZES: "prizes",
+    STATE_STATS: "stats",
+    STATE_WHACK: "whack",
+    STATE_SETTINGS: "settings",
+}
+
 # GAME CONSTANTS
 HIT_SCORE_INTERVAL = 0.5
 MAX_SWING_ANGLE = math.pi / 4.5
@@ -68,11 +115,15 @@ STREAM_LENGTH = 450
 
 SHUFFLE_EVENT = pygame.USEREVENT + 1
 SHUFFLE_DURATION_MS = 500
+SHUFFLE_GAP_MS = 100
 INITIAL_REVEAL_DURATION_MS = 1500
 
 SCORES_FILE = "arcade_high_scores.json"
 PRIZE_STATE_FILE = "arcade_prize_state.json"
 UNLOCK_STATE_FILE = "arcade_unlocks.json"
+JOURNAL_FILE = "arcade_journal.bin"
+PROFILE_DB_FILE = "arcade_profiles.db"
+TIMED_ROLLUP_FILE = "arcade_timed_rollup.json"
 
 # PRIZE DATA
 PRIZES = [
@@ -110,12 +161,15 @@ ACCESSIBILITY_OPTIONS = {
 }
 
 # ATOMIC JSON WRITE
-def atomic_write_json(path: str, data):
+def atomic_write_json(path: str, data, durable: bool = False):
     try:
         dirpath = os.path.dirname(path) or "."
         tmp_path = os.path.join(dirpath, f".{os.path.basename(path)}.tmp")
         with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
         os.replace(tmp_path, path)
     except Exception:
         try:
@@ -124,6 +178,597 @@ def atomic_write_json(path: str, data):
         except Exception:
             pass
 
+# BACKGROUND PERSISTENCE WRITER CLASS
+class PersistenceWriter:
+    # WRITER INIT
+    def __init__(self):
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._thread = None
+        self._closing = False
+        self.submitted = 0
+        self.completed = 0
+        self.coalesced = 0
+        self.writes = 0
+        self._groups = 0
+
+    # QUEUE A SAVE (LATEST DATA PER PATH WINS, QUEUE POSITION KEPT)
+    def save(self, path: str, data, durable: bool = False):
+        with self._lock:
+            previous = self._pending.get(path)
+            if previous is not None:
+                self.coalesced += 1
+                durable = durable or previous[1]
+            self._pending[path] = (((path, data),), durable)
+            self._submit()
+        self._wake.set()
+
+    # QUEUE SAVES WRITTEN IN ORDER (NEVER COALESCED OR REORDERED)
+    def save_group(self, entries, durable: bool = False):
+        with self._lock:
+            self._groups += 1
+            self._pending[('group', self._groups)] = (tuple(entries), durable)
+            self._submit()
+        self._wake.set()
+
+    # COUNT SUBMISSION AND START WORKER (LOCK HELD)
+    def _submit(self):
+        self.submitted += 1
+        if self._thread is None:
+            self._closing = False
+            self._thread = threading.Thread(target=self._run, name="arcade-persist", daemon=True)
+            self._thread.start()
+
+    # WAIT UNTIL EVERY QUEUED SAVE IS ON DISK
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            target = self.submitted
+            return self._done.wait_for(lambda: self.completed >= target, timeout)
+
+    # FLUSH AND STOP WORKER
+    def close(self, timeout: Optional[float] = None):
+        self.flush(timeout)
+        thread = self._thread
+        if thread is None:
+            return
+        self._closing = True
+        self._wake.set()
+        thread.join(timeout)
+        self._thread = None
+
+    # WORKER LOOP
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                batch = self._pending
+                self._pending = OrderedDict()
+                target = self.submitted
+            for entries, durable in batch.values():
+                for path, data in entries:
+                    atomic_write_json(path, data, durable=durable)
+                    self.writes += 1
+            with self._lock:
+                self.completed = target
+                self._done.notify_all()
+                if self._closing and not self._pending:
+                    break
+
+# SHARED PERSISTENCE WRITER
+PERSISTENCE = PersistenceWriter()
+
+# SCORE JOURNAL SETTINGS
+JOURNAL_ENABLED = os.environ.get("ARCADE_JOURNAL", "1") == "1" and "--benchmark" not in sys.argv
+JOURNAL_FSYNC_INTERVAL = 0.5
+JOURNAL_FSYNC_BATCH = 64
+JOURNAL_COMPACT_BYTES = 64 * 1024
+JOURNAL_HEADER = struct.Struct('<HI')
+JOURNAL_BODY = struct.Struct('<qBhq')
+JOURNAL_POINTS = 1
+JOURNAL_HIGH_SCORE = 2
+JOURNAL_PRIZE = 3
+JOURNAL_UNLOCK = 4
+
+# APPEND-ONLY SCORE JOURNAL CLASS
+class ScoreJournal:
+    # JOURNAL INIT
+    def __init__(self, path: Optional[str], compactor, seq: int = 0):
+        self.path = path
+        self.compactor = compactor
+        self.seq = seq
+        self.size = 0
+        self.compaction_due = False
+        self.records_written = 0
+        self.fsyncs = 0
+        self.compactions = 0
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._closing = False
+        self._compacting = False
+        self._file = None
+        self._thread = None
+
+    # READ RECORDS AND START WRITER
+    def open(self) -> list:
+        if not self.path:
+            return []
+        events = []
+        good = 0
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except Exception:
+            data = b""
+        while good + JOURNAL_HEADER.size <= len(data):
+            length, crc = JOURNAL_HEADER.unpack_from(data, good)
+            start = good + JOURNAL_HEADER.size
+            payload = data[start:start + length]
+            if length < JOURNAL_BODY.size or len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            seq, kind, game, value = JOURNAL_BODY.unpack_from(payload)
+            events.append((seq, kind, game, value, payload[JOURNAL_BODY.size:].decode('utf-8', 'replace')))
+            self.seq = max(self.seq, seq)
+            good = start + length
+        try:
+            self._file = open(self.path, 'r+b' if data else 'wb')
+            self._file.truncate(good)
+            self._file.seek(good)
+        except Exception:
+            self._file = None
+            return events
+        self.size = good
+        self._thread = threading.Thread(target=self._run, name="arcade-journal", daemon=True)
+        self._thread.start()
+        return events
+
+    # APPEND ONE EVENT (RENDER THREAD, CONSTANT TIME)
+    def append(self, kind: int, game: int = 0, value: int = 0, text: str = "") -> int:
+        self.seq += 1
+        if self._file is None:
+            return self.seq
+        payload = JOURNAL_BODY.pack(self.seq, kind, game, int(value)) + text.encode('utf-8')
+        self._queue.append(JOURNAL_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        if len(self._queue) >= JOURNAL_FSYNC_BATCH:
+            self._wake.set()
+        return self.seq
+
+    # FOLD JOURNAL INTO SNAPSHOT (RENDER THREAD HANDS OVER STATE)
+    def compact(self, snapshot):
+        self.compaction_due = False
+        if self._file is None:
+            self.compactor(snapshot)
+            return
+        self._compacting = True
+        self._queue.append(snapshot)
+        self._wake.set()
+
+    # FLUSH, COMPACT AND STOP WRITER
+    def close(self, snapshot):
+        self.compact(snapshot)
+        if self._thread is None:
+            return
+        self._closing = True
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    # WRITER THREAD LOOP
+    def _run(self):
+        unsynced = 0
+        last_sync = time.perf_counter()
+        while True:
+            self._wake.wait(JOURNAL_FSYNC_INTERVAL)
+            self._wake.clear()
+            pending = []
+            while self._queue:
+                item = self._queue.popleft()
+                if isinstance(item, bytes):
+                    pending.append(item)
+                    continue
+                unsynced += self._write(pending)
+                pending = []
+                self._sync()
+                unsynced = 0
+                self._fold(item)
+            unsynced += self._write(pending)
+            now = time.perf_counter()
+            if unsynced and (unsynced >= JOURNAL_FSYNC_BATCH or now - last_sync >= JOURNAL_FSYNC_INTERVAL):
+                self._sync()
+                unsynced = 0
+                last_sync = now
+            if self._closing and not self._queue:
+                break
+        try:
+            self._file.close()
+        except Exception:
+            pass
+
+    # WRITE RECORD BATCH
+    def _write(self, records) -> int:
+        if not records:
+            return 0
+        try:
+            chunk = b"".join(records)
+            self._file.write(chunk)
+            self.size += len(chunk)
+            self.records_written += len(records)
+        except Exception:
+            pass
+        if self.size >= JOURNAL_COMPACT_BYTES and not self._compacting:
+            self.compaction_due = True
+        return len(records)
+
+    # FLUSH AND FSYNC
+    def _sync(self):
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.fsyncs += 1
+        except Exception:
+            pass
+
+    # WRITE SNAPSHOT THEN TRUNCATE
+    def _fold(self, snapshot):
+        try:
+            self.compactor(snapshot)
+            self._file.seek(0)
+            self._file.truncate(0)
+            self._sync()
+            self.size = 0
+            self.compactions += 1
+        except Exception:
+            pass
+        self._compacting = False
+
+# PLAYER PROFILE STORE SETTINGS
+PROFILE_STORE_ENABLED = os.environ.get("ARCADE_PROFILES", "1") == "1" and "--benchmark" not in sys.argv
+# SINGLE LOCAL PLAYER (THE STORE IS A READ MODEL, POINTS LIVE ONLY IN THE JSON SNAPSHOT AND JOURNAL)
+DEFAULT_PLAYER_NAME = "Player 1"
+PROFILE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    game INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS purchases (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    prize TEXT NOT NULL,
+    cost INTEGER NOT NULL,
+    purchased_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS unlocks (
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    game INTEGER NOT NULL,
+    unlocked_at REAL NOT NULL,
+    PRIMARY KEY (player_id, game)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS scores_game_score ON scores (game, score DESC);
+CREATE INDEX IF NOT EXISTS scores_player_game ON scores (player_id, game, score DESC);
+CREATE INDEX IF NOT EXISTS purchases_player ON purchases (player_id);
+"""
+
+# SQLITE PLAYER PROFILE STORE CLASS (READS INLINE, WRITES ON A WORKER)
+class ProfileStore:
+    # STORE INIT
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.db = None
+        self._pending = []
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._thread = None
+        self._closing = False
+        self.submitted = 0
+        self.completed = 0
+        if not path or not _HAVE_SQLITE:
+            return
+        try:
+            self.db = self._connect()
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.executescript(PROFILE_SCHEMA)
+        except Exception:
+            self.db = None
+
+    # OPEN CONNECTION
+    def _connect(self):
+        db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("PRAGMA foreign_keys=ON")
+        return db
+
+    # STORE AVAILABLE
+    @property
+    def ready(self) -> bool:
+        return self.db is not None
+
+    # QUEUE ONE WRITE (STATEMENTS COMMIT TOGETHER ON THE WORKER)
+    def _write(self, *statements):
+        if self.db is None:
+            return
+        with self._lock:
+            self._pending.append(statements)
+            self.submitted += 1
+            if self._thread is None:
+                self._closing = False
+                self._thread = threading.Thread(target=self._run, name="arcade-profiles", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    # WAIT UNTIL EVERY QUEUED WRITE IS COMMITTED
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            target = self.submitted
+            return self._done.wait_for(lambda: self.completed >= target, timeout)
+
+    # WORKER LOOP (OWN CONNECTION, ONE TRANSACTION PER BATCH)
+    def _run(self):
+        try:
+            db = self._connect()
+        except Exception:
+            db = None
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                batch = self._pending
+                self._pending = []
+                target = self.submitted
+            if db is not None and batch:
+                try:
+                    db.execute("BEGIN")
+                    for statements in batch:
+                        for sql, params in statements:
+                            db.execute(sql, params)
+                    db.execute("COMMIT")
+                except Exception:
+                    try:
+                        db.execute("ROLLBACK")
+                    except Exception:
+                        pass
+            with self._lock:
+                self.completed = target
+                self._done.notify_all()
+                if self._closing and not self._pending:
+                    break
+        if db is not None:
+            try:
+                db.close()
+            except Exception:
+                pass
+
+    # GET OR CREATE PLAYER
+    def player_id(self, name: str) -> int:
+        if self.db is None:
+            return 0
+        try:
+            row = self.db.execute("SELECT id FROM players WHERE name = ?", (name,)).fetchone()
+            if row:
+                return row[0]
+            return self.db.execute("INSERT INTO players (name, created_at) VALUES (?, ?)",
+                                   (name, time.time())).lastrowid
+        except Exception:
+            return 0
+
+    # RECORD FINISHED GAME
+    def record_score(self, player_id: int, game: int, score: int):
+        self._write(("INSERT INTO scores (player_id, game, score, played_at) VALUES (?, ?, ?, ?)",
+                     (player_id, game, int(score), time.time())))
+
+    # RECORD PRIZE PURCHASE
+    def record_purchase(self, player_id: int, prize: str, cost: int):
+        self._write(("INSERT INTO purchases (player_id, prize, cost, purchased_at) VALUES (?, ?, ?, ?)",
+                     (player_id, prize, int(cost), time.time())))
+
+    # RECORD GAME UNLOCK
+    def record_unlock(self, player_id: int, game: int):
+        self._write(("INSERT OR IGNORE INTO unlocks (player_id, game, unlocked_at) VALUES (?, ?, ?)",
+                     (player_id, game, time.time())))
+
+    # TOP-N SCORES FOR ONE GAME
+    def top_scores(self, game: int, limit: int = 10) -> list:
+        if self.db is None:
+            return []
+        try:
+            return self.db.execute(
+                "SELECT p.name, s.score FROM scores s JOIN players p ON p.id = s.player_id "
+                "WHERE s.game = ? ORDER BY s.score DESC LIMIT ?", (game, limit)).fetchall()
+        except Exception:
+            return []
+
+    # LEADER PER GAME
+    def leaders(self, games) -> dict:
+        board = {}
+        for game in games:
+            top = self.top_scores(game, 1)
+            if top:
+                board[game] = top[0]
+        return board
+
+    # BEST SCORE PER GAME FOR ONE PLAYER
+    def best_scores(self, player_id: int, games) -> dict:
+        if self.db is None:
+            return {}
+        best = {}
+        try:
+            for game in games:
+                row = self.db.execute(
+                    "SELECT score FROM scores WHERE player_id = ? AND game = ? ORDER BY score DESC LIMIT 1",
+                    (player_id, game)).fetchone()
+                if row:
+                    best[game] = row[0]
+        except Exception:
+            pass
+        return best
+
+    # PLAYER PURCHASES AND UNLOCKS
+    def inventory(self, player_id: int) -> Tuple[list, list]:
+        if self.db is None:
+            return [], []
+        try:
+            prizes = [r[0] for r in self.db.execute("SELECT prize FROM purchases WHERE player_id = ?", (player_id,))]
+            games = [r[0] for r in self.db.execute("SELECT game FROM unlocks WHERE player_id = ?", (player_id,))]
+            return prizes, games
+        except Exception:
+            return [], []
+
+    # IMPORT LEGACY JSON STATE (FIRST RUN ONLY)
+    def import_legacy(self, player_id: int, scores_path: str, prizes_path: str, unlocks_path: str) -> bool:
+        if self.db is None:
+            return False
+        try:
+            if self.db.execute("SELECT 1 FROM meta WHERE key = 'legacy_import'").fetchone():
+                return False
+        except Exception:
+            return False
+
+        def read(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f), os.path.getmtime(path)
+            except Exception:
+                return {}, time.time()
+
+        scores, scores_at = read(scores_path)
+        prizes, prizes_at = read(prizes_path)
+        unlocks, unlocks_at = read(unlocks_path)
+        costs = {p['id']: p['cost'] for p in PRIZES}
+        try:
+            self.db.execute("BEGIN")
+            for key, value in scores.items():
+                if key.isdigit() and int(value) > 0:
+                    self.db.execute("INSERT INTO scores (player_id, game, score, played_at) VALUES (?, ?, ?, ?)",
+                                    (player_id, int(key), int(value), scores_at))
+            for prize, owned in prizes.items():
+                if owned:
+                    self.db.execute("INSERT INTO purchases (player_id, prize, cost, purchased_at) VALUES (?, ?, ?, ?)",
+                                    (player_id, prize, costs.get(prize, 0), prizes_at))
+            for game, owned in unlocks.items():
+                if owned and str(game).isdigit():
+                    self.db.execute("INSERT OR IGNORE INTO unlocks (player_id, game, unlocked_at) VALUES (?, ?, ?)",
+                                    (player_id, int(game), unlocks_at))
+            self.db.execute("INSERT INTO meta (key, value) VALUES ('legacy_import', ?)", (str(time.time()),))
+            self.db.execute("COMMIT")
+            return True
+        except Exception:
+            try:
+                self.db.execute("ROLLBACK")
+            except Exception:
+                pass
+            return False
+
+    # DRAIN WRITER AND CLOSE CONNECTIONS
+    def close(self, timeout: Optional[float] = None):
+        if self.db is None:
+            return
+        self.flush(timeout)
+        thread = self._thread
+        if thread is not None:
+            self._closing = True
+            self._wake.set()
+            thread.join(timeout)
+            self._thread = None
+        try:
+            self.db.execute("PRAGMA optimize")
+            self.db.close()
+        except Exception:
+            pass
+        self.db = None
+
+# TIMED GAME HISTORY SETTINGS
+TIMED_RECORD_CAPACITY = 256
+TIMED_ROLLUP_HOURS = 24 * 14
+TIMED_ROLLUP_DAYS = 400
+TIMED_ROLLUP_ENABLED = "--benchmark" not in sys.argv
+
+# TIMED GAME RING BUFFER CLASS
+class TimedRecordRing:
+    # RING INIT
+    def __init__(self, capacity: int = TIMED_RECORD_CAPACITY, rollup_path: Optional[str] = None):
+        self.capacity = capacity
+        self.games = array.array('b', [0]) * capacity
+        self.scores = array.array('q', [0]) * capacity
+        self.stamps = array.array('d', [0.0]) * capacity
+        self.head = 0
+        self.count = 0
+        self.rollup_path = rollup_path
+        self.rollups = {'hourly': {}, 'daily': {}}
+        self._load()
+
+    # LOAD PERSISTED AGGREGATES
+    def _load(self):
+        if not self.rollup_path:
+            return
+        try:
+            with open(self.rollup_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for period in self.rollups:
+                self.rollups[period] = dict(data.get(period, {}))
+        except Exception:
+            pass
+
+    # RECORD COUNT
+    def __len__(self) -> int:
+        return self.count
+
+    # RECORD BY POSITION (OLDEST FIRST, NEGATIVE FROM NEWEST)
+    def __getitem__(self, index: int) -> Tuple[int, int, float]:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        slot = (self.head - self.count + index) % self.capacity
+        return self.games[slot], self.scores[slot], self.stamps[slot]
+
+    # APPEND RECORD (OVERWRITES OLDEST WHEN FULL)
+    def append(self, game: int, score: int, timestamp: float):
+        slot = self.head
+        self.games[slot] = game
+        self.scores[slot] = score
+        self.stamps[slot] = timestamp
+        self.head = (slot + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        local = time.localtime(timestamp)
+        self._roll('hourly', time.strftime("%Y-%m-%dT%H", local), game, score, TIMED_ROLLUP_HOURS)
+        self._roll('daily', time.strftime("%Y-%m-%d", local), game, score, TIMED_ROLLUP_DAYS)
+
+    # FOLD RECORD INTO AGGREGATE BUCKET
+    def _roll(self, period: str, bucket: str, game: int, score: int, keep: int):
+        buckets = self.rollups[period]
+        if bucket not in buckets:
+            buckets[bucket] = {}
+            if len(buckets) > keep:
+                for old in sorted(buckets)[:len(buckets) - keep]:
+                    del buckets[old]
+        stats = buckets[bucket].setdefault(str(game), [0, 0, 0])
+        stats[0] += 1
+        stats[1] += score
+        stats[2] = max(stats[2], score)
+
+    # PERSIST AGGREGATES
+    def save(self):
+        if not self.rollup_path:
+            return
+        data = {period: {bucket: {game: list(stats) for game, stats in games.items()}
+                         for bucket, games in buckets.items()}
+                for period, buckets in self.rollups.items()}
+        PERSISTENCE.save(self.rollup_path, data)
+
 # SAFE FONT LOADER
 def safe_font(name=None, size=24, bold=False):
     try:
@@ -134,8 +779,173 @@ def safe_font(name=None, size=24, bold=False):
     except Exception:
         return pygame.font.Font(pygame.font.get_default_font(), size)
 
+# SURFACE FORMAT DEBUG FLAG
+DEBUG_SURFACE_FORMATS = os.environ.get("ARCADE_DEBUG_SURFACES", "0") == "1"
+
+# DISPLAY-FORMAT SURFACE FACTORY CLASS
+class SurfaceFactory:
+    # FACTORY INIT
+    def __init__(self):
+        self.generation = 0
+        self._signature = None
+        self._alpha_ref = None
+        self._opaque_ref = None
+        self._formats = ()
+        self._hooks = []
+        self._tracked = weakref.WeakKeyDictionary()
+        self.unconverted_blits = 0
+        self.last_frame_unconverted = 0
+        self.blit_count = 0
+        self.last_frame_blits = 0
+        self.audit_formats = DEBUG_SURFACE_FORMATS
+        self.counting = DEBUG_SURFACE_FORMATS
+
+    # DISPLAY PIXEL FORMAT SIGNATURE
+    def _display_signature(self):
+        disp = pygame.display.get_surface()
+        if disp is None:
+            return None
+        return (disp.get_bitsize(), disp.get_masks())
+
+    # REFRESH REFERENCE FORMATS
+    def _refresh_formats(self, signature):
+        self._signature = signature
+        if signature is None:
+            self._alpha_ref = None
+            self._opaque_ref = None
+            self._formats = ()
+            return
+        try:
+            self._alpha_ref = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            self._opaque_ref = pygame.Surface((1, 1)).convert()
+            self._formats = (
+                (self._alpha_ref.get_bitsize(), self._alpha_ref.get_masks()),
+                (self._opaque_ref.get_bitsize(), self._opaque_ref.get_masks()),
+            )
+        except Exception:
+            self._alpha_ref = None
+            self._opaque_ref = None
+            self._formats = ()
+
+    # DETECT DISPLAY MODE CHANGES
+    def check_display(self) -> bool:
+        signature = self._display_signature()
+        if signature == self._signature:
+            return False
+        had_display = self._signature is not None
+        self._refresh_formats(signature)
+        if had_display and signature is not None:
+            self.display_changed()
+            return True
+        return False
+
+    # DISPLAY FORMAT TEST
+    def is_display_format(self, surf) -> bool:
+        if self._signature is None:
+            self.check_display()
+        if not self._formats:
+            return True
+        return (surf.get_bitsize(), surf.get_masks()) in self._formats
+
+    # NEW SURFACE IN DISPLAY FORMAT
+    def new(self, size, alpha: bool = True):
+        if self._signature is None:
+            self.check_display()
+        ref = self._alpha_ref if alpha else self._opaque_ref
+        flags = pygame.SRCALPHA if alpha else 0
+        if ref is not None:
+            try:
+                return pygame.Surface(size, flags, ref)
+            except Exception:
+                pass
+        return pygame.Surface(size, flags)
+
+    # CONVERT EXISTING SURFACE
+    def prepare(self, surf, alpha: bool = True):
+        if surf is None or pygame.display.get_surface() is None or self.is_display_format(surf):
+            return surf
+        try:
+            return surf.convert_alpha() if alpha else surf.convert()
+        except Exception:
+            return surf
+
+    # REGISTER CACHE RECONVERT HOOK
+    def register_hook(self, hook):
+        if hook not in self._hooks:
+            self._hooks.append(hook)
+
+    # TRACK SURFACE ATTRIBUTE FOR RECONVERSION
+    def track(self, owner, attr: str, alpha: bool = True):
+        try:
+            self._tracked.setdefault(owner, {})[attr] = alpha
+        except TypeError:
+            pass
+
+    # RECONVERT AFTER DISPLAY MODE CHANGE
+    def display_changed(self):
+        self._refresh_formats(self._display_signature())
+        self.generation += 1
+        for hook in list(self._hooks):
+            try:
+                hook()
+            except Exception:
+                pass
+        for owner, attrs in list(self._tracked.items()):
+            for attr, alpha in attrs.items():
+                try:
+                    setattr(owner, attr, self.prepare(getattr(owner, attr), alpha))
+                except Exception:
+                    pass
+
+    # COUNT BLIT SOURCE FORMAT
+    def count_blit(self, source):
+        self.blit_count += 1
+        if not self.audit_formats:
+            return
+        try:
+            if not self.is_display_format(source):
+                self.unconverted_blits += 1
+        except Exception:
+            pass
+
+    # BLIT ONTO A FRAME TARGET (COUNTED WHILE COUNTING)
+    def blit(self, target, source, dest, area=None, special_flags=0):
+        if self.counting:
+            self.count_blit(source)
+        return target.blit(source, dest, area, special_flags)
+
+    # BATCH BLIT ONTO A FRAME TARGET
+    def blits(self, target, blit_sequence, doreturn=1):
+        if self.counting:
+            blit_sequence = list(blit_sequence)
+            for item in blit_sequence:
+                self.count_blit(item[0])
+        return target.blits(blit_sequence, doreturn)
+
+    # DRAW SPRITE GROUP ONTO A FRAME TARGET
+    def draw_group(self, group, target):
+        if self.counting:
+            for sprite in group.sprites():
+                self.count_blit(sprite.image)
+        return group.draw(target)
+
+    # ROLL PER-FRAME COUNTERS
+    def begin_frame(self):
+        self.check_display()
+        self.last_frame_unconverted = self.unconverted_blits
+        self.unconverted_blits = 0
+        self.last_frame_blits = self.blit_count
+        self.blit_count = 0
+
+# SHARED SURFACE FACTORY
+SURFACES = SurfaceFactory()
+
 # TEXT WRAPPING UTILITY
 def wrap_text(font: pygame.font.Font, text: str, max_width: int) -> List[str]:
+    return list(TEXT_CACHE.wrap(font, text, max_width))
+
+# UNCACHED TEXT WRAPPING
+def _wrap_text_uncached(font: pygame.font.Font, text: str, max_width: int) -> List[str]:
     words = text.split(' ')
     lines = []
     if not words:
@@ -151,6 +961,76 @@ def wrap_text(font: pygame.font.Font, text: str, max_width: int) -> List[str]:
     lines.append(current_line)
     return lines
 
+# TEXT MARKUP STRIPPER
+def strip_markup(text: str) -> str:
+    return text.replace('**', '')
+
+# TEXT CACHE SIZE
+TEXT_CACHE_SIZE = 512
+TEXT_LAYOUT_CACHE_SIZE = 128
+
+# TEXT RENDER CACHE CLASS
+class TextCache:
+    # TEXT CACHE INIT
+    def __init__(self, max_surfaces: int = TEXT_CACHE_SIZE, max_layouts: int = TEXT_LAYOUT_CACHE_SIZE):
+        self.max_surfaces = max(1, int(max_surfaces))
+        self.max_layouts = max(1, int(max_layouts))
+        self._surfaces = OrderedDict()
+        self._layouts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # CLEAR CACHE
+    def clear(self):
+        self._surfaces.clear()
+        self._layouts.clear()
+
+    # RECONVERT CACHED SURFACES
+    def reconvert(self):
+        for key, surf in list(self._surfaces.items()):
+            self._surfaces[key] = SURFACES.prepare(surf)
+
+    # RENDERED SURFACE LOOKUP
+    def render(self, font, text: str, color, antialias: bool = True):
+        key = (font, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = SURFACES.prepare(font.render(text, antialias, color))
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    # WRAPPED LAYOUT LOOKUP
+    def wrap(self, font, text: str, max_width: int, markup: bool = False):
+        key = (font, text, int(max_width), markup)
+        lines = self._layouts.get(key)
+        if lines is not None:
+            self._layouts.move_to_end(key)
+            return lines
+        source = strip_markup(text) if markup else text
+        lines = tuple(_wrap_text_uncached(font, source, max_width))
+        self._layouts[key] = lines
+        if len(self._layouts) > self.max_layouts:
+            self._layouts.popitem(last=False)
+        return lines
+
+    # WRAPPED LINE SURFACES
+    def render_lines(self, font, text: str, color, max_width: int, markup: bool = False):
+        return [self.render(font, line, color) for line in self.wrap(font, text, max_width, markup=markup)]
+
+# SHARED TEXT CACHE
+TEXT_CACHE = TextCache()
+SURFACES.register_hook(TEXT_CACHE.reconvert)
+
+# CACHED TEXT RENDERER
+def render_text(font, text: str, color):
+    return TEXT_CACHE.render(font, text, color)
+
 # ROUNDED BOX DRAWING
 def draw_rounded_box(surface: pygame.Surface, rect: pygame.Rect,
                      fill_color: Optional[tuple] = None,
@@ -170,34 +1050,1093 @@ def draw_rounded_box(surface: pygame.Surface, rect: pygame.Rect,
         except Exception:
             pygame.draw.rect(surface, border_color, rect, bt)
 
-# BUTTON RENDERER
-def draw_button(surface, text, rect, color, text_color, font, locked=False, hover=False):
+# BUTTON SKIN CACHE
+BUTTON_SKIN_CACHE_SIZE = 64
+_button_skin_cache = OrderedDict()
+SURFACES.register_hook(_button_skin_cache.clear)
+
+# BUTTON SKIN RENDERER
+def create_button_skin(size, text, color, text_color, font, locked=False, hover=False):
+    width, height = size
     base_color = DARK_GRAY if locked else color
 
     if hover and not locked:
         base_color = tuple(min(255, int(c * 1.08 + 8)) for c in base_color)
 
-    border_thickness = max(2, min(6, rect.height // 12))
-    radius = max(8, rect.height // 3)
+    border_thickness = max(2, min(6, height // 12))
+    radius = max(8, height // 3)
 
-    shadow = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    shadow.fill((0, 0, 0, 0))
+    skin = SURFACES.new((width, height))
+    skin.fill((0, 0, 0, 0))
 
     try:
-        pygame.draw.rect(shadow, (0, 0, 0, 60), (4, 4, rect.width - 4, rect.height - 4), 0, border_radius=radius)
+        pygame.draw.rect(skin, (0, 0, 0, 60), (4, 4, width - 4, height - 4), 0, border_radius=radius)
     except TypeError:
-        pygame.draw.rect(shadow, (0, 0, 0, 60), (4, 4, rect.width - 4, rect.height - 4))
-
-    surface.blit(shadow, rect.topleft)
+        pygame.draw.rect(skin, (0, 0, 0, 60), (4, 4, width - 4, height - 4))
 
-    draw_rounded_box(surface, rect, fill_color=base_color,
+    draw_rounded_box(skin, pygame.Rect(0, 0, width, height), fill_color=base_color,
                      border_color=CARNIVAL_YELLOW if not locked else BLACK,
                      border_thickness=border_thickness, radius=radius)
 
     text_surface = font.render(text, True, text_color)
-    text_rect = text_surface.get_rect(center=(rect.left + rect.width // 2, rect.top + rect.height // 2))
+    text_rect = text_surface.get_rect(center=(width // 2, height // 2))
+
+    skin.blit(text_surface, text_rect)
+    return skin
+
+# BUTTON SKIN CACHER
+def get_button_skin(size, text, color, text_color, font, locked=False, hover=False):
+    key = (tuple(size), text, tuple(color), tuple(text_color), font, bool(locked), bool(hover))
+    skin = _button_skin_cache.get(key)
+    if skin is not None:
+        _button_skin_cache.move_to_end(key)
+        return skin
+    skin = create_button_skin(size, text, color, text_color, font, locked=locked, hover=hover)
+    _button_skin_cache[key] = skin
+    if len(_button_skin_cache) > BUTTON_SKIN_CACHE_SIZE:
+        _button_skin_cache.popitem(last=False)
+    return skin
+
+# BUTTON RENDERER
+def draw_button(surface, text, rect, color, text_color, font, locked=False, hover=False):
+    skin = get_button_skin(rect.size, text, color, text_color, font, locked=locked, hover=hover)
+    return SURFACES.blit(surface, skin, rect.topleft)
+
+# DIRTY RECT RENDERING
+DIRTY_RECT_RENDERING = os.environ.get("ARCADE_DIRTY_RECTS", "0") == "1"
+DIRTY_RECT_FULL_RATIO = 0.6
+
+# CIRCLE BOUNDS HELPER
+def circle_rect(center, radius: int) -> pygame.Rect:
+    r = int(radius) + 1
+    return pygame.Rect(int(center[0]) - r, int(center[1]) - r, r * 2, r * 2)
+
+# DIRTY REGION TRACKER CLASS
+class DirtyRegionTracker:
+    # TRACKER INIT
+    def __init__(self, bounds=None):
+        self.bounds = pygame.Rect(bounds) if bounds is not None else pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self._previous = {}
+        self._pending = []
+        self._full = True
+
+    # FORCE FULL REPAINT
+    def invalidate(self):
+        self._full = True
+        self._previous.clear()
+        self._pending = []
+
+    # ADD RAW REGION
+    def add(self, rect):
+        r = pygame.Rect(rect).clip(self.bounds)
+        if r.width > 0 and r.height > 0:
+            self._pending.append(r)
+
+    # TRACK KEYED REGION
+    def mark(self, key, rect, state=None):
+        rect = pygame.Rect(rect)
+        prev = self._previous.get(key)
+        if prev is not None and prev[0] == rect and prev[1] == state:
+            return
+        if prev is not None:
+            self.add(prev[0])
+        self.add(rect)
+        self._previous[key] = (rect, state)
+
+    # FORGET KEYED REGION
+    def forget(self, key):
+        prev = self._previous.pop(key, None)
+        if prev is not None:
+            self.add(prev[0])
+
+    # COLLECT FRAME REGIONS (None MEANS FULL FLIP)
+    def collect(self):
+        rects = self._pending
+        self._pending = []
+        if self._full:
+            self._full = False
+            return None
+        if not rects:
+            return []
+        area = sum(r.width * r.height for r in rects)
+        if area >= self.bounds.width * self.bounds.height * DIRTY_RECT_FULL_RATIO:
+            return None
+        return rects
+
+# STATIC LAYER CACHE CLASS
+class StaticLayer:
+    # LAYER INIT
+    def __init__(self, builder, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.builder = builder
+        self.size = size
+        self.surface = None
+        self.key = None
+        SURFACES.register_hook(self.invalidate)
+
+    # DROP CACHED SURFACE
+    def invalidate(self):
+        self.surface = None
+        self.key = None
+
+    # GET (REBUILD ON KEY CHANGE)
+    def get(self, key=None):
+        if self.surface is None or key != self.key:
+            surf = SURFACES.new(self.size, alpha=False)
+            self.builder(surf)
+            self.surface = surf
+            self.key = key
+        return self.surface
+
+    # BLIT LAYER
+    def blit(self, target, key=None, dest=(0, 0)):
+        return SURFACES.blit(target, self.get(key), dest)
+
+# PARTICLE ENGINE CONSTANTS
+PARTICLE_ALPHA_LEVELS = 16
+
+# PARTICLE ENGINE CLASS (STRUCTURE OF ARRAYS)
+class ParticleSystem:
+    _sprite_cache = {}
+
+    # PARTICLE SYSTEM INIT
+    def __init__(self, capacity: int = 300, gravity: float = 0.0, sway_speed: float = 0.0, sway_scale: float = 30.0):
+        self.capacity = max(1, int(capacity))
+        self.gravity = float(gravity)
+        self.sway_speed = float(sway_speed)
+        self.sway_scale = float(sway_scale)
+        self.count = 0
+        self.palette = []
+        self._palette_index = {}
+        self.clock = 0.0
+        if _HAVE_NUMPY:
+            self.x = np.zeros(self.capacity, dtype=np.float32)
+            self.y = np.zeros(self.capacity, dtype=np.float32)
+            self.vx = np.zeros(self.capacity, dtype=np.float32)
+            self.vy = np.zeros(self.capacity, dtype=np.float32)
+            self.age = np.zeros(self.capacity, dtype=np.float32)
+            self.life = np.ones(self.capacity, dtype=np.float32)
+            self.phase = np.zeros(self.capacity, dtype=np.float32)
+            self.sway_amp = np.zeros(self.capacity, dtype=np.float32)
+            self.size = np.zeros(self.capacity, dtype=np.int16)
+            self.color = np.zeros(self.capacity, dtype=np.uint8)
+        else:
+            self.x = [0.0] * self.capacity
+            self.y = [0.0] * self.capacity
+            self.vx = [0.0] * self.capacity
+            self.vy = [0.0] * self.capacity
+            self.age = [0.0] * self.capacity
+            self.life = [1.0] * self.capacity
+            self.phase = [0.0] * self.capacity
+            self.sway_amp = [0.0] * self.capacity
+            self.size = [0] * self.capacity
+            self.color = [0] * self.capacity
+        self._columns = (self.x, self.y, self.vx, self.vy, self.age, self.life, self.phase, self.sway_amp, self.size, self.color)
+
+    # PALETTE INDEX LOOKUP
+    def _color_index(self, color) -> int:
+        color = tuple(int(c) for c in color[:3])
+        idx = self._palette_index.get(color)
+        if idx is None:
+            if len(self.palette) >= 256:
+                return 0
+            idx = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = idx
+        return idx
+
+    # FREE SLOT (REUSES THE OLDEST WHEN FULL)
+    def _slot(self) -> int:
+        if self.count < self.capacity:
+            self.count += 1
+            return self.count - 1
+        if _HAVE_NUMPY:
+            return int(np.argmax(self.age / self.life))
+        return max(range(self.capacity), key=lambda i: self.age[i] / self.life[i])
+
+    # EMIT ONE PARTICLE
+    def emit(self, x, y, vx=0.0, vy=0.0, life=1.0, size=3, color=OG_WATER_CYAN, phase=0.0, sway_amp=0.0):
+        i = self._slot()
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.age[i] = 0.0
+        self.life[i] = max(1e-3, float(life))
+        self.phase[i] = phase
+        self.sway_amp[i] = sway_amp
+        self.size[i] = max(1, int(size))
+        self.color[i] = self._color_index(color)
+
+    # EMIT RADIAL BURST
+    def emit_burst(self, x, y, amount, colors, speed=(80.0, 260.0), life=(0.5, 1.1), size=(2, 4), lift=0.0):
+        for _ in range(int(amount)):
+            angle = random.uniform(0.0, 2.0 * math.pi)
+            spd = random.uniform(*speed)
+            self.emit(
+                x, y,
+                vx=math.cos(angle) * spd,
+                vy=math.sin(angle) * spd - lift,
+                life=random.uniform(*life),
+                size=random.randint(*size),
+                color=random.choice(colors),
+            )
+
+    # CLEAR ALL PARTICLES
+    def clear(self):
+        self.count = 0
+
+    # STEP SIMULATION
+    def update(self, dt):
+        self.clock += dt
+        n = self.count
+        if n == 0:
+            return
+        if _HAVE_NUMPY:
+            self.age[:n] += dt
+            self.vy[:n] += self.gravity * dt
+            self.x[:n] += self.vx[:n] * dt
+            self.y[:n] += self.vy[:n] * dt
+            if self.sway_speed:
+                self.x[:n] += np.sin(self.clock * self.sway_speed + self.phase[:n]) * self.sway_amp[:n] * (dt * self.sway_scale)
+            alive = self.age[:n] < self.life[:n]
+            k = int(np.count_nonzero(alive))
+            if k < n:
+                holes = np.flatnonzero(~alive[:k])
+                movers = np.flatnonzero(alive[k:n]) + k
+                for col in self._columns:
+                    col[holes] = col[movers]
+                self.count = k
+            return
+        i = 0
+        while i < self.count:
+            self.age[i] += dt
+            if self.age[i] >= self.life[i]:
+                last = self.count - 1
+                for col in self._columns:
+                    col[i] = col[last]
+                self.count = last
+                continue
+            self.vy[i] += self.gravity * dt
+            self.x[i] += self.vx[i] * dt
+            self.y[i] += self.vy[i] * dt
+            if self.sway_speed:
+                self.x[i] += math.sin(self.clock * self.sway_speed + self.phase[i]) * self.sway_amp[i] * (dt * self.sway_scale)
+            i += 1
+
+    # CACHED PARTICLE SPRITE
+    @classmethod
+    def _sprite(cls, size, color, level):
+        key = (size, color, level)
+        surf = cls._sprite_cache.get(key)
+        if surf is None:
+            alpha = int(255 * (level + 1) / PARTICLE_ALPHA_LEVELS)
+            surf = SURFACES.new((size * 2 + 1, size * 2 + 1))
+            pygame.draw.circle(surf, (color[0], color[1], color[2], alpha), (size, size), size)
+            cls._sprite_cache[key] = surf
+        return surf
+
+    # BATCHED DRAW
+    def draw(self, surface):
+        n = self.count
+        if n == 0:
+            return
+        if _HAVE_NUMPY:
+            levels = ((1.0 - self.age[:n] / self.life[:n]) * (PARTICLE_ALPHA_LEVELS - 1)).astype(np.int16).tolist()
+            xs = self.x[:n].astype(np.int32).tolist()
+            ys = self.y[:n].astype(np.int32).tolist()
+            sizes = self.size[:n].tolist()
+            colors = self.color[:n].tolist()
+        else:
+            levels = [int((1.0 - self.age[i] / self.life[i]) * (PARTICLE_ALPHA_LEVELS - 1)) for i in range(n)]
+            xs = [int(v) for v in self.x[:n]]
+            ys = [int(v) for v in self.y[:n]]
+            sizes = self.size[:n]
+            colors = self.color[:n]
+        palette = self.palette
+        sprite = self._sprite
+        SURFACES.blits(
+            surface,
+            [(sprite(sz, palette[c], lv), (px - sz, py - sz)) for px, py, sz, c, lv in zip(xs, ys, sizes, colors, levels)],
+            doreturn=False,
+        )
+
+    # BOUNDING RECT OF LIVE PARTICLES
+    def bounds(self) -> Optional[pygame.Rect]:
+        n = self.count
+        if n == 0:
+            return None
+        if _HAVE_NUMPY:
+            pad = int(self.size[:n].max()) + 1
+            left = int(self.x[:n].min()) - pad
+            top = int(self.y[:n].min()) - pad
+            right = int(self.x[:n].max()) + pad
+            bottom = int(self.y[:n].max()) + pad
+        else:
+            pad = max(self.size[:n]) + 1
+            left = int(min(self.x[:n])) - pad
+            top = int(min(self.y[:n])) - pad
+            right = int(max(self.x[:n])) + pad
+            bottom = int(max(self.y[:n])) + pad
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+SURFACES.register_hook(ParticleSystem._sprite_cache.clear)
+
+# SPRITE BAKER CACHE SIZE
+SPRITE_CACHE_SIZE = 256
+
+# SPRITE BAKING SERVICE CLASS
+class SpriteBaker:
+    # BAKER INIT
+    def __init__(self, max_entries: int = SPRITE_CACHE_SIZE):
+        self.max_entries = max(1, int(max_entries))
+        self._sprites = OrderedDict()
+
+    # GET OR BAKE SPRITE
+    def get(self, key, builder):
+        surf = self._sprites.get(key)
+        if surf is not None:
+            self._sprites.move_to_end(key)
+            return surf
+        surf = SURFACES.prepare(builder())
+        self._sprites[key] = surf
+        if len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+        return surf
+
+    # CLEAR BAKED SPRITES
+    def clear(self):
+        self._sprites.clear()
+
+    # RECONVERT BAKED SPRITES
+    def reconvert(self):
+        for key, surf in list(self._sprites.items()):
+            self._sprites[key] = SURFACES.prepare(surf)
+
+# SHARED SPRITE BAKER
+SPRITE_BAKER = SpriteBaker()
+SURFACES.register_hook(SPRITE_BAKER.reconvert)
+
+# POST-PROCESSING COLOUR MATRICES
+GRAYSCALE_MATRIX = ((0.299, 0.587, 0.114), (0.299, 0.587, 0.114), (0.299, 0.587, 0.114))
+PROTANOPIA_MATRIX = ((0.567, 0.433, 0.0), (0.558, 0.442, 0.0), (0.0, 0.242, 0.758))
+DEUTERANOPIA_MATRIX = ((0.625, 0.375, 0.0), (0.70, 0.30, 0.0), (0.0, 0.30, 0.70))
+TRITANOPIA_MATRIX = ((0.95, 0.05, 0.0), (0.0, 0.433, 0.567), (0.0, 0.475, 0.525))
+COLORBLIND_MATRICES = {
+    "protanopia": PROTANOPIA_MATRIX,
+    "deuteranopia": DEUTERANOPIA_MATRIX,
+    "tritanopia": TRITANOPIA_MATRIX,
+}
+COLORBLIND_MODES = (None, "protanopia", "deuteranopia", "tritanopia")
+DEFAULT_COLORBLIND_MODE = os.environ.get("ARCADE_COLORBLIND", "").lower() or None
+if DEFAULT_COLORBLIND_MODE not in COLORBLIND_MATRICES:
+    DEFAULT_COLORBLIND_MODE = None
+DEFAULT_SCANLINES = os.environ.get("ARCADE_SCANLINES", "0") == "1"
+POST_PROCESS_BAND_ROWS = 32
+
+# MATRIX PRODUCT HELPER
+def _matmul3(a, b):
+    return tuple(tuple(sum(a[i][k] * b[k][j] for k in range(3)) for j in range(3)) for i in range(3))
+
+# COLOUR MATRIX FILTER CLASS
+class ColorMatrixFilter:
+    # FILTER INIT
+    def __init__(self, name: str, matrix):
+        self.name = name
+        self.matrix = tuple(tuple(float(v) for v in row) for row in matrix)
+
+    # FUSE WITH A FOLLOWING MATRIX FILTER
+    def then(self, other):
+        return ColorMatrixFilter(f"{self.name}+{other.name}", _matmul3(other.matrix, self.matrix))
+
+    # IS IDENTITY AT 8-BIT FIXED POINT
+    def is_identity(self) -> bool:
+        return all(int(round(v * 256)) == (256 if i == j else 0)
+                   for i, row in enumerate(self.matrix) for j, v in enumerate(row))
+
+    # IS GRAYSCALE
+    def is_grayscale(self) -> bool:
+        return self.matrix[0] == self.matrix[1] == self.matrix[2]
+
+    # SURFACE PATH AVAILABLE WITHOUT NUMPY
+    def surface_supported(self) -> bool:
+        return self.is_grayscale() and hasattr(pygame.transform, 'grayscale')
+
+    # IN-PLACE ARRAY PATH
+    def apply_array(self, view, scratch, top: int = 0):
+        weights = [[int(round(v * 256)) for v in row] for row in self.matrix]
+        acc = scratch.buffer('acc', view.shape[:2], np.uint16)
+        tmp = scratch.buffer('tmp', view.shape[:2], np.uint16)
+        if self.is_grayscale():
+            np.multiply(view[..., 0], weights[0][0], out=acc, dtype=np.uint16)
+            for c in (1, 2):
+                np.multiply(view[..., c], weights[0][c], out=tmp, dtype=np.uint16)
+                acc += tmp
+            acc >>= 8
+            view[..., 0] = acc
+            view[..., 1] = acc
+            view[..., 2] = acc
+            return
+        outs = []
+        for row_index, row in enumerate(weights):
+            out = scratch.buffer(f'out{row_index}', view.shape[:2], np.uint16)
+            np.multiply(view[..., 0], row[0], out=out, dtype=np.uint16)
+            for c in (1, 2):
+                np.multiply(view[..., c], row[c], out=tmp, dtype=np.uint16)
+                out += tmp
+            out >>= 8
+            np.minimum(out, 255, out=out)
+            outs.append(out)
+        for c in range(3):
+            view[..., c] = outs[c]
+
+    # SURFACE FALLBACK PATH
+    def apply_surface(self, surf) -> bool:
+        if self.surface_supported():
+            surf.blit(pygame.transform.grayscale(surf), (0, 0))
+            return True
+        return False
+
+# SCANLINE FILTER CLASS
+class ScanlineFilter:
+    # FILTER INIT
+    def __init__(self, strength: float = 0.7, spacing: int = 2):
+        self.name = "scanlines"
+        self.strength = max(0.0, min(1.0, float(strength)))
+        self.spacing = max(2, int(spacing))
+        self._lut = None
+        self._overlay = None
+
+    # SURFACE PATH AVAILABLE WITHOUT NUMPY
+    def surface_supported(self) -> bool:
+        return True
+
+    # IN-PLACE ARRAY PATH (TOP IS THE BAND'S FIRST SCREEN ROW)
+    def apply_array(self, view, scratch, top: int = 0):
+        if self._lut is None:
+            self._lut = (np.arange(256) * self.strength).astype(np.uint8)
+        rows = view[:, (1 - top) % self.spacing::self.spacing]
+        out = scratch.buffer('scanlines', rows.shape, np.uint8)
+        np.take(self._lut, rows, out=out)
+        rows[...] = out
+
+    # SURFACE FALLBACK PATH
+    def apply_surface(self, surf) -> bool:
+        size = surf.get_size()
+        if self._overlay is None or self._overlay.get_size() != size:
+            overlay = SURFACES.new(size, alpha=False)
+            overlay.fill(WHITE)
+            shade = int(255 * self.strength)
+            for y in range(1, size[1], self.spacing):
+                pygame.draw.line(overlay, (shade, shade, shade), (0, y), (size[0] - 1, y))
+            self._overlay = overlay
+        surf.blit(self._overlay, (0, 0), special_flags=pygame.BLEND_MULT)
+        return True
+
+# POST-PROCESS SCRATCH BUFFERS
+class _ScratchBuffers:
+    # SCRATCH INIT
+    def __init__(self):
+        self._buffers = {}
+
+    # GET PREALLOCATED BUFFER (LEADING SLICE OF THE LARGEST SHAPE SEEN)
+    def buffer(self, name, shape, dtype):
+        shape = tuple(shape)
+        buf = self._buffers.get(name)
+        if buf is None or buf.dtype != dtype or buf.ndim != len(shape) or any(n > m for n, m in zip(shape, buf.shape)):
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buf
+        if buf.shape == shape:
+            return buf
+        return buf[tuple(slice(0, n) for n in shape)]
+
+# POST-PROCESS PIPELINE CLASS
+class PostProcessPipeline:
+    # PIPELINE INIT
+    def __init__(self):
+        self.filters = []
+        self.unavailable = ()
+        self._stages = []
+        self._scratch = _ScratchBuffers() if _HAVE_NUMPY else None
+
+    # SET ORDERED FILTERS
+    def set_filters(self, filters):
+        self.filters = list(filters)
+        if _HAVE_NUMPY:
+            self.unavailable = ()
+        else:
+            self.unavailable = tuple(f.name for f in self.filters if not f.surface_supported())
+        stages = []
+        for f in self.filters:
+            if stages and isinstance(f, ColorMatrixFilter) and isinstance(stages[-1], ColorMatrixFilter):
+                stages[-1] = stages[-1].then(f)
+            else:
+                stages.append(f)
+        self._stages = [st for st in stages if not (isinstance(st, ColorMatrixFilter) and st.is_identity())]
+
+    # FILTER USABLE ON THIS INSTALL
+    def available(self, name: str) -> bool:
+        return name not in self.unavailable
+
+    # MERGE ROW SPANS INTO SORTED DISJOINT RANGES
+    @staticmethod
+    def _row_spans(rows, height: int):
+        if rows is None:
+            return [(0, height)]
+        spans = []
+        for top, bottom in sorted((max(0, t), min(height, b)) for t, b in rows):
+            if bottom <= top:
+                continue
+            if spans and top <= spans[-1][1]:
+                spans[-1] = (spans[-1][0], max(spans[-1][1], bottom))
+            else:
+                spans.append((top, bottom))
+        return spans
+
+    # APPLY ALL FILTERS IN PLACE (ONE PASS, EVERY STAGE PER ROW BAND, OPTIONALLY ONLY GIVEN ROWS)
+    def apply(self, surf, use_numpy: Optional[bool] = None, rows=None):
+        if not self._stages:
+            return
+        if use_numpy is None:
+            use_numpy = _HAVE_NUMPY
+        if use_numpy and _HAVE_NUMPY:
+            try:
+                view = pygame.surfarray.pixels3d(surf)
+            except Exception:
+                view = None
+            if view is not None:
+                try:
+                    for start, stop in self._row_spans(rows, view.shape[1]):
+                        for top in range(start, stop, POST_PROCESS_BAND_ROWS):
+                            band = view[:, top:min(stop, top + POST_PROCESS_BAND_ROWS)]
+                            for stage in self._stages:
+                                stage.apply_array(band, self._scratch, top)
+                finally:
+                    del view
+                return
+        for f in self.filters:
+            if not f.surface_supported():
+                continue
+            try:
+                f.apply_surface(surf)
+            except Exception:
+                pass
+
+# FIXED TIMESTEP SETTINGS
+FIXED_TIMESTEP = os.environ.get("ARCADE_FIXED_TIMESTEP", "0") == "1"
+SIMULATION_HZ = 120
+MAX_CATCHUP_STEPS = 5
+MAX_FRAME_TIME = 0.25
+
+# LERP HELPER (NUMBERS AND NUMERIC TUPLES)
+def _lerp_value(a, b, alpha: float):
+    if isinstance(b, tuple):
+        if not isinstance(a, tuple) or len(a) != len(b):
+            return b
+        return tuple(_lerp_value(x, y, alpha) for x, y in zip(a, b))
+    if isinstance(b, bool) or not isinstance(b, (int, float)) or not isinstance(a, (int, float)):
+        return b
+    value = a + (b - a) * alpha
+    return int(round(value)) if isinstance(b, int) else value
+
+# RENDER INTERPOLATION CLASS
+class RenderInterpolator:
+    # INTERPOLATOR INIT
+    def __init__(self):
+        self._previous = {}
+        self._restore = []
+
+    # READ TARGET VALUES
+    @staticmethod
+    def _snapshot(targets):
+        values = {}
+        for owner, attr in targets:
+            try:
+                value = getattr(owner, attr)
+            except Exception:
+                continue
+            values[(id(owner), attr)] = (owner, attr, tuple(value) if isinstance(value, list) else value)
+        return values
+
+    # FORGET PREVIOUS STATE
+    def reset(self):
+        self._previous = {}
+
+    # CAPTURE STATE BEFORE A STEP
+    def capture(self, targets):
+        self._previous = self._snapshot(targets)
+
+    # APPLY BLENDED STATE FOR RENDERING
+    def apply(self, targets, alpha: float):
+        self._restore = []
+        if not self._previous:
+            return
+        alpha = max(0.0, min(1.0, alpha))
+        for key, (owner, attr, current) in self._snapshot(targets).items():
+            prev = self._previous.get(key)
+            if prev is None or prev[0] is not owner:
+                continue
+            blended = _lerp_value(prev[2], current, alpha)
+            if blended == current:
+                continue
+            try:
+                setattr(owner, attr, blended)
+                self._restore.append((owner, attr, current))
+            except Exception:
+                pass
 
-    surface.blit(text_surface, text_rect)
+    # RESTORE SIMULATION STATE AFTER RENDERING
+    def restore(self):
+        for owner, attr, value in reversed(self._restore):
+            try:
+                setattr(owner, attr, value)
+            except Exception:
+                pass
+        self._restore = []
+
+# FRAME SCHEDULER SETTINGS
+FRAME_SPIN_MARGIN_MS = float(os.environ.get("ARCADE_SPIN_MARGIN_MS", "2.0"))
+FRAME_VSYNC = os.environ.get("ARCADE_VSYNC", "0") == "1"
+FRAME_PACING_LOG = os.environ.get("ARCADE_PACING_LOG", "")
+FRAME_LATENESS_BUCKETS_US = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+FRAME_HISTORY = 120
+
+# HIGH-PRECISION FRAME SCHEDULER CLASS
+class FrameScheduler:
+    # SCHEDULER INIT
+    def __init__(self, spin_margin_ms: float = FRAME_SPIN_MARGIN_MS, vsync: bool = False):
+        self.spin_margin_ns = max(0, int(spin_margin_ms * 1_000_000))
+        self.vsync = bool(vsync)
+        self._deadline = None
+        self._period_ns = 0
+        self._last_ns = None
+        self._frame_times = []
+        self.buckets = FRAME_LATENESS_BUCKETS_US
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.frames = 0
+        self.missed = 0
+        self.lateness_total_ns = 0
+        self.lateness_max_ns = 0
+
+    # WAIT FOR NEXT DEADLINE (pygame.time.Clock COMPATIBLE)
+    def tick(self, framerate: float = 0) -> int:
+        period_ns = int(1_000_000_000 / framerate) if framerate and framerate > 0 else 0
+        if period_ns != self._period_ns:
+            self._period_ns = period_ns
+            self._deadline = None
+        now = time.perf_counter_ns()
+        if period_ns:
+            if self._deadline is None:
+                self._deadline = now
+            if not self.vsync:
+                now = self._wait_until(self._deadline)
+            lateness = now - self._deadline
+            self._record(lateness)
+            if lateness > period_ns:
+                self.missed += 1
+                self._deadline = now + period_ns
+            else:
+                self._deadline += period_ns
+        elapsed = 0 if self._last_ns is None else now - self._last_ns
+        self._last_ns = now
+        if elapsed:
+            self._frame_times.append(elapsed)
+            if len(self._frame_times) > FRAME_HISTORY:
+                del self._frame_times[0]
+        return elapsed // 1_000_000
+
+    # DROP DEADLINE AFTER AN IDLE GAP
+    def resync(self):
+        self._deadline = None
+        self._last_ns = None
+
+    # SLEEP THEN SPIN UNTIL DEADLINE
+    def _wait_until(self, deadline: int) -> int:
+        now = time.perf_counter_ns()
+        remaining = deadline - now - self.spin_margin_ns
+        if remaining > 0:
+            time.sleep(remaining / 1_000_000_000)
+        now = time.perf_counter_ns()
+        while now < deadline:
+            now = time.perf_counter_ns()
+        return now
+
+    # RECORD LATENESS SAMPLE
+    def _record(self, lateness_ns: int):
+        lateness_ns = max(0, lateness_ns)
+        lateness_us = lateness_ns // 1000
+        idx = len(self.buckets)
+        for i, edge in enumerate(self.buckets):
+            if lateness_us < edge:
+                idx = i
+                break
+        self.counts[idx] += 1
+        self.frames += 1
+        self.lateness_total_ns += lateness_ns
+        if lateness_ns > self.lateness_max_ns:
+            self.lateness_max_ns = lateness_ns
+
+    # AVERAGE FPS OVER RECENT FRAMES
+    def get_fps(self) -> float:
+        if not self._frame_times:
+            return 0.0
+        return 1_000_000_000 * len(self._frame_times) / sum(self._frame_times)
+
+    # CLEAR STATISTICS
+    def reset_stats(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.frames = 0
+        self.missed = 0
+        self.lateness_total_ns = 0
+        self.lateness_max_ns = 0
+
+    # LATENESS HISTOGRAM
+    def histogram(self):
+        labels = [f"<{edge}us" for edge in self.buckets] + [f">={self.buckets[-1]}us"]
+        return list(zip(labels, self.counts))
+
+    # LATENESS PERCENTILE (BUCKET UPPER EDGE, MICROSECONDS)
+    def percentile(self, pct: float) -> Optional[int]:
+        if self.frames == 0:
+            return None
+        target = self.frames * pct / 100.0
+        running = 0
+        for i, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                return self.buckets[i] if i < len(self.buckets) else self.lateness_max_ns // 1000
+        return self.lateness_max_ns // 1000
+
+    # PACING SUMMARY
+    def summary(self) -> dict:
+        return {
+            'frames': self.frames,
+            'missed': self.missed,
+            'vsync': self.vsync,
+            'spin_margin_ms': self.spin_margin_ns / 1_000_000,
+            'mean_lateness_us': (self.lateness_total_ns // self.frames // 1000) if self.frames else 0,
+            'max_lateness_us': self.lateness_max_ns // 1000,
+            'p95_lateness_us': self.percentile(95),
+            'p99_lateness_us': self.percentile(99),
+            'histogram': dict(self.histogram()),
+        }
+
+# FRAME PROFILER SETTINGS
+PROFILER_ENABLED = os.environ.get("ARCADE_PROFILER", "0") == "1"
+PROFILER_PHASES = ('input', 'update', 'draw', 'modal', 'post', 'present')
+PROFILER_HISTORY = 240
+PROFILER_REFRESH_FRAMES = 15
+PROFILER_SAMPLE_FRAMES = 60
+PROFILER_DRAW_FUNCS = ('rect', 'circle', 'ellipse', 'arc', 'line', 'lines', 'aaline', 'aalines', 'polygon')
+
+# PYGAME.DRAW CALL COUNTER CLASS
+class DrawCallCounter:
+    # COUNTER INIT
+    def __init__(self):
+        self.count = 0
+        self._originals = {}
+
+    # WRAP ONE DRAW FUNCTION
+    def _wrap(self, func):
+        def counted(*args, **kwargs):
+            self.count += 1
+            return func(*args, **kwargs)
+        return counted
+
+    # PATCH pygame.draw
+    def install(self):
+        if self._originals:
+            return
+        for name in PROFILER_DRAW_FUNCS:
+            func = getattr(pygame.draw, name, None)
+            if func is not None:
+                self._originals[name] = func
+                setattr(pygame.draw, name, self._wrap(func))
+
+    # RESTORE pygame.draw
+    def uninstall(self):
+        for name, func in self._originals.items():
+            setattr(pygame.draw, name, func)
+        self._originals = {}
+
+    # READ AND RESET
+    def take(self) -> int:
+        count = self.count
+        self.count = 0
+        return count
+
+# PER-PHASE FRAME PROFILER CLASS
+class FrameProfiler:
+    # PROFILER INIT
+    def __init__(self, phases=PROFILER_PHASES, history: int = PROFILER_HISTORY):
+        self.phases = tuple(phases)
+        self.samples = {phase: deque(maxlen=history) for phase in self.phases}
+        self.frame_samples = deque(maxlen=history)
+        self.draw_calls = deque(maxlen=history)
+        self.blits = deque(maxlen=history)
+        self.draw_counter = DrawCallCounter()
+        self._current = dict.fromkeys(self.phases, 0)
+        self._frame_start = 0
+        self._cursor = 0
+        self._frames_since_render = PROFILER_REFRESH_FRAMES
+        self._overlay = None
+        self.frames = 0
+        self.sampling = False
+
+    # START FRAME (EVERY PROFILER_SAMPLE_FRAMES-TH FRAME COUNTS DRAWS AND BLITS)
+    def begin_frame(self):
+        self.sampling = self.frames % PROFILER_SAMPLE_FRAMES == 0
+        self._frame_start = self._cursor = time.perf_counter_ns()
+        for phase in self.phases:
+            self._current[phase] = 0
+
+    # CLOSE CURRENT PHASE
+    def mark(self, phase: str):
+        now = time.perf_counter_ns()
+        if phase in self._current:
+            self._current[phase] += now - self._cursor
+        self._cursor = now
+
+    # FINISH FRAME (SAMPLED FRAMES RECORD COUNTS, OTHERS RECORD TIMINGS)
+    def end_frame(self, blits: int = 0):
+        now = time.perf_counter_ns()
+        if self.sampling:
+            self.draw_calls.append(self.draw_counter.take())
+            self.blits.append(blits)
+            self.sampling = False
+        else:
+            for phase in self.phases:
+                self.samples[phase].append(self._current[phase])
+            self.frame_samples.append(now - self._frame_start)
+        self.frames += 1
+        self._frames_since_render += 1
+
+    # PHASE STATISTICS (MILLISECONDS)
+    @staticmethod
+    def _stats(samples):
+        if not samples:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(samples)
+        n = len(ordered)
+        avg = sum(ordered) / n
+        p95 = ordered[min(n - 1, int(n * 0.95))]
+        p99 = ordered[min(n - 1, int(n * 0.99))]
+        return avg / 1e6, p95 / 1e6, p99 / 1e6
+
+    # SUMMARY TABLE
+    def report(self) -> dict:
+        table = {phase: self._stats(self.samples[phase]) for phase in self.phases}
+        table['frame'] = self._stats(self.frame_samples)
+        return table
+
+    # OVERLAY SURFACE (REBUILT EVERY FEW FRAMES)
+    def overlay(self, font, budget_ms: float):
+        if self._overlay is not None and self._frames_since_render < PROFILER_REFRESH_FRAMES:
+            return self._overlay
+        self._frames_since_render = 0
+        line_h = font.get_linesize()
+        graph_h = 40
+        width = 250
+        rows = list(self.phases) + ['frame']
+        height = 8 + line_h * (len(rows) + 2) + graph_h + 8
+        surf = SURFACES.new((width, height))
+        surf.fill((0, 0, 0, 170))
+        columns = (6, 90, 140, 190)
+        y = 4
+        for x, label in zip(columns, ("PHASE (ms)", "AVG", "P95", "P99")):
+            surf.blit(font.render(label, True, CARNIVAL_YELLOW), (x, y))
+        y += line_h
+        for name, values in self.report().items():
+            color = CARNIVAL_RED if name == 'frame' and values[1] > budget_ms else UI_PLAYFUL
+            cells = [name] + [f"{v:.2f}" for v in values]
+            for x, cell in zip(columns, cells):
+                surf.blit(font.render(cell, True, color), (x, y))
+            y += line_h
+        calls = self.draw_calls[-1] if self.draw_calls else 0
+        blits = self.blits[-1] if self.blits else 0
+        surf.blit(font.render(f"draw calls {calls}  blits {blits}", True, WHITE), (6, y))
+        y += line_h + 4
+        graph = pygame.Rect(6, y, width - 12, graph_h)
+        pygame.draw.rect(surf, (40, 40, 40, 200), graph)
+        scale = graph_h / max(1.0, budget_ms * 2)
+        budget_y = graph.bottom - int(budget_ms * scale)
+        pygame.draw.line(surf, CARNIVAL_YELLOW, (graph.left, budget_y), (graph.right - 1, budget_y))
+        frames = list(self.frame_samples)[-graph.width:]
+        x = graph.right - len(frames)
+        for sample in frames:
+            ms = sample / 1e6
+            bar = min(graph_h, max(1, int(ms * scale)))
+            color = CARNIVAL_RED if ms > budget_ms else SPLASH_GREEN
+            pygame.draw.line(surf, color, (x, graph.bottom - 1), (x, graph.bottom - bar))
+            x += 1
+        self._overlay = surf
+        return surf
+
+# PROFILE CAPTURE SETTINGS
+PROFILE_CAPTURE_MODE = os.environ.get("ARCADE_PROFILE_CAPTURE", "")
+PROFILE_CAPTURE_FRAMES = int(os.environ.get("ARCADE_PROFILE_FRAMES", "300"))
+PROFILE_CAPTURE_DIR = os.environ.get("ARCADE_PROFILE_DIR", "profiles")
+PROFILE_SAMPLE_INTERVAL = 0.005
+
+# CODE OBJECT TO PSTATS KEY
+def _code_key(code):
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+# STACK SAMPLING THREAD CLASS
+class StackSampler:
+    # SAMPLER INIT
+    def __init__(self, thread_id: int, scene_getter, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.scene_getter = scene_getter
+        self.interval = max(0.001, float(interval))
+        self.samples = {}
+        self.total = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    # START SAMPLING
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="arcade-sampler", daemon=True)
+        self._thread.start()
+
+    # STOP SAMPLING
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    # SAMPLING LOOP
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_code_key(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            key = (self.scene_getter(), tuple(stack))
+            self.samples[key] = self.samples.get(key, 0) + 1
+            self.total += 1
+
+    # SAMPLES AS PSTATS DICT
+    def pstats_dict(self) -> dict:
+        stats = {}
+        seconds = self.interval
+        for (_scene, stack), count in self.samples.items():
+            weight = count * seconds
+            seen = set()
+            for depth, func in enumerate(stack):
+                cc, nc, tt, ct, callers = stats.get(func, (0, 0, 0.0, 0.0, {}))
+                if depth == len(stack) - 1:
+                    tt += weight
+                if func not in seen:
+                    ct += weight
+                    seen.add(func)
+                if depth > 0:
+                    caller = stack[depth - 1]
+                    e_cc, e_nc, e_tt, e_ct = callers.get(caller, (0, 0, 0.0, 0.0))
+                    callers[caller] = (e_cc + count, e_nc + count,
+                                       e_tt + (weight if depth == len(stack) - 1 else 0.0), e_ct + weight)
+                stats[func] = (cc + count, nc + count, tt, ct, callers)
+        return stats
+
+    # SAMPLES AS COLLAPSED STACKS
+    def collapsed_lines(self):
+        lines = []
+        for (scene, stack), count in sorted(self.samples.items(), key=lambda item: -item[1]):
+            frames = [scene] + [f"{name} ({os.path.basename(path)}:{line})" for path, line, name in stack]
+            lines.append(f"{';'.join(frames)} {count}")
+        return lines
+
+# PROFILE CAPTURE SESSION CLASS
+class ProfileCapture:
+    sequence = 0
+
+    # CAPTURE INIT
+    def __init__(self, mode: str, frames: int = PROFILE_CAPTURE_FRAMES, out_dir: str = PROFILE_CAPTURE_DIR):
+        self.mode = 'cprofile' if mode == 'cprofile' else 'sample'
+        self.frames_left = max(1, int(frames))
+        self.out_dir = out_dir
+        self.scene = None
+        self.scene_frames = {}
+        self.started = time.time()
+        self._profile = None
+        self._sampler = None
+
+    # BEGIN RECORDING
+    def start(self, scene: str):
+        self.scene = scene
+        if self.mode == 'cprofile':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = StackSampler(threading.get_ident(), lambda: self.scene)
+            self._sampler.start()
+
+    # COUNT A FRAME (RETURNS FALSE WHEN THE WINDOW IS FULL)
+    def frame(self, scene: str) -> bool:
+        self.scene = scene
+        self.scene_frames[scene] = self.scene_frames.get(scene, 0) + 1
+        self.frames_left -= 1
+        return self.frames_left > 0
+
+    # STOP RECORDING AND WRITE IN THE BACKGROUND
+    def finish(self):
+        scene = max(self.scene_frames, key=self.scene_frames.get) if self.scene_frames else (self.scene or "unknown")
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.create_stats()
+            stats = self._profile.stats
+            collapsed = None
+        else:
+            self._sampler.stop()
+            stats = self._sampler.pstats_dict()
+            collapsed = self._sampler.collapsed_lines()
+        ProfileCapture.sequence += 1
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))
+        millis = int(self.started * 1000) % 1000
+        base = os.path.join(self.out_dir, f"{stamp}-{millis:03d}-{ProfileCapture.sequence}_{scene}_{self.mode}")
+        writer = threading.Thread(target=self._write, args=(base, scene, stats, collapsed), name="arcade-profile-writer")
+        writer.start()
+        return writer
+
+    # CPROFILE CALL EDGES AS COLLAPSED STACKS
+    @staticmethod
+    def _edges_as_collapsed(scene: str, stats: dict):
+        lines = []
+        for (path, line, name), (_cc, _nc, _tt, _ct, callers) in stats.items():
+            callee = f"{name} ({os.path.basename(path)}:{line})"
+            for (c_path, c_line, c_name), edge in callers.items():
+                inline = edge[2] if isinstance(edge, tuple) else 0.0
+                micros = int(inline * 1_000_000)
+                if micros > 0:
+                    lines.append(f"{scene};{c_name} ({os.path.basename(c_path)}:{c_line});{callee} {micros}")
+        return lines
+
+    # WRITE OUTPUT FILES (WRITER THREAD)
+    def _write(self, base: str, scene: str, stats: dict, collapsed):
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            with open(base + ".prof", 'wb') as f:
+                marshal.dump(stats, f)
+            if collapsed is None:
+                collapsed = self._edges_as_collapsed(scene, stats)
+            with open(base + ".collapsed", 'w', encoding='utf-8') as f:
+                f.write("\n".join(collapsed))
+                f.write("\n")
+        except Exception:
+            pass
+
+# IDLE REDRAW SETTINGS
+IDLE_REDRAW = os.environ.get("ARCADE_IDLE_REDRAW", "1") == "1"
+IDLE_WAIT_TIMEOUT_MS = 500
+PAUSE_ON_FOCUS_LOSS = True
+
+# HEADLESS BENCHMARK DRIVERS
+if "--benchmark" in sys.argv:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
 
 # PYGAME INIT
 pygame.init()
@@ -218,22 +2157,508 @@ except Exception:
     pygame = None
     _HAVE_PYGAME = False
 
+# AUDIO ASSET SETTINGS
+AUDIO_LOADER_WORKERS = 2
+SOUND_FILES = {
+    'pop': 'Burst.mp3',
+    'buy': 'Buy.mp3',
+    'cheer': 'Cheer.mp3',
+    'cups': 'Cups.mp3',
+    'music': 'Music.mp3',
+    'selection': 'Selection.mp3',
+    'spray': 'Spray.mp3',
+    'swish': 'Swish.mp3',
+    'throw': 'Throw.mp3',
+    'throw2': 'Throw2.mp3'
+}
+_asset_path_cache = {}
+_audio_pool = None
+
+# SHARED ASSET PATH RESOLUTION
+def resolve_asset_path(fname: str, folder: str = ".", subdir: str = "Sounds") -> Optional[str]:
+    if not fname:
+        return None
+    key = (fname, folder, subdir)
+    if key in _asset_path_cache:
+        return _asset_path_cache[key]
+    found = None
+    try:
+        if os.path.isabs(fname):
+            candidates = [fname]
+        else:
+            candidates = [
+                resource_path(os.path.join(subdir, fname)),
+                os.path.join(folder, fname),
+                os.path.join(subdir, fname),
+            ]
+            lower = fname.lower()
+            if lower != fname:
+                candidates += [resource_path(os.path.join(subdir, lower)), os.path.join(subdir, lower)]
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                found = candidate
+                break
+    except Exception:
+        found = None
+    _asset_path_cache[key] = found
+    return found
+
+# SHARED AUDIO DECODE POOL
+def audio_loader_pool():
+    global _audio_pool
+    if _audio_pool is None:
+        _audio_pool = ThreadPoolExecutor(max_workers=AUDIO_LOADER_WORKERS, thread_name_prefix="arcade-audio")
+    return _audio_pool
+
+# STOP AUDIO LOADER (DROP QUEUED DECODES, WAIT FOR RUNNING ONES)
+def shutdown_audio_loader():
+    global _audio_pool
+    pool = _audio_pool
+    _audio_pool = None
+    if pool is None:
+        return
+    try:
+        pool.shutdown(wait=True, cancel_futures=True)
+    except TypeError:
+        pool.shutdown(wait=True)
+
+# DECODED PCM CACHE SETTINGS
+PCM_CACHE_DIR = os.environ.get("ARCADE_PCM_CACHE_DIR", ".pcm_cache")
+PCM_CACHE_MAX_BYTES = 64 * 1024 * 1024
+PCM_CACHE_ENABLED = os.environ.get("ARCADE_PCM_CACHE", "1") == "1"
+
+# DECODED PCM CACHE CLASS
+class PcmCache:
+    # CACHE INIT
+    def __init__(self, directory: str = PCM_CACHE_DIR, max_bytes: int = PCM_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # SOURCE CONTENT HASH
+    @staticmethod
+    def _source_hash(path: str) -> str:
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()[:20]
+
+    # MIXER FORMAT TAG
+    @staticmethod
+    def _mixer_tag() -> Optional[str]:
+        settings = pygame.mixer.get_init() if _HAVE_PYGAME else None
+        if not settings:
+            return None
+        frequency, fmt, channels = settings
+        return f"{frequency}-{fmt}-{channels}"
+
+    # SOURCE STEM
+    @staticmethod
+    def _stem(path: str) -> str:
+        return os.path.splitext(os.path.basename(path))[0]
+
+    # CACHE FILE FOR SOURCE
+    def entry_path(self, path: str) -> Optional[str]:
+        tag = self._mixer_tag()
+        if tag is None:
+            return None
+        return os.path.join(self.directory, f"{self._stem(path)}-{self._source_hash(path)}-{tag}.pcm")
+
+    # LOAD CACHED PCM (NONE ON MISS)
+    def load(self, path: str):
+        try:
+            entry = self.entry_path(path)
+            if entry is None or not os.path.isfile(entry):
+                self.misses += 1
+                return None
+            with open(entry, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    snd = pygame.mixer.Sound(buffer=mapped)
+            try:
+                os.utime(entry, None)
+            except Exception:
+                pass
+            self.hits += 1
+            return snd
+        except Exception:
+            self.misses += 1
+            return None
+
+    # STORE DECODED PCM
+    def store(self, path: str, snd):
+        try:
+            entry = self.entry_path(path)
+            if entry is None:
+                return
+            raw = snd.get_raw()
+            if not raw or len(raw) > self.max_bytes:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f"{entry}.{threading.get_ident()}.tmp"
+            with open(tmp, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp, entry)
+            with self._lock:
+                self._drop_stale(path, entry)
+                self._enforce_cap()
+        except Exception:
+            pass
+
+    # REMOVE ENTRIES FOR OLDER VERSIONS OF A SOURCE
+    def _drop_stale(self, path: str, keep: str):
+        prefix = self._stem(path) + "-"
+        keep_name = os.path.basename(keep)
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and name.endswith(".pcm") and name != keep_name:
+                rest = name[len(prefix):]
+                if rest.count("-") >= 3:
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except Exception:
+                        pass
+
+    # EVICT LEAST RECENTLY USED ENTRIES OVER THE CAP
+    def _enforce_cap(self):
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pcm"):
+                continue
+            full = os.path.join(self.directory, name)
+            try:
+                st = os.stat(full)
+            except Exception:
+                continue
+            entries.append((st.st_mtime, st.st_size, full))
+            total += st.st_size
+        entries.sort()
+        while total > self.max_bytes and entries:
+            _mtime, size, full = entries.pop(0)
+            try:
+                os.remove(full)
+                total -= size
+            except Exception:
+                pass
+
+# SHARED PCM CACHE
+PCM_CACHE = PcmCache()
+
+# VOICE ALLOCATION SETTINGS
+SFX_VOICES = 12
+SOUND_PRIORITIES = {
+    'cheer': 3,
+    'buy': 3,
+    'selection': 2,
+    'swish': 2,
+    'throw': 1,
+    'throw2': 1,
+    'pop': 0
+}
+SOUND_VOICE_CAPS = {
+    'cheer': 1,
+    'buy': 1,
+    'selection': 2,
+    'swish': 2,
+    'throw': 2,
+    'throw2': 2,
+    'pop': 4
+}
+
+# VOICE ALLOCATOR CLASS
+class VoiceAllocator:
+    # ALLOCATOR INIT
+    def __init__(self, channels, busy=None):
+        self.channels = list(channels)
+        self.busy = busy
+        self.voices = {}
+        self._serial = 0
+        self.started = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    # RELEASE FINISHED VOICES
+    def _reap(self):
+        for index in list(self.voices):
+            try:
+                busy = self.busy(self.channels[index])
+            except Exception:
+                busy = False
+            if not busy:
+                del self.voices[index]
+
+    # PICK A CHANNEL FOR A SOUND
+    def acquire(self, key: str, priority: int, cap: int):
+        if not self.channels:
+            return None
+        self._reap()
+        same = [(serial, index) for index, (k, _p, serial) in self.voices.items() if k == key]
+        if len(same) >= max(1, cap):
+            index = min(same)[1]
+            self.stolen += 1
+        else:
+            index = next((i for i in range(len(self.channels)) if i not in self.voices), None)
+            if index is None:
+                victim = min((p, serial, i) for i, (_k, p, serial) in self.voices.items())
+                if victim[0] > priority:
+                    self.dropped += 1
+                    return None
+                index = victim[2]
+                self.stolen += 1
+        self._serial += 1
+        self.voices[index] = (key, priority, self._serial)
+        self.started += 1
+        return self.channels[index]
+
+    # FORGET ALL VOICES
+    def reset(self):
+        self.voices.clear()
+
+# AUDIO BACKEND SETTINGS
+AUDIO_BACKEND = os.environ.get("ARCADE_AUDIO_BACKEND", "sdl")
+RECORDING_MAX_EVENTS = 1 << 20
+MUSIC_CHANNEL = -1
+
+# SDL MIXER AUDIO BACKEND
+class SdlAudioBackend:
+    name = 'sdl'
+    decodes = True
+
+    # BACKEND INIT
+    def __init__(self):
+        self.frame = 0
+        self._channels = {}
+
+    # OPEN MIXER
+    def init(self, num_channels: int) -> bool:
+        if not _HAVE_PYGAME:
+            return False
+        try:
+            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
+        except Exception:
+            pass
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+            except Exception:
+                try:
+                    pygame.mixer.init()
+                except Exception:
+                    return False
+        try:
+            pygame.mixer.set_num_channels(num_channels)
+            self._channels = {i: pygame.mixer.Channel(i) for i in range(num_channels)}
+        except Exception:
+            self._channels = {}
+        return True
+
+    # DECODE ONE SOUND (WORKER THREAD)
+    def load(self, path: str):
+        snd = PCM_CACHE.load(path) if PCM_CACHE_ENABLED else None
+        if snd is None:
+            snd = pygame.mixer.Sound(path)
+            if PCM_CACHE_ENABLED:
+                PCM_CACHE.store(path, snd)
+        snd.set_volume(1.0)
+        return snd
+
+    # START SOUND ON CHANNEL
+    def play(self, channel: int, key: str, snd, volume: Optional[float] = None, loops: int = 0) -> bool:
+        ch = self._channels.get(channel)
+        try:
+            if ch is None:
+                snd.play(loops=loops)
+                return True
+            ch.play(snd, loops=loops)
+            ch.set_volume(1.0 if volume is None else max(0.0, min(1.0, float(volume))))
+            return True
+        except Exception:
+            return False
+
+    # STOP CHANNEL
+    def stop(self, channel: int, fade_ms: int = 0):
+        ch = self._channels.get(channel)
+        if ch is None:
+            return
+        try:
+            if fade_ms > 0:
+                ch.fadeout(fade_ms)
+            else:
+                ch.stop()
+        except Exception:
+            pass
+
+    # CHANNEL BUSY CHECK
+    def busy(self, channel: int) -> bool:
+        ch = self._channels.get(channel)
+        return bool(ch is not None and ch.get_busy())
+
+    # START STREAMED MUSIC
+    def play_music(self, path: str, volume: float, loop: bool) -> bool:
+        try:
+            if pygame.mixer.music.get_busy():
+                return True
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(max(0.0, min(1.0, float(volume))))
+            pygame.mixer.music.play(-1 if loop else 0)
+            return True
+        except Exception:
+            return False
+
+    # PAUSE ALL OUTPUT
+    def pause(self):
+        try:
+            if pygame.mixer.get_init():
+                pygame.mixer.music.pause()
+                pygame.mixer.pause()
+        except Exception:
+            pass
+
+    # RESUME ALL OUTPUT
+    def resume(self):
+        try:
+            if pygame.mixer.get_init():
+                pygame.mixer.music.unpause()
+                pygame.mixer.unpause()
+        except Exception:
+            pass
+
+# NULL AUDIO BACKEND
+class NullAudioBackend:
+    name = 'null'
+    decodes = False
+
+    # BACKEND INIT
+    def __init__(self):
+        self.frame = 0
+
+    # OPEN (NOTHING TO OPEN)
+    def init(self, num_channels: int) -> bool:
+        return True
+
+    # NO DECODE
+    def load(self, path: str):
+        return path
+
+    # DISCARD PLAY
+    def play(self, channel: int, key: str, snd, volume: Optional[float] = None, loops: int = 0) -> bool:
+        return True
+
+    # DISCARD STOP
+    def stop(self, channel: int, fade_ms: int = 0):
+        pass
+
+    # NOTHING EVER PLAYS
+    def busy(self, channel: int) -> bool:
+        return False
+
+    # DISCARD MUSIC
+    def play_music(self, path: str, volume: float, loop: bool) -> bool:
+        return True
+
+    # DISCARD PAUSE
+    def pause(self):
+        pass
+
+    # DISCARD RESUME
+    def resume(self):
+        pass
+
+# RECORDING AUDIO BACKEND
+class RecordingAudioBackend(NullAudioBackend):
+    name = 'recording'
+    EVENT = struct.Struct('<IBBb')
+
+    # BACKEND INIT
+    def __init__(self, max_events: int = RECORDING_MAX_EVENTS):
+        super().__init__()
+        self.max_events = max_events
+        self.buffer = bytearray()
+        self.keys = list(SOUND_FILES)
+        self._key_ids = {key: i for i, key in enumerate(self.keys)}
+        self.overflow = 0
+
+    # APPEND ONE EVENT
+    def _record(self, key: str, volume: float, channel: int):
+        if len(self.buffer) >= self.max_events * self.EVENT.size:
+            self.overflow += 1
+            return
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            key_id = self._key_ids[key] = len(self.keys)
+            self.keys.append(key)
+        level = int(max(0.0, min(1.0, volume)) * 255 + 0.5)
+        self.buffer += self.EVENT.pack(self.frame & 0xFFFFFFFF, key_id, level, channel)
+
+    # RECORD PLAY
+    def play(self, channel: int, key: str, snd, volume: Optional[float] = None, loops: int = 0) -> bool:
+        self._record(key, 1.0 if volume is None else float(volume), channel)
+        return True
+
+    # RECORD STOP (ZERO VOLUME)
+    def stop(self, channel: int, fade_ms: int = 0):
+        self._record('stop', 0.0, channel)
+
+    # RECORD MUSIC START
+    def play_music(self, path: str, volume: float, loop: bool) -> bool:
+        self._record('music', float(volume), MUSIC_CHANNEL)
+        return True
+
+    # RECORDED EVENT COUNT
+    def __len__(self) -> int:
+        return len(self.buffer) // self.EVENT.size
+
+    # DECODE EVENTS (FRAME, KEY, VOLUME, CHANNEL)
+    def events(self):
+        for frame, key_id, level, channel in self.EVENT.iter_unpack(bytes(self.buffer)):
+            yield frame, self.keys[key_id], level / 255.0, channel
+
+    # PLAYS PER SOUND KEY
+    def counts(self) -> dict:
+        totals = {}
+        for _frame, key, volume, _channel in self.events():
+            if volume > 0.0:
+                totals[key] = totals.get(key, 0) + 1
+        return totals
+
+    # DROP RECORDED EVENTS
+    def clear(self):
+        self.buffer = bytearray()
+        self.overflow = 0
+
+# AUDIO BACKEND FACTORY
+AUDIO_BACKENDS = {
+    'sdl': SdlAudioBackend,
+    'null': NullAudioBackend,
+    'recording': RecordingAudioBackend
+}
+
+# BUILD AUDIO BACKEND BY NAME
+def make_audio_backend(name: Optional[str] = None):
+    return AUDIO_BACKENDS.get((name or AUDIO_BACKEND).lower(), SdlAudioBackend)()
+
 # SOUND MANAGER CLASS
 class SoundManager:
     # SOUND MANAGER INITIALIZER
-    def __init__(self, sound_folder: str = ".", mute: Optional[bool] = None):
+    def __init__(self, sound_folder: str = ".", mute: Optional[bool] = None, backend=None):
         try:
             default_mute = ACCESSIBILITY_OPTIONS.get("mute", False)
         except Exception:
             default_mute = False
         self.sound_folder = sound_folder
         self.muted = bool(default_mute) if mute is None else bool(mute)
+        self.suspended = False
+        self.backend = backend if backend is not None else make_audio_backend()
         self._mixer_ready = False
         self._loaded = False
         self._spray_channel_index = 7
         self._cups_channel_index = 8
-        self._spray_channel = None
-        self._cups_channel = None
+        self._loops = {
+            'spray': (self._spray_channel_index, 0.6, 250),
+            'cups': (self._cups_channel_index, None, 0)
+        }
         self.sounds = {
             'pop': None,
             'buy': None,
@@ -246,98 +2671,58 @@ class SoundManager:
             'throw': None,
             'throw2': None
         }
+        self._pending = {}
+        self._queue = OrderedDict()
+        self._loop_state = {'spray': False, 'cups': False}
+        self.commands_queued = 0
+        self.mixer_calls = 0
+        self.voices = VoiceAllocator([])
         self._init_mixer_and_load()
         if self.muted:
-            try:
-                if _HAVE_PYGAME and pygame.mixer.get_init():
-                    try:
-                        pygame.mixer.music.pause()
-                    except Exception:
-                        pass
-                    try:
-                        pygame.mixer.pause()
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            self.backend.pause()
 
     # SOUNDMANAGER FILEPATH RESOLUTION
     def _file_path_if_exists(self, fname: str) -> Optional[str]:
-        if not fname:
-            return None
+        return resolve_asset_path(fname, folder=self.sound_folder)
+
+    # DECODE ONE SOUND (WORKER THREAD)
+    def _load_sound(self, key: str, path: str):
         try:
-            if fname.lower().endswith('.mp3'):
-                candidate = resource_path(os.path.join("Sounds", fname)) if not os.path.isabs(fname) else fname
-                if os.path.isfile(candidate):
-                    return candidate
-            fpath = os.path.join(self.sound_folder, fname)
-            if os.path.isfile(fpath):
-                return fpath
-            alt = os.path.join("Sounds", fname)
-            if os.path.isfile(alt):
-                return alt
+            self.sounds[key] = self.backend.load(path)
         except Exception:
-            pass
-        return None
+            self.sounds[key] = None
+        return self.sounds[key]
+
+    # QUEUE BACKGROUND DECODES
+    def _queue_loads(self):
+        for key, fname in SOUND_FILES.items():
+            if self.sounds.get(key) is not None or key in self._pending:
+                continue
+            if not self.backend.decodes:
+                self.sounds[key] = key
+                continue
+            path = self._file_path_if_exists(fname)
+            if not path:
+                self.sounds[key] = None
+            elif key == 'music':
+                self.sounds[key] = path
+            else:
+                try:
+                    self._pending[key] = audio_loader_pool().submit(self._load_sound, key, path)
+                except Exception:
+                    self._load_sound(key, path)
 
     # SOUND MANAGER MIXER INIT & LOAD
     def _init_mixer_and_load(self):
-        if not _HAVE_PYGAME:
-            self._mixer_ready = False
-            return
         try:
-            try:
-                pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
-            except Exception:
-                pass
-            if not pygame.mixer.get_init():
-                try:
-                    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-                except Exception:
-                    try:
-                        pygame.mixer.init()
-                    except Exception:
-                        self._mixer_ready = False
-                        return
-            try:
-                needed = max(32, self._spray_channel_index + 1, self._cups_channel_index + 1)
-                pygame.mixer.set_num_channels(needed)
-            except Exception:
-                pass
-            try:
-                self._spray_channel = pygame.mixer.Channel(self._spray_channel_index)
-            except Exception:
-                self._spray_channel = None
-            try:
-                self._cups_channel = pygame.mixer.Channel(self._cups_channel_index)
-            except Exception:
-                self._cups_channel = None
-            mapping = {
-                'pop': 'Burst.mp3',
-                'buy': 'Buy.mp3',
-                'cheer': 'Cheer.mp3',
-                'cups': 'Cups.mp3',
-                'music': 'Music.mp3',
-                'selection': 'Selection.mp3',
-                'spray': 'Spray.mp3',
-                'swish': 'Swish.mp3',
-                'throw': 'Throw.mp3',
-                'throw2': 'Throw2.mp3'
-            }
-            for key, fname in mapping.items():
-                path = self._file_path_if_exists(fname)
-                if path:
-                    try:
-                        if key == 'music':
-                            self.sounds[key] = path
-                        else:
-                            snd = pygame.mixer.Sound(path)
-                            snd.set_volume(1.0)
-                            self.sounds[key] = snd
-                    except Exception:
-                        self.sounds[key] = None
-                else:
-                    self.sounds[key] = None
+            needed = max(SFX_VOICES + 2, self._spray_channel_index + 1, self._cups_channel_index + 1)
+            if not self.backend.init(needed):
+                self._mixer_ready = False
+                return
+            loops = (self._spray_channel_index, self._cups_channel_index)
+            pool = [i for i in range(needed) if i not in loops][:SFX_VOICES]
+            self.voices = VoiceAllocator(pool, self.backend.busy)
+            self._queue_loads()
             self._mixer_ready = True
             self._loaded = True
         except Exception:
@@ -350,66 +2735,83 @@ class SoundManager:
         if muted == self.muted:
             return
         self.muted = muted
-        if not _HAVE_PYGAME:
+        if self.muted:
+            self.backend.pause()
             return
-        try:
-            if self.muted:
-                try:
-                    if pygame.mixer.get_init():
-                        try:
-                            pygame.mixer.music.pause()
-                        except Exception:
-                            pass
-                        try:
-                            pygame.mixer.pause()
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-            else:
-                if not pygame.mixer.get_init():
-                    try:
-                        pygame.mixer.init()
-                        self._init_mixer_and_load()
-                    except Exception:
-                        pass
-                try:
-                    pygame.mixer.music.unpause()
-                except Exception:
-                    pass
-                try:
-                    pygame.mixer.unpause()
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        if not self._mixer_ready:
+            self._init_mixer_and_load()
+        if not self.suspended:
+            self.backend.resume()
+
+    # SUSPEND OUTPUT WHILE THE WINDOW IS PAUSED
+    def set_suspended(self, suspended: bool):
+        suspended = bool(suspended)
+        if suspended == self.suspended:
+            return
+        self.suspended = suspended
+        if suspended:
+            self.backend.pause()
+        elif not self.muted:
+            self.backend.resume()
 
-    # GENERIC PLAY SOUND HELPER
+    # GENERIC PLAY SOUND HELPER (QUEUED UNTIL FLUSH)
     def _play_sound(self, key: str, allow_overlap: bool = True, volume: Optional[float] = None) -> bool:
         if self.muted:
             return False
         if not self._loaded or not self._mixer_ready:
             return False
-        snd = self.sounds.get(key)
-        if snd is None:
+        if self.sounds.get(key) is None:
             return False
-        try:
-            if volume is not None:
-                try:
-                    snd.set_volume(max(0.0, min(1.0, float(volume))))
-                except Exception:
-                    pass
-            if allow_overlap:
-                snd.play()
-            else:
-                ch = pygame.mixer.find_channel()
-                if ch is None:
-                    snd.play()
+        self.commands_queued += 1
+        self._queue[('play', key)] = (allow_overlap, volume)
+        return True
+
+    # LOOP INTENT (QUEUED UNTIL FLUSH)
+    def _set_loop(self, name: str, active: bool):
+        if not self._loaded or not self._mixer_ready:
+            return
+        if active and self.muted:
+            return
+        self.commands_queued += 1
+        self._queue[('loop', name)] = bool(active)
+
+    # ISSUE QUEUED COMMANDS (ONCE PER FRAME)
+    def flush(self):
+        if self._queue:
+            commands = self._queue
+            self._queue = OrderedDict()
+            for (kind, key), arg in commands.items():
+                if kind == 'play':
+                    if not self.muted:
+                        self._play_now(key, *arg)
                 else:
-                    ch.play(snd)
-            return True
-        except Exception:
+                    self._apply_loop(key, arg)
+        self.backend.frame += 1
+
+    # APPLY LOOP TRANSITION
+    def _apply_loop(self, name: str, active: bool):
+        if self._loop_state.get(name, False) == active or name not in self._loops:
+            return
+        channel, volume, fade_ms = self._loops[name]
+        self.mixer_calls += 1
+        if not active:
+            self.backend.stop(channel, fade_ms)
+            self._loop_state[name] = False
+            return
+        snd = self.sounds.get(name)
+        self._loop_state[name] = bool(snd is not None and self.backend.play(channel, name, snd, volume, loops=-1))
+
+    # PLAY ONE-SHOT NOW
+    def _play_now(self, key: str, allow_overlap: bool = True, volume: Optional[float] = None) -> bool:
+        snd = self.sounds.get(key)
+        if snd is None:
             return False
+        self.mixer_calls += 1
+        cap = SOUND_VOICE_CAPS.get(key, 2) if allow_overlap else 1
+        channel = self.voices.acquire(key, SOUND_PRIORITIES.get(key, 1), cap)
+        if channel is None:
+            return False
+        return self.backend.play(channel, key, snd, volume)
 
     # BACKGROUND MUSIC PLAYER
     def play_background_music(self, loop: bool = True, volume: float = 0.2):
@@ -418,28 +2820,9 @@ class SoundManager:
         if not self._loaded or not self._mixer_ready:
             return
         music_path = self.sounds.get('music')
-        if isinstance(music_path, str):
-            try:
-                if not pygame.mixer.get_init():
-                    try:
-                        pygame.mixer.init()
-                    except Exception:
-                        pass
-                if pygame.mixer.music.get_busy():
-                    return
-                pygame.mixer.music.load(music_path)
-                pygame.mixer.music.set_volume(max(0.0, min(1.0, float(volume))))
-                pygame.mixer.music.play(-1 if loop else 0)
-                return
-            except Exception:
-                pass
-        try:
-            cheer = self.sounds.get('cheer')
-            if cheer:
-                cheer.play()
-                return
-        except Exception:
+        if isinstance(music_path, str) and self.backend.play_music(music_path, volume, loop):
             return
+        self._play_sound('cheer')
 
     # PLAY POP SFX
     def play_pop(self, context: Optional[str] = None):
@@ -474,84 +2857,24 @@ class SoundManager:
 
     # PLAY WATER SPRAY LOOP
     def play_water_spray(self, start: bool = True):
-        if self.muted or not self._loaded or not self._mixer_ready:
-            return
-        key = 'spray'
-        if start:
-            snd = self.sounds.get(key)
-            if snd is None:
-                return
-            try:
-                if self._spray_channel:
-                    self._spray_channel.play(snd, loops=-1)
-                    try:
-                        self._spray_channel.set_volume(0.6)
-                    except Exception:
-                        pass
-                else:
-                    ch = pygame.mixer.find_channel()
-                    if ch:
-                        ch.play(snd, loops=-1)
-            except Exception:
-                pass
-        else:
-            try:
-                if self._spray_channel:
-                    try:
-                        self._spray_channel.fadeout(250)
-                    except Exception:
-                        self._spray_channel.stop()
-                else:
-                    snd = self.sounds.get(key)
-                    if snd:
-                        try:
-                            snd.stop()
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+        self._set_loop('spray', start)
 
     # START CUPS LOOP
     def start_cups(self):
-        if self.muted or not self._loaded or not self._mixer_ready:
-            return
-        snd = self.sounds.get('cups')
-        if snd is None:
-            return
-        try:
-            if self._cups_channel:
-                self._cups_channel.play(snd, loops=-1)
-            else:
-                ch = pygame.mixer.find_channel()
-                if ch:
-                    ch.play(snd, loops=-1)
-        except Exception:
-            pass
+        self._set_loop('cups', True)
 
     # STOP CUPS LOOP
     def stop_cups(self):
-        if self.muted or not self._loaded or not self._mixer_ready:
-            return
-        try:
-            if self._cups_channel:
-                try:
-                    self._cups_channel.stop()
-                except Exception:
-                    pass
-            else:
-                try:
-                    pygame.mixer.stop()
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        self._set_loop('cups', False)
 
 # PRIZE ICON CACHE
-_icon_cache = {}
+PRIZE_ICON_CACHE_SIZE = 32
+_icon_cache = OrderedDict()
+SURFACES.register_hook(_icon_cache.clear)
 
 # PRIZE ICON RENDERER
 def create_prize_icon_surf(icon_id: str, size: int = 64):
-    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    surf = SURFACES.new((size, size))
     center = (size // 2, size // 2)
     if icon_id == "teddy":
         face_r = size // 3
@@ -645,14 +2968,74 @@ def create_prize_icon_surf(icon_id: str, size: int = 64):
 # PRIZE ICON CACHER
 def get_prize_icon(icon_id: str, size: int = 64):
     key = (icon_id, size)
-    if key not in _icon_cache:
-        _icon_cache[key] = create_prize_icon_surf(icon_id, size=size)
-    return _icon_cache[key]
+    surf = _icon_cache.get(key)
+    if surf is not None:
+        _icon_cache.move_to_end(key)
+        return surf
+    surf = create_prize_icon_surf(icon_id, size=size)
+    _icon_cache[key] = surf
+    if len(_icon_cache) > PRIZE_ICON_CACHE_SIZE:
+        _icon_cache.popitem(last=False)
+    return surf
 
 # PRIZE ICON BLITTER
 def draw_prize_icon(surface, topleft, icon_id: str, size: int = 48):
     surf = get_prize_icon(icon_id, size=size)
-    surface.blit(surf, topleft)
+    SURFACES.blit(surface, surf, topleft)
+
+# PRIZE ICON ATLAS CLASS
+class PrizeIconAtlas:
+    # ATLAS INIT
+    def __init__(self, size: int = 76, pad: int = 6):
+        self.size = int(size)
+        self.pad = int(pad)
+        self.cell = self.size + 2 * self.pad
+        self.surface = None
+        self._columns = {}
+        SURFACES.track(self, 'surface')
+
+    # BUILD ATLAS (ROW 0 NORMAL, ROW 1 LOCKED)
+    def build(self):
+        atlas = SURFACES.new((self.cell * max(1, len(PRIZES)), self.cell * 2))
+        atlas.fill((0, 0, 0, 0))
+        columns = {}
+        for col, prize in enumerate(PRIZES):
+            icon = create_prize_icon_surf(prize['id'], size=self.size)
+            x = col * self.cell + self.pad
+            atlas.blit(icon, (x, self.pad), special_flags=pygame.BLEND_RGBA_MAX)
+            faded = icon.copy()
+            try:
+                fade_overlay = pygame.Surface(faded.get_size(), pygame.SRCALPHA)
+                fade_overlay.fill((90, 90, 90, 200))
+                faded.blit(fade_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            except Exception:
+                faded.set_alpha(120)
+            locked_y = self.cell + self.pad
+            atlas.blit(faded, (x, locked_y), special_flags=pygame.BLEND_RGBA_MAX)
+            lock_x = x + self.size - 18
+            lock_y = locked_y + 6
+            pygame.draw.circle(atlas, DARK_GRAY, (lock_x, lock_y), 10)
+            pygame.draw.rect(atlas, BLACK, (lock_x - 6, lock_y + 2, 12, 8))
+            columns[prize['id']] = col
+        self.surface = atlas
+        self._columns = columns
+        return atlas
+
+    # CELL AREA LOOKUP
+    def area(self, prize_id: str, locked: bool) -> Optional[pygame.Rect]:
+        if self.surface is None:
+            self.build()
+        col = self._columns.get(prize_id)
+        if col is None:
+            return None
+        return pygame.Rect(col * self.cell, self.cell if locked else 0, self.cell, self.cell)
+
+    # BLIT SEQUENCE ENTRY (ICON TOPLEFT IN SCREEN SPACE)
+    def blit_entry(self, prize_id: str, locked: bool, topleft):
+        area = self.area(prize_id, locked)
+        if area is None:
+            return None
+        return (self.surface, (topleft[0] - self.pad, topleft[1] - self.pad), area)
 
 # CLOWN VISUAL HELPER CLASS
 class Clown:
@@ -664,10 +3047,11 @@ class Clown:
         self.center_y = int(center_y)
         self.is_hit = False
         self.visible_state = True
-        self.hair_puffs = self._generate_hair_puffs(seed=(self.center_x ^ self.center_y) & 0xFFFF)
-        self.image = pygame.Surface((self.visual_size, self.visual_size), pygame.SRCALPHA)
+        self.hair_seed = (self.center_x ^ self.center_y) & 0xFFFF
+        self.hair_puffs = self._generate_hair_puffs(seed=self.hair_seed)
+        self.image = self.sprite(False)
         self.rect = self.image.get_rect(center=(self.center_x, self.center_y))
-        self._redraw()
+        SURFACES.track(self, 'image')
 
     # HAIR PUFFS GENERATOR
     def _generate_hair_puffs(self, seed=None):
@@ -692,9 +3076,20 @@ class Clown:
         puff_centers.append(((self.visual_size // 2), hair_center_y - int(puff_radius * 0.9)))
         return puff_centers
 
+    # RENDER CLOWN SURFACE
+    def _render(self, hit):
+        surf = SURFACES.new((self.visual_size, self.visual_size))
+        draw_clown_face_centered(surf, self.clown_size, hit, self.visual_size, hair_puffs=self.hair_puffs, hair_seed=self.hair_seed)
+        return surf
+
+    # BAKED CLOWN SPRITE
+    def sprite(self, hit: bool):
+        key = ('clown', self.clown_size, self.visual_size, bool(hit), self.hair_seed)
+        return SPRITE_BAKER.get(key, lambda: self._render(bool(hit)))
+
     # CLOWN REDRAW
     def _redraw(self):
-        draw_clown_face_centered(self.image, self.clown_size, self.is_hit, self.visual_size, hair_puffs=self.hair_puffs)
+        self.image = self.sprite(self.is_hit)
 
     # MARK HIT
     def mark_hit(self):
@@ -737,6 +3132,9 @@ class PrizeScreen:
         else:
             self.unlocked = {p['id']: False for p in PRIZES}
         self.header_font = safe_font(size=26)
+        self.icon_size = 76
+        self.icon_atlas = PrizeIconAtlas(size=self.icon_size)
+        self.icon_atlas.build()
 
     # PRIZE POSITIONS COMPUTATION
     def _compute_prize_positions(self):
@@ -834,6 +3232,8 @@ class PrizeScreen:
             self.unlocked[pid] = True
             self.manager.prize_unlocked = self.unlocked
             try:
+                self.manager.journal.append(JOURNAL_PRIZE, 0, cost, pid)
+                self.manager.profiles.record_purchase(self.manager.player_id, pid, cost)
                 self.manager._save_prizes()
             except Exception:
                 pass
@@ -861,14 +3261,25 @@ class PrizeScreen:
     def draw(self, total_score):
         self.screen.fill((28, 18, 30))
 
-        title = self.font.render("PRIZE ROOM", True, CARNIVAL_YELLOW)
-        self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 24))
+        title = render_text(self.font, "PRIZE ROOM", CARNIVAL_YELLOW)
+        SURFACES.blit(self.screen, title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 24))
 
-        hud = self.small_font.render(f"POINTS: {total_score}", True, UI_PLAYFUL)
-        self.screen.blit(hud, (SCREEN_WIDTH - hud.get_width() - 12, 12))
+        hud = render_text(self.small_font, f"POINTS: {total_score}", UI_PLAYFUL)
+        SURFACES.blit(self.screen, hud, (SCREEN_WIDTH - hud.get_width() - 12, 12))
 
         self.prize_item_rects.clear()
-        icon_size = 76
+        icon_size = self.icon_size
+
+        icon_blits = []
+        for i, prize in enumerate(PRIZES):
+            display_x, display_y = self.prize_positions[i]
+            pedestal_rect = pygame.Rect(display_x - 8, display_y + icon_size - 10, icon_size + 16, 14)
+            pygame.draw.rect(self.screen, OG_BROWN, pedestal_rect)
+            locked = not self.unlocked.get(prize['id'], False)
+            entry = self.icon_atlas.blit_entry(prize['id'], locked, (display_x, display_y))
+            if entry is not None:
+                icon_blits.append(entry)
+        SURFACES.blits(self.screen, icon_blits, doreturn=False)
 
         for i, prize in enumerate(PRIZES):
             pos = self.prize_positions[i]
@@ -876,37 +3287,14 @@ class PrizeScreen:
             display_x = px
             display_y = py
 
-            pedestal_rect = pygame.Rect(display_x - 8, display_y + icon_size - 10, icon_size + 16, 14)
-            pygame.draw.rect(self.screen, OG_BROWN, pedestal_rect)
-
-            icon_surf = get_prize_icon(prize['id'], size=icon_size)
             unlocked = self.unlocked.get(prize['id'], False)
 
             if unlocked:
-                self.screen.blit(icon_surf, (display_x, display_y))
-
                 try:
                     pygame.draw.rect(self.screen, CARNIVAL_YELLOW, (display_x - 6, display_y - 6, icon_size + 12, icon_size + 12), 3, border_radius=8)
                 except TypeError:
                     pygame.draw.rect(self.screen, CARNIVAL_YELLOW, (display_x - 6, display_y - 6, icon_size + 12, icon_size + 12), 3)
 
-            else:
-                faded = icon_surf.copy()
-
-                try:
-                    fade_overlay = pygame.Surface(faded.get_size(), pygame.SRCALPHA)
-                    fade_overlay.fill((90, 90, 90, 200))
-                    faded.blit(fade_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                except Exception:
-                    faded.set_alpha(120)
-
-                self.screen.blit(faded, (display_x, display_y))
-
-                lock_x = display_x + icon_size - 18
-                lock_y = display_y + 6
-                pygame.draw.circle(self.screen, DARK_GRAY, (lock_x, lock_y), 10)
-                pygame.draw.rect(self.screen, BLACK, (lock_x - 6, lock_y + 2, 12, 8))
-
             if unlocked:
                 status_text = "OWNED"
                 status_color = SPLASH_GREEN
@@ -914,16 +3302,16 @@ class PrizeScreen:
                 status_text = f"{prize['cost']} pts"
                 status_color = CARNIVAL_YELLOW if total_score >= prize['cost'] else CARNIVAL_RED
 
-            name_surf = self.small_font.render(prize['name'], True, WHITE)
-            stat_surf = self.small_font.render(status_text, True, status_color)
+            name_surf = render_text(self.small_font, prize['name'], WHITE)
+            stat_surf = render_text(self.small_font, status_text, status_color)
 
             name_x = display_x + (icon_size // 2) - (name_surf.get_width() // 2)
             name_y = display_y + icon_size - 6
             stat_x = display_x + (icon_size // 2) - (stat_surf.get_width() // 2)
             stat_y = display_y + icon_size + 14
 
-            self.screen.blit(name_surf, (name_x, name_y))
-            self.screen.blit(stat_surf, (stat_x, stat_y))
+            SURFACES.blit(self.screen, name_surf, (name_x, name_y))
+            SURFACES.blit(self.screen, stat_surf, (stat_x, stat_y))
 
             bounding = pygame.Rect(display_x - 6, display_y - 6, icon_size + 12, icon_size + 56)
             self.prize_item_rects[prize['id']] = bounding
@@ -935,15 +3323,15 @@ class PrizeScreen:
 
             draw_rounded_box(self.screen, panel_rect, fill_color=MENU_DARK_BLUE, border_color=CARNIVAL_YELLOW, border_thickness=4, radius=12)
 
-            title = self.header_font.render("PRIZE INTERACTION", True, UI_PLAYFUL)
-            self.screen.blit(title, (panel_rect.left + 20, panel_rect.top + 12))
+            title = render_text(self.header_font, "PRIZE INTERACTION", UI_PLAYFUL)
+            SURFACES.blit(self.screen, title, (panel_rect.left + 20, panel_rect.top + 12))
 
             msg_lines = wrap_text(self.small_font, self.modal_message, panel_w - 40)
             y = panel_rect.top + 44
 
             for line in msg_lines:
-                surf = self.small_font.render(line, True, WHITE)
-                self.screen.blit(surf, (panel_rect.left + 20, y))
+                surf = render_text(self.small_font, line, WHITE)
+                SURFACES.blit(self.screen, surf, (panel_rect.left + 20, y))
                 y += surf.get_height() + 6
 
             for name, rect in self.modal_buttons.items():
@@ -980,6 +3368,9 @@ class DartPopGame:
         self.target_angle = 3 * math.pi / 2
         self.hit_angle_tolerance = 0.26
         self.reticle_mode = 'circle'
+        self.dirty = DirtyRegionTracker()
+        self.background = StaticLayer(self._build_background)
+        self.confetti = ParticleSystem(capacity=400, gravity=420.0)
         self.reset()
         self.message = "Press SPACE to throw the dart! (Press F to toggle reticle mode)"
 
@@ -1006,6 +3397,7 @@ class DartPopGame:
         self.rotation_speed = sign * max(0.7, min(2.2, base_speed))
         self.generate_balloons()
         self.message = "Press SPACE to throw the dart! (Press F to toggle reticle mode)"
+        self.dirty.invalidate()
 
     # RETICLE POSITION
     def _reticle_pos(self, t):
@@ -1037,6 +3429,8 @@ class DartPopGame:
                             balloon['hit'] = True
                             hit_balloon = True
                             hit_score += DARTPOP_BALLOON_SCORE
+                            self.confetti.emit_burst(balloon['pos'][0], balloon['pos'][1], 60,
+                                                     [balloon['color'], CARNIVAL_YELLOW, WHITE, CARNIVAL_RED], lift=120.0)
                             try:
                                 self.sound_manager.play_pop()
                             except Exception:
@@ -1072,25 +3466,35 @@ class DartPopGame:
     def update(self, dt):
         if not self.dart_thrown:
             self.game_time += dt
+        self.confetti.update(dt)
         return 0
 
-    # DRAW GAME
-    def draw(self):
-        self.screen.fill(CARNIVAL_RED)
+    # INTERPOLATED RENDER STATE
+    def interpolation_targets(self):
+        return [(self, 'game_time')]
 
-        pygame.draw.rect(self.screen, BLACK, self.PLAY_AREA_RECT)
+    # BUILD STATIC BACKGROUND
+    def _build_background(self, surf):
+        surf.fill(CARNIVAL_RED)
 
-        pygame.draw.circle(self.screen, DARK_GRAY, (self.center_x, self.center_y), self.target_radius + 50, 0)
-        pygame.draw.circle(self.screen, CARNIVAL_RED, (self.center_x, self.center_y), self.target_radius, 0)
-        pygame.draw.circle(self.screen, SPLASH_GREEN, (self.center_x, self.center_y), int(self.target_radius * 0.5))
-        pygame.draw.circle(self.screen, WHITE, (self.center_x, self.center_y), self.bullseye_radius)
+        pygame.draw.rect(surf, BLACK, self.PLAY_AREA_RECT)
 
-        for balloon in self.balloons:
+        pygame.draw.circle(surf, DARK_GRAY, (self.center_x, self.center_y), self.target_radius + 50, 0)
+        pygame.draw.circle(surf, CARNIVAL_RED, (self.center_x, self.center_y), self.target_radius, 0)
+        pygame.draw.circle(surf, SPLASH_GREEN, (self.center_x, self.center_y), int(self.target_radius * 0.5))
+        pygame.draw.circle(surf, WHITE, (self.center_x, self.center_y), self.bullseye_radius)
+
+    # DRAW GAME
+    def draw(self):
+        self.background.blit(self.screen, key=(self.target_radius, self.bullseye_radius))
+
+        for i, balloon in enumerate(self.balloons):
             if balloon['hit']:
                 pygame.draw.circle(self.screen, BLACK, balloon['pos'], balloon['size'] + 3)
                 pygame.draw.circle(self.screen, CARNIVAL_RED, balloon['pos'], balloon['size'] - 5)
             else:
                 pygame.draw.circle(self.screen, balloon['color'], balloon['pos'], balloon['size'])
+            self.dirty.mark(('balloon', i), circle_rect(balloon['pos'], balloon['size'] + 3), balloon['hit'])
 
         t = self.game_time * self.rotation_speed
         end_x, end_y = self._reticle_pos(t)
@@ -1098,11 +3502,24 @@ class DartPopGame:
 
         if not self.dart_thrown:
             pygame.draw.circle(self.screen, reticle_color, (int(end_x), int(end_y)), 8)
+            self.dirty.mark('reticle', circle_rect((end_x, end_y), 8), reticle_color)
+        else:
+            self.dirty.forget('reticle')
 
         if self.dart_thrown:
             dart_x, dart_y = self._reticle_pos(t)
             color = SPLASH_GREEN if self.hit_result != 'MISS' else CARNIVAL_RED
             pygame.draw.circle(self.screen, color, (int(dart_x), int(dart_y)), 12)
+            self.dirty.mark('dart', circle_rect((dart_x, dart_y), 12), color)
+        else:
+            self.dirty.forget('dart')
+
+        self.confetti.draw(self.screen)
+        confetti_rect = self.confetti.bounds()
+        if confetti_rect is not None:
+            self.dirty.mark('confetti', confetti_rect, self.confetti.clock)
+        else:
+            self.dirty.forget('confetti')
 
         self._draw_message()
 
@@ -1111,14 +3528,17 @@ class DartPopGame:
         max_w = SCREEN_WIDTH - 40
         lines = wrap_text(self.font, self.message, max_w)
         y = self.PLAY_AREA_RECT.bottom + 8
+        msg_rect = pygame.Rect(SCREEN_WIDTH // 2, y, 0, 0)
         for line in lines:
-            surf = self.font.render(line, True, UI_PLAYFUL)
-            self.screen.blit(surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, y))
+            surf = render_text(self.font, line, UI_PLAYFUL)
+            line_rect = SURFACES.blit(self.screen, surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, y))
+            msg_rect.union_ip(line_rect)
             y += surf.get_height() + 2
+        self.dirty.mark('message', msg_rect, self.message)
 
     # CLEANUP
     def cleanup(self):
-        pass
+        self.confetti.clear()
 
 # SWAY OBJECT SPRITE CLASS
 class SwayObject(pygame.sprite.Sprite):
@@ -1126,28 +3546,32 @@ class SwayObject(pygame.sprite.Sprite):
     def __init__(self, center_x, center_y, amplitude, frequency, pattern, color=CARNIVAL_RED, size=20):
         super().__init__()
         self.size = size
-        self.image = pygame.Surface([size * 10, size], pygame.SRCALPHA)
-        self.image.fill((0, 0, 0, 0))
+        self.color = color
+        self.image = SPRITE_BAKER.get(('sway_dot', size, tuple(color)), self._render)
         self.rect = self.image.get_rect(center=(int(center_x), int(center_y)))
+        SURFACES.track(self, 'image')
         self.start_x = int(center_x)
         self.start_y = int(center_y)
         self.amplitude = amplitude
         self.frequency = frequency
         self.pattern = pattern
-        self.color = color
-        self.time_offset = pygame.time.get_ticks()
-
-    # UPDATE SWAY
-    def update(self):
-        elapsed_time = pygame.time.get_ticks() - self.time_offset
-        time_s = elapsed_time / 1000.0
-        angle = time_s * self.frequency * 2 * math.pi
+        self.elapsed = 0.0
+
+    # RENDER SWAY DOT
+    def _render(self):
+        surf = SURFACES.new((self.size * 10, self.size))
+        surf.fill((0, 0, 0, 0))
+        pygame.draw.circle(surf, self.color, (self.size * 5, self.size // 2), self.size // 2)
+        return surf
+
+    # UPDATE SWAY (SIMULATION TIME)
+    def update(self, dt=0.0):
+        self.elapsed += dt
+        angle = self.elapsed * self.frequency * 2 * math.pi
         y_offset = 0
         if self.pattern == 1:
             y_offset = math.sin(angle) * self.amplitude
         self.rect.center = (self.start_x, int(self.start_y + y_offset))
-        self.image.fill((0, 0, 0, 0))
-        pygame.draw.circle(self.image, self.color, (self.size * 5, self.size // 2), self.size // 2)
         return y_offset
 
 # BASKETBALL SPRITE
@@ -1156,11 +3580,10 @@ class Basketball(pygame.sprite.Sprite):
     def __init__(self, start_x, start_y, arc_type, speed_multiplier=1.0):
         super().__init__()
         self.size = 40
-        self.image = pygame.Surface([self.size, self.size], pygame.SRCALPHA)
-        self.image.fill((0, 0, 0, 0))
-        pygame.draw.circle(self.image, OG_ORANGE, (self.size // 2, self.size // 2), self.size // 2)
+        self.image = SPRITE_BAKER.get(('basketball', self.size), self._render)
         self.rect = self.image.get_rect(center=(int(start_x), int(start_y)))
-        self.start_time = pygame.time.get_ticks()
+        SURFACES.track(self, 'image')
+        self.elapsed = 0.0
         self.start_x = float(start_x)
         self.start_y = float(start_y)
         self.target_x = float(SCREEN_WIDTH - PLAY_AREA_MARGIN - 100)
@@ -1180,12 +3603,22 @@ class Basketball(pygame.sprite.Sprite):
             self.initial_vy = -650.0 * speed_multiplier
         self.vx = (self.target_x - self.start_x) / max(0.001, self.duration)
         self.in_flight = True
-
-    # UPDATE BASKETBALL
-    def update(self):
+        self.arc_type = arc_type
+        self.sparked = False
+
+    # RENDER BASKETBALL
+    def _render(self):
+        surf = SURFACES.new((self.size, self.size))
+        surf.fill((0, 0, 0, 0))
+        pygame.draw.circle(surf, OG_ORANGE, (self.size // 2, self.size // 2), self.size // 2)
+        return surf
+
+    # UPDATE BASKETBALL (SIMULATION TIME)
+    def update(self, dt=0.0):
         if not self.in_flight:
             return
-        elapsed_time = (pygame.time.get_ticks() - self.start_time) / 1000.0
+        self.elapsed += dt
+        elapsed_time = self.elapsed
         if elapsed_time > self.duration * 1.6:
             try:
                 self.kill()
@@ -1224,6 +3657,8 @@ class HoopShotGame:
         self.time_lerp_speed = 6.0
         self.last_shot_time = 0.0
         self.shot_cooldown = 0.6
+        self.background = StaticLayer(self._build_background)
+        self.sparks = ParticleSystem(capacity=300, gravity=260.0)
         self.reset()
 
     # RESET HOOPSHOT
@@ -1303,7 +3738,7 @@ class HoopShotGame:
             self.sound_manager.play_throw()
         except Exception:
             pass
-        self.power_meter.time_offset = pygame.time.get_ticks()
+        self.power_meter.elapsed = 0.0
         self._randomize_target_zone()
         self.last_shot_time = time.time()
         return score_to_report
@@ -1317,43 +3752,50 @@ class HoopShotGame:
 
     # UPDATE
     def update(self, dt):
-        self.all_sprites.update()
+        self.all_sprites.update(dt)
+        rim_center_x = self.hoop_center_x - 40
         for sprite in list(self.all_sprites):
+            if isinstance(sprite, Basketball) and sprite.arc_type == 'swish' and not sprite.sparked and sprite.rect.centerx >= rim_center_x:
+                sprite.sparked = True
+                self.sparks.emit_burst(rim_center_x, self.hoop_center_y, 45,
+                                       [CARNIVAL_YELLOW, OG_ORANGE, WHITE], speed=(60.0, 220.0), life=(0.3, 0.8), lift=80.0)
             if isinstance(sprite, Basketball) and not sprite.in_flight and sprite.alive():
                 try:
                     sprite.kill()
                 except Exception:
                     pass
+        self.sparks.update(dt)
         self.hoop_reticle_angle += self.hoop_reticle_speed * dt
         self.hoop_reticle_angle %= (2 * math.pi)
         return 0
 
-    # DRAW
-    def draw(self):
-        self.screen.fill(HOOP_BLUE)
+    # INTERPOLATED RENDER STATE
+    def interpolation_targets(self):
+        return [(sprite.rect, 'center') for sprite in self.all_sprites]
 
-        pygame.draw.rect(self.screen, BLACK, self.PLAY_AREA_RECT)
+    # BUILD STATIC BACKGROUND
+    def _build_background(self, surf):
+        surf.fill(HOOP_BLUE)
+
+        pygame.draw.rect(surf, BLACK, self.PLAY_AREA_RECT)
 
         track_rect = pygame.Rect(
-            int(self.power_meter.start_x - 10), int(self.power_meter.start_y - self.bar_amplitude), 20, int(self.bar_amplitude * 2)
+            int(self.bar_center_x - 10), int(self.bar_center_y - self.bar_amplitude), 20, int(self.bar_amplitude * 2)
         )
 
         try:
-            pygame.draw.rect(self.screen, DARK_GRAY, track_rect, 0, border_radius=5)
-            pygame.draw.rect(self.screen, SPLASH_GREEN, self.perfect_zone_rect, 0, border_radius=5)
+            pygame.draw.rect(surf, DARK_GRAY, track_rect, 0, border_radius=5)
         except TypeError:
-            pygame.draw.rect(self.screen, DARK_GRAY, track_rect)
-            pygame.draw.rect(self.screen, SPLASH_GREEN, self.perfect_zone_rect)
+            pygame.draw.rect(surf, DARK_GRAY, track_rect)
 
-        pygame.draw.circle(self.screen, WHITE, (int(self.shooter_x), int(self.shooter_y)), 25)
-        pygame.draw.circle(self.screen, DARK_GRAY, (int(self.shooter_x), int(self.shooter_y)), 25, 3)
+        pygame.draw.circle(surf, WHITE, (int(self.shooter_x), int(self.shooter_y)), 25)
+        pygame.draw.circle(surf, DARK_GRAY, (int(self.shooter_x), int(self.shooter_y)), 25, 3)
 
         rim_center_x = self.hoop_center_x - 40
-        hoop_center_x = rim_center_x
         hoop_center_y = self.hoop_center_y
 
         backboard_rect = (rim_center_x + 40, hoop_center_y - 75, 10, 150)
-        pygame.draw.rect(self.screen, WHITE, backboard_rect)
+        pygame.draw.rect(surf, WHITE, backboard_rect)
 
         net_top_width = 70
         net_bottom_width = 42
@@ -1371,31 +3813,42 @@ class HoopShotGame:
             t = i / (num_strings - 1)
             top_x = net_top_left[0] + t * (net_top_right[0] - net_top_left[0])
             bottom_x = net_bottom_left[0] + t * (net_bottom_right[0] - net_bottom_left[0])
-            pygame.draw.line(self.screen, WHITE, (top_x, net_top_y), (bottom_x, net_bottom_y), 1)
+            pygame.draw.line(surf, WHITE, (top_x, net_top_y), (bottom_x, net_bottom_y), 1)
 
-        pygame.draw.line(self.screen, WHITE, net_top_left, net_bottom_left, 2)
-        pygame.draw.line(self.screen, WHITE, net_top_right, net_bottom_right, 2)
-        pygame.draw.line(self.screen, WHITE, net_bottom_left, net_bottom_right, 2)
-        pygame.draw.line(self.screen, WHITE, net_top_left, net_top_right, 2)
+        pygame.draw.line(surf, WHITE, net_top_left, net_bottom_left, 2)
+        pygame.draw.line(surf, WHITE, net_top_right, net_bottom_right, 2)
+        pygame.draw.line(surf, WHITE, net_bottom_left, net_bottom_right, 2)
+        pygame.draw.line(surf, WHITE, net_top_left, net_top_right, 2)
 
         rim_rect = (rim_center_x - 40, hoop_center_y - 15, 80, 30)
-        pygame.draw.ellipse(self.screen, DARK_GRAY, rim_rect, 8)
+        pygame.draw.ellipse(surf, DARK_GRAY, rim_rect, 8)
 
         front_rim_rect = (rim_center_x - 36, hoop_center_y - 8, 72, 18)
-        pygame.draw.ellipse(self.screen, DARK_GRAY, front_rim_rect, 6)
+        pygame.draw.ellipse(surf, DARK_GRAY, front_rim_rect, 6)
+
+    # DRAW
+    def draw(self):
+        layer_key = (self.bar_center_x, self.bar_center_y, self.bar_amplitude, self.shooter_x, self.shooter_y)
+        self.background.blit(self.screen, key=layer_key)
+
+        try:
+            pygame.draw.rect(self.screen, SPLASH_GREEN, self.perfect_zone_rect, 0, border_radius=5)
+        except TypeError:
+            pygame.draw.rect(self.screen, SPLASH_GREEN, self.perfect_zone_rect)
 
-        self.all_sprites.draw(self.screen)
+        SURFACES.draw_group(self.all_sprites, self.screen)
+        self.sparks.draw(self.screen)
 
         combo_text = f"Combo: {self.swish_combo}"
-        combo_surf = self.font.render(combo_text, True, UI_PLAYFUL)
-        self.screen.blit(combo_surf, (20, 20))
+        combo_surf = render_text(self.font, combo_text, UI_PLAYFUL)
+        SURFACES.blit(self.screen, combo_surf, (20, 20))
 
         msg_lines = wrap_text(self.font, self.shot_result, SCREEN_WIDTH // 2)
         y = SCREEN_HEIGHT - 30
 
         for line in reversed(msg_lines):
-            surf = self.font.render(line, True, UI_PLAYFUL)
-            self.screen.blit(surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, y - surf.get_height()))
+            surf = render_text(self.font, line, UI_PLAYFUL)
+            SURFACES.blit(self.screen, surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, y - surf.get_height()))
             y -= surf.get_height() + 2
 
     # CLEANUP
@@ -1404,10 +3857,12 @@ class HoopShotGame:
             self.all_sprites.empty()
         except Exception:
             pass
+        self.sparks.clear()
 
 # CLOWN FACE RENDERER
-def draw_clown_face_centered(surface, clown_size, hit, surface_size, hair_puffs: Optional[List[Tuple[int, int]]] = None):
+def draw_clown_face_centered(surface, clown_size, hit, surface_size, hair_puffs: Optional[List[Tuple[int, int]]] = None, hair_seed: Optional[int] = None):
     surface.fill((0, 0, 0, 0))
+    rng = random.Random(hair_seed) if hair_seed is not None else random
     center = (surface_size // 2, surface_size // 2)
     radius = clown_size // 2
 
@@ -1428,19 +3883,19 @@ def draw_clown_face_centered(surface, clown_size, hit, surface_size, hair_puffs:
 
         x = start_x
         while x <= start_x + hair_width:
-            y = hair_center_y + random.randint(-4, 6)
+            y = hair_center_y + rng.randint(-4, 6)
             puff_centers.append((int(x), int(y)))
             x += puff_spacing
 
         side_offset = int(puff_radius * 0.9)
-        puff_centers.append((center[0] - hair_width // 2 - side_offset // 2, hair_center_y + random.randint(-8, 2)))
-        puff_centers.append((center[0] + hair_width // 2 + side_offset // 2, hair_center_y + random.randint(-8, 2)))
+        puff_centers.append((center[0] - hair_width // 2 - side_offset // 2, hair_center_y + rng.randint(-8, 2)))
+        puff_centers.append((center[0] + hair_width // 2 + side_offset // 2, hair_center_y + rng.randint(-8, 2)))
         puff_centers.append((center[0] - int(puff_spacing * 1.5), hair_center_y - int(puff_radius * 0.6)))
         puff_centers.append((center[0] + int(puff_spacing * 1.5), hair_center_y - int(puff_radius * 0.6)))
         puff_centers.append((center[0], hair_center_y - int(puff_radius * 0.9)))
 
     for pc in puff_centers:
-        rr = int(puff_radius * (0.85 + (random.random() * 0.3)))
+        rr = int(puff_radius * (0.85 + (rng.random() * 0.3)))
         pygame.draw.circle(surface, hair_color_base, pc, rr)
 
     for pc in puff_centers:
@@ -1483,7 +3938,7 @@ class WaterGun(pygame.sprite.Sprite):
         self.pivot_y = int(bottom_y - 10)
         self.barrel_width = 100
         self.barrel_height = 24
-        self.image = pygame.Surface([self.barrel_width, self.barrel_height], pygame.SRCALPHA)
+        self.image = SURFACES.new((self.barrel_width, self.barrel_height))
         self.rect = self.image.get_rect(center=(self.center_x_base, bottom_y - self.barrel_height // 2))
         try:
             pygame.draw.rect(self.image, (30, 30, 30), (0, 0, self.barrel_width, self.barrel_height), 0, border_radius=6)
@@ -1493,12 +3948,14 @@ class WaterGun(pygame.sprite.Sprite):
             pygame.draw.rect(self.image, CARNIVAL_YELLOW, (6, 6, self.barrel_width - 12, self.barrel_height - 12), 2)
         self.is_spraying = False
         self.max_stream_width = 25
+        self.stream_width = self.max_stream_width
+        self.flicker_blue = OG_WATER_CYAN[2]
         self.hit_stream_x = float(center_x)
-        self.stream_image = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self.stream_rect = self.stream_image.get_rect(topleft=(0, 0))
-        self.particles = []
+        SURFACES.track(self, 'image')
         self.particle_sway_speed = 4.0
         self.particle_sway_amp = 6.0
+        self.particles = ParticleSystem(capacity=300, sway_speed=self.particle_sway_speed)
+        self.update_position(0.0)
 
     # UPDATE POSITION
     def update_position(self, dt):
@@ -1509,12 +3966,10 @@ class WaterGun(pygame.sprite.Sprite):
 
     # UPDATE STREAM AND PARTICLES
     def update_stream(self, target_y, water_level_ratio, dt):
-        self.stream_image.fill((0, 0, 0, 0))
-        current_time_s = pygame.time.get_ticks() / 1000.0
         if self.is_spraying:
             min_width_ratio = 0.25
             current_width_ratio = min_width_ratio + water_level_ratio * (1.0 - min_width_ratio)
-            stream_width = max(2, int(self.max_stream_width * current_width_ratio))
+            self.stream_width = max(2, int(self.max_stream_width * current_width_ratio))
             dy_target = (self.pivot_y - target_y)
             dy_total = (self.pivot_y - self.current_stream_y)
             if abs(dy_total) < 1e-3 or abs(dy_target) < 1e-3:
@@ -1523,55 +3978,48 @@ class WaterGun(pygame.sprite.Sprite):
                 t = max(0.0, min(1.0, dy_target / dy_total))
                 hit_x = float(self.pivot_x + t * (self.current_stream_x - self.pivot_x))
             self.hit_stream_x += (hit_x - self.hit_stream_x) * min(1.0, dt * 12.0)
-            flicker_blue = min(255, max(140, OG_WATER_CYAN[2] + random.randint(-20, 20)))
-            water_color = (OG_WATER_CYAN[0], OG_WATER_CYAN[1], flicker_blue, 200)
-            pygame.draw.line(
-                self.stream_image,
-                water_color,
-                (int(self.pivot_x), int(self.pivot_y)),
-                (int(self.current_stream_x), int(self.current_stream_y)),
-                stream_width
-            )
-            glow_color = (OG_WATER_CYAN[0], OG_WATER_CYAN[1], flicker_blue, 60)
-            for i in range(1, 4):
-                pygame.draw.line(
-                    self.stream_image,
-                    glow_color,
-                    (int(self.pivot_x), int(self.pivot_y)),
-                    (int(self.current_stream_x), int(self.current_stream_y)),
-                    max(1, stream_width + i * 3)
-                )
+            self.flicker_blue = min(255, max(140, OG_WATER_CYAN[2] + random.randint(-20, 20)))
             for i in range(6):
                 frac = random.random()
                 px = int(self.pivot_x + (self.current_stream_x - self.pivot_x) * frac + random.uniform(-6, 6))
                 py = int(self.pivot_y + (self.current_stream_y - self.pivot_y) * frac + random.uniform(-6, 6))
-                size = random.randint(2, 5)
-                life = random.uniform(0.9, 1.6)
-                phase = random.random() * math.pi * 2
-                sway_amp = random.uniform(2.0, self.particle_sway_amp)
-                vy = random.uniform(20, 80)
-                self.particles.append({'x': px, 'y': py, 'size': size, 'life': life, 'age': 0.0, 'vy': vy, 'phase': phase, 'sway_amp': sway_amp})
-            MAX_PARTICLES = 300
-            if len(self.particles) > MAX_PARTICLES:
-                del self.particles[0:len(self.particles) - MAX_PARTICLES]
-        for p in list(self.particles):
-            p['age'] += dt
-            if p['age'] >= p['life']:
-                try:
-                    self.particles.remove(p)
-                except ValueError:
-                    pass
-                continue
-            alpha = int(255 * (1.0 - (p['age'] / p['life'])))
-            p['y'] += p.get('vy', 30) * dt
-            sway = math.sin(current_time_s * self.particle_sway_speed + p.get('phase', 0.0)) * p.get('sway_amp', 2.0)
-            p['x'] += sway * dt * 30.0
-            pygame.draw.circle(self.stream_image, (OG_WATER_CYAN[0], OG_WATER_CYAN[1], OG_WATER_CYAN[2], alpha), (int(p['x']), int(p['y'])), p['size'])
-
-    # DRAW STREAM TO SURFACE
+                self.particles.emit(
+                    px, py,
+                    vy=random.uniform(20, 80),
+                    life=random.uniform(0.9, 1.6),
+                    size=random.randint(2, 5),
+                    color=OG_WATER_CYAN,
+                    phase=random.random() * math.pi * 2,
+                    sway_amp=random.uniform(2.0, self.particle_sway_amp),
+                )
+        self.particles.update(dt)
+
+    # STREAM QUAD (RENDER-TIME POSITION)
+    def _stream_polygon(self, width: int):
+        sx, sy = float(self.pivot_x), float(self.pivot_y)
+        ex, ey = self.current_stream_x, self.current_stream_y
+        length = math.hypot(ex - sx, ey - sy) or 1.0
+        nx = -(ey - sy) / length * width / 2.0
+        ny = (ex - sx) / length * width / 2.0
+        return [(int(round(sx + nx)), int(round(sy + ny))), (int(round(ex + nx)), int(round(ey + ny))),
+                (int(round(ex - nx)), int(round(ey - ny))), (int(round(sx - nx)), int(round(sy - ny)))]
+
+    # DRAW STREAM TO SURFACE (BLENDED STRAIGHT ONTO THE TARGET)
     def draw_stream(self, surface):
-        if self.is_spraying or self.particles:
-            surface.blit(self.stream_image, self.stream_rect)
+        if self.is_spraying:
+            glow_color = (OG_WATER_CYAN[0], OG_WATER_CYAN[1], self.flicker_blue, 60)
+            points = self._stream_polygon(max(1, self.stream_width + 9))
+            if _HAVE_GFXDRAW:
+                pygame.gfxdraw.filled_polygon(surface, points, glow_color)
+            else:
+                xs = [x for x, _ in points]
+                ys = [y for _, y in points]
+                box = pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+                layer = SURFACES.new(box.size)
+                layer.fill((0, 0, 0, 0))
+                pygame.draw.polygon(layer, glow_color, [(x - box.x, y - box.y) for x, y in points])
+                SURFACES.blit(surface, layer, box.topleft)
+        self.particles.draw(surface)
 
 # CLOWN SPLASH MINI-GAME CLASS
 class ClownSplashMiniGame:
@@ -1587,6 +4035,7 @@ class ClownSplashMiniGame:
             SCREEN_HEIGHT - 2 * PLAY_AREA_MARGIN
         )
         self.PLAY_AREA_CENTER_X = self.PLAY_AREA_RECT.centerx
+        self.background = StaticLayer(self._build_background)
         self.reset()
 
     # RESET GAME
@@ -1613,6 +4062,7 @@ class ClownSplashMiniGame:
         self.space_down = False
         self.is_in_cooldown = False
         self.last_attempt_spray_time = 0.0
+        self.spray_sound_on = False
         self.tank_x = self.PLAY_AREA_RECT.left + 20
         self.tank_width = 40
         self.tank_height = 200
@@ -1630,11 +4080,10 @@ class ClownSplashMiniGame:
             x = int(start_x + (i * clown_spacing))
             clown = Clown(x, self.clown_target_y, size=84)
             sprite = pygame.sprite.Sprite()
-            sprite.image = pygame.Surface((clown.visual_size, clown.visual_size), pygame.SRCALPHA)
-            draw_clown_face_centered(sprite.image, clown.clown_size, False, clown.visual_size, hair_puffs=clown.hair_puffs)
-            sprite.rect = sprite.image.get_rect(center=(clown.center_x, clown.center_y))
             sprite.clown_logic = clown
             sprite.clown_logic.reset()
+            sprite.image = clown.image
+            sprite.rect = sprite.image.get_rect(center=(clown.center_x, clown.center_y))
             sprite.marked_hit = False
             self.clown_targets.add(sprite)
 
@@ -1689,12 +4138,14 @@ class ClownSplashMiniGame:
         self.water_gun.update_position(dt)
         should_spray_attempt = self.space_down and not self.is_in_cooldown
         is_spraying_now = False
+        spray_held = False
         if should_spray_attempt:
             if self.water_level < (self.WATER_MAX * self.start_threshold_ratio):
                 self.message = f"Tank needs {int(self.start_threshold_ratio * 100)}% to start spraying!"
                 self.water_gun.is_spraying = False
             else:
                 held = (self.space_held_since is not None) and (current_time - self.space_held_since >= self.spray_charge_time)
+                spray_held = held and self.water_level > 0
                 if held and (current_time - self.last_attempt_spray_time > 0.06):
                     self.last_attempt_spray_time = current_time
                     if self.water_level > 0:
@@ -1702,10 +4153,6 @@ class ClownSplashMiniGame:
                         self.water_level -= consumption
                         self.water_level = max(0.0, self.water_level)
                         is_spraying_now = True
-                        try:
-                            self.sound_manager.play_water_spray(start=True)
-                        except Exception:
-                            pass
                         percent = int((self.water_level / self.WATER_MAX) * 100)
                         self.message = f"Spraying! Water: {percent}%"
                         clowns_being_hit_this_frame = []
@@ -1714,8 +4161,7 @@ class ClownSplashMiniGame:
                                 if abs(clown.rect.centerx - self.water_gun.hit_stream_x) < (clown.clown_logic.clown_size // 2 + 8):
                                     clown.clown_logic.mark_hit()
                                     clowns_being_hit_this_frame.append(clown)
-                                    clown.image.fill((0, 0, 0, 0))
-                                    draw_clown_face_centered(clown.image, clown.clown_logic.clown_size, True, clown.clown_logic.visual_size, hair_puffs=clown.clown_logic.hair_puffs)
+                                    clown.image = clown.clown_logic.image
                             except Exception:
                                 pass
                         if clowns_being_hit_this_frame and current_time - self.last_score_time >= HIT_SCORE_INTERVAL:
@@ -1725,22 +4171,17 @@ class ClownSplashMiniGame:
                             self.message = f"BULLSEYE! +{score_to_report} (Water: {percent}%)"
                         for clown in self.clown_targets:
                             if clown not in clowns_being_hit_this_frame:
-                                clown.image.fill((0, 0, 0, 0))
-                                draw_clown_face_centered(clown.image, clown.clown_logic.clown_size, False, clown.clown_logic.visual_size, hair_puffs=clown.clown_logic.hair_puffs)
+                                clown.image = clown.clown_logic.sprite(False)
                     if self.water_level <= 0.0 and is_spraying_now:
                         is_spraying_now = False
+                        spray_held = False
                         self.last_spray_time = current_time
                         self.is_in_cooldown = True
-                        try:
-                            self.sound_manager.play_water_spray(start=False)
-                        except Exception:
-                            pass
                         self.message = "Tank EMPTY! Cooldown..."
                         for clown in self.clown_targets:
                             try:
                                 clown.clown_logic.reset()
-                                clown.image.fill((0, 0, 0, 0))
-                                draw_clown_face_centered(clown.image, clown.clown_logic.clown_size, False, clown.clown_logic.visual_size, hair_puffs=clown.clown_logic.hair_puffs)
+                                clown.image = clown.clown_logic.image
                             except Exception:
                                 pass
         time_since_spray = current_time - self.last_spray_time
@@ -1759,9 +4200,10 @@ class ClownSplashMiniGame:
                 self.message = "Tank full. Hold SPACE to spray!"
             else:
                 self.message = "Press R to refill a portion of the tank."
-        if not is_spraying_now:
+        if spray_held != self.spray_sound_on:
+            self.spray_sound_on = spray_held
             try:
-                self.sound_manager.play_water_spray(start=False)
+                self.sound_manager.play_water_spray(start=spray_held)
             except Exception:
                 pass
         self.water_gun.is_spraying = is_spraying_now
@@ -1770,13 +4212,22 @@ class ClownSplashMiniGame:
         self.water_gun.update_stream(self.clown_target_y, water_ratio, dt)
         return score_to_report
 
+    # INTERPOLATED RENDER STATE
+    def interpolation_targets(self):
+        return [(self, 'water_level'), (self.water_gun, 'hit_stream_x'),
+                (self.water_gun, 'current_stream_x'), (self.water_gun, 'current_stream_y')]
+
+    # BUILD STATIC BACKGROUND
+    def _build_background(self, surf):
+        surf.fill(SPLASH_GREEN)
+
+        pygame.draw.rect(surf, BLACK, self.PLAY_AREA_RECT)
+        pygame.draw.rect(surf, CARNIVAL_RED, (self.PLAY_AREA_RECT.left, self.clown_target_y + 30, self.PLAY_AREA_RECT.width, 10))
+        pygame.draw.rect(surf, CARNIVAL_RED, (self.PLAY_AREA_RECT.left, self.PLAY_AREA_RECT.bottom - 70, self.PLAY_AREA_RECT.width, 70))
+
     # DRAW GAME
     def draw(self):
-        self.screen.fill(SPLASH_GREEN)
-
-        pygame.draw.rect(self.screen, BLACK, self.PLAY_AREA_RECT)
-        pygame.draw.rect(self.screen, CARNIVAL_RED, (self.PLAY_AREA_RECT.left, self.clown_target_y + 30, self.PLAY_AREA_RECT.width, 10))
-        pygame.draw.rect(self.screen, CARNIVAL_RED, (self.PLAY_AREA_RECT.left, self.PLAY_AREA_RECT.bottom - 70, self.PLAY_AREA_RECT.width, 70))
+        self.background.blit(self.screen, key=self.clown_target_y)
 
         tank_x, tank_y = self.tank_x, self.tank_y
         tank_width, tank_height = self.tank_width, self.tank_height
@@ -1804,22 +4255,21 @@ class ClownSplashMiniGame:
         threshold_y = tank_y + tank_height - int(self.start_threshold_ratio * tank_height)
         pygame.draw.line(self.screen, CARNIVAL_YELLOW, (tank_x - 6, threshold_y), (tank_x + tank_width + 6, threshold_y), 2)
 
-        label = self.small_font.render("WATER", True, BLACK)
-        self.screen.blit(label, (tank_x + tank_width // 2 - label.get_width() // 2, tank_y - 26))
+        label = render_text(self.small_font, "WATER", BLACK)
+        SURFACES.blit(self.screen, label, (tank_x + tank_width // 2 - label.get_width() // 2, tank_y - 26))
 
-        display_message = self.message.replace('**', '')
         max_w = SCREEN_WIDTH - 40
-        lines = wrap_text(self.font, display_message, max_w)
+        lines = TEXT_CACHE.wrap(self.font, self.message, max_w, markup=True)
         y = SCREEN_HEIGHT - 30 - (len(lines) - 1) * (self.font.get_linesize() // 1)
 
         for line in lines:
-            msg_text = self.font.render(line, True, UI_PLAYFUL)
-            self.screen.blit(msg_text, (SCREEN_WIDTH // 2 - msg_text.get_width() // 2, y))
+            msg_text = render_text(self.font, line, UI_PLAYFUL)
+            SURFACES.blit(self.screen, msg_text, (SCREEN_WIDTH // 2 - msg_text.get_width() // 2, y))
             y += msg_text.get_height() + 2
 
         self.water_gun.draw_stream(self.screen)
-        self.clown_targets.draw(self.screen)
-        self.screen.blit(self.water_gun.image, self.water_gun.rect)
+        SURFACES.draw_group(self.clown_targets, self.screen)
+        SURFACES.blit(self.screen, self.water_gun.image, self.water_gun.rect)
 
         reticle_color = UI_PLAYFUL if not ACCESSIBILITY_OPTIONS["reticle_alt"] else (255, 220, 180)
 
@@ -1841,6 +4291,7 @@ class ClownSplashMiniGame:
     # CLEANUP
     def cleanup(self):
         self.clown_targets.empty()
+        self.spray_sound_on = False
         try:
             self.sound_manager.play_water_spray(start=False)
         except Exception:
@@ -1852,8 +4303,8 @@ class Cup(pygame.sprite.Sprite):
     def __init__(self, x, y, size=160, has_ball=False):
         super().__init__()
         self.size = int(size)
-        self.image = pygame.Surface([self.size, self.size], pygame.SRCALPHA)
-        self.rect = self.image.get_rect(center=(int(x), int(y)))
+        self.rect = pygame.Rect(0, 0, self.size, self.size)
+        self.rect.center = (int(x), int(y))
         self.current_x = float(x)
         self.current_y = float(y)
         self.has_ball = bool(has_ball)
@@ -1862,37 +4313,48 @@ class Cup(pygame.sprite.Sprite):
         self.color = CARNIVAL_RED
         self.target_x = float(x)
         self.target_y = float(y)
-        self.start_time = 0.0
+        self.elapsed = 0.0
         self.duration = SHUFFLE_DURATION_MS / 1000.0
         self._draw_cup()
+        SURFACES.track(self, 'image')
 
     # DRAW CUP
     def _draw_cup(self):
-        self.image.fill((0, 0, 0, 0))
+        show_ball = self.is_revealed and self.has_ball
+        key = ('cup', self.size, tuple(self.color), show_ball)
+        self.image = SPRITE_BAKER.get(key, lambda: self._render(show_ball))
+
+    # RENDER CUP
+    def _render(self, show_ball):
+        surf = SURFACES.new((self.size, self.size))
+        surf.fill((0, 0, 0, 0))
         points = [
             (5, self.size),
             (self.size - 5, self.size),
             (self.size - 25, 20),
             (25, 20)
         ]
-        pygame.draw.polygon(self.image, self.color, points, 0)
-        pygame.draw.polygon(self.image, BLACK, points, 3)
-        if self.is_revealed and self.has_ball:
-            pygame.draw.circle(self.image, WHITE, (self.size // 2, self.size - 30), 18)
+        pygame.draw.polygon(surf, self.color, points, 0)
+        pygame.draw.polygon(surf, BLACK, points, 3)
+        if show_ball:
+            pygame.draw.circle(surf, WHITE, (self.size // 2, self.size - 30), 18)
+        return surf
 
     # SET TARGET
     def set_target(self, target_x, target_y):
+        if self.is_moving:
+            self.current_x, self.current_y = float(self.rect.centerx), float(self.rect.centery)
         self.target_x = float(target_x)
         self.target_y = float(target_y)
-        self.start_time = time.time()
+        self.elapsed = 0.0
         self.is_moving = True
         self.duration = SHUFFLE_DURATION_MS / 1000.0
 
-    # UPDATE CUP
-    def update(self):
+    # UPDATE CUP (SIMULATION TIME)
+    def update(self, dt=0.0):
         if self.is_moving:
-            elapsed = time.time() - self.start_time
-            progress = min(elapsed / self.duration, 1.0)
+            self.elapsed += dt
+            progress = min(self.elapsed / self.duration, 1.0)
             smooth_progress = 0.5 - 0.5 * math.cos(progress * math.pi)
             new_x = self.current_x + (self.target_x - self.current_x) * smooth_progress
             new_y = self.current_y
@@ -1920,6 +4382,8 @@ class ShellGameMiniGame:
             SCREEN_HEIGHT - 2 * PLAY_AREA_MARGIN
         )
         self.PLAY_AREA_CENTER_X = self.PLAY_AREA_RECT.centerx
+        self.dirty = DirtyRegionTracker()
+        self.background = StaticLayer(self._build_background)
         self.reset()
 
     # RESET SHELLGAME
@@ -1927,6 +4391,7 @@ class ShellGameMiniGame:
         self.state = "START_REVEAL"
         self.shuffle_count = 10
         self.current_shuffle = 0
+        self.shuffle_wait = 0.0
         self.message = "Get ready to watch closely!"
         self.shuffle_pairs = []
         pygame.time.set_timer(SHUFFLE_EVENT, 0)
@@ -1939,6 +4404,7 @@ class ShellGameMiniGame:
         self._setup_cups()
         self._initial_reveal_sequence()
         self._cups_sound_playing = False
+        self.dirty.invalidate()
 
     # SETUP CUPS
     def _setup_cups(self):
@@ -1973,7 +4439,8 @@ class ShellGameMiniGame:
             self._cups_sound_playing = True
         except Exception:
             self._cups_sound_playing = False
-        pygame.time.set_timer(SHUFFLE_EVENT, SHUFFLE_DURATION_MS + 100)
+        pygame.time.set_timer(SHUFFLE_EVENT, 0)
+        self.shuffle_wait = (SHUFFLE_DURATION_MS + SHUFFLE_GAP_MS) / 1000.0
 
     # GENERATE PAIRS
     def _generate_shuffle_pairs(self):
@@ -2041,8 +4508,6 @@ class ShellGameMiniGame:
         if event.type == SHUFFLE_EVENT:
             if self.state == "START_REVEAL":
                 self._start_shuffling()
-            elif self.state == "SHUFFLING":
-                self._do_one_shuffle()
             elif self.state == "GAME_OVER":
                 self.reset()
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -2050,17 +4515,23 @@ class ShellGameMiniGame:
                 score_change = self._check_choice(event.pos)
         return score_change
 
-    # UPDATE
+    # UPDATE (SHUFFLE CADENCE IN SIMULATION TIME)
     def update(self, dt):
-        self.all_sprites.update()
+        self.all_sprites.update(dt)
         any_moving = any(cup.is_moving for cup in self.cups)
-        if any_moving and not self._cups_sound_playing:
+        if self.state == "SHUFFLING" and not any_moving:
+            self.shuffle_wait -= dt
+            if self.shuffle_wait <= 0.0:
+                self._do_one_shuffle()
+                self.shuffle_wait = SHUFFLE_GAP_MS / 1000.0
+        cups_active = self.state == "SHUFFLING" or any(cup.is_moving for cup in self.cups)
+        if cups_active and not self._cups_sound_playing:
             try:
                 self.sound_manager.start_cups()
                 self._cups_sound_playing = True
             except Exception:
                 self._cups_sound_playing = False
-        if not any_moving and self._cups_sound_playing:
+        if not cups_active and self._cups_sound_playing:
             try:
                 self.sound_manager.stop_cups()
             except Exception:
@@ -2068,14 +4539,25 @@ class ShellGameMiniGame:
             self._cups_sound_playing = False
         return 0
 
+    # INTERPOLATED RENDER STATE
+    def interpolation_targets(self):
+        return [(cup.rect, 'center') for cup in self.cups]
+
+    # BUILD STATIC BACKGROUND
+    def _build_background(self, surf):
+        surf.fill(BLACK)
+        table_rect = pygame.Rect(self.PLAY_AREA_RECT.left, self.PLAY_AREA_RECT.top + 100, self.PLAY_AREA_RECT.width, self.PLAY_AREA_RECT.height - 100)
+        pygame.draw.rect(surf, OG_BROWN, table_rect)
+
     # DRAW
     def draw(self):
-        self.screen.fill(BLACK)
-        table_rect = pygame.Rect(self.PLAY_AREA_RECT.left, self.PLAY_AREA_RECT.top + 100, self.PLAY_AREA_RECT.width, self.PLAY_AREA_RECT.height - 100)
-        pygame.draw.rect(self.screen, OG_BROWN, table_rect)
-        msg_text = self.font.render(self.message, True, UI_PLAYFUL)
-        self.screen.blit(msg_text, (SCREEN_WIDTH // 2 - msg_text.get_width() // 2, 80))
-        self.all_sprites.draw(self.screen)
+        self.background.blit(self.screen)
+        msg_text = render_text(self.font, self.message, UI_PLAYFUL)
+        msg_rect = SURFACES.blit(self.screen, msg_text, (SCREEN_WIDTH // 2 - msg_text.get_width() // 2, 80))
+        self.dirty.mark('message', msg_rect, self.message)
+        SURFACES.draw_group(self.all_sprites, self.screen)
+        for cup in self.cups:
+            self.dirty.mark(('cup', id(cup)), cup.rect, cup.is_revealed)
 
     # CLEANUP
     def cleanup(self):
@@ -2095,25 +4577,32 @@ class WhackTarget(pygame.sprite.Sprite):
         super().__init__()
         self.size = int(size)
         self.surface_size = self.size + 36
-        self.image = pygame.Surface((self.surface_size, self.surface_size), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(center=(int(x), int(y)))
+        self.rect = pygame.Rect(0, 0, self.surface_size, self.surface_size)
+        self.rect.center = (int(x), int(y))
         self.visible = False
         self.pop_time = 0.0
         self.lifetime = 1.2
         self.clown = Clown(self.rect.centerx, self.rect.centery, size=self.size - 10)
         self._redraw()
+        SURFACES.track(self, 'image')
 
     # REDRAW
     def _redraw(self):
-        self.image.fill((0, 0, 0, 0))
+        key = ('whack_target', self.size, self.visible, self.clown.hair_seed)
+        self.image = SPRITE_BAKER.get(key, self._render)
+
+    # RENDER TARGET
+    def _render(self):
+        surf = SURFACES.new((self.surface_size, self.surface_size))
+        surf.fill((0, 0, 0, 0))
         hole_h = int(self.size * 0.4)
         hole_rect = pygame.Rect(0, self.surface_size - hole_h, self.surface_size, hole_h)
-        pygame.draw.ellipse(self.image, (40, 40, 40), hole_rect)
+        pygame.draw.ellipse(surf, (40, 40, 40), hole_rect)
         if self.visible:
-            clown_surf = pygame.Surface((self.clown.visual_size, self.clown.visual_size), pygame.SRCALPHA)
-            draw_clown_face_centered(clown_surf, self.clown.clown_size, False, self.clown.visual_size, hair_puffs=self.clown.hair_puffs)
+            clown_surf = self.clown.sprite(False)
             pos = (self.surface_size // 2 - clown_surf.get_width() // 2, self.surface_size // 2 - clown_surf.get_height() // 2 - 6)
-            self.image.blit(clown_surf, pos)
+            surf.blit(clown_surf, pos)
+        return surf
 
     # POP
     def pop(self, lifetime=1.2):
@@ -2152,11 +4641,13 @@ class WhackAMoleGame:
             SCREEN_WIDTH - 2 * PLAY_AREA_MARGIN,
             SCREEN_HEIGHT - 2 * PLAY_AREA_MARGIN
         )
+        self.dirty = DirtyRegionTracker()
         self.reset()
 
     # RESET
     def reset(self):
         self.message = "Whack the clown! Only one appears at a time."
+        self.dirty.invalidate()
         self.rows = 4
         self.cols = 3
         self.hole_spacing_x = (self.PLAY_AREA_RECT.width) // (self.cols + 1)
@@ -2232,23 +4723,29 @@ class WhackAMoleGame:
 
         pygame.draw.rect(self.screen, BLACK, self.PLAY_AREA_RECT)
 
-        title = self.font.render("WHACK-A-CLOWN", True, UI_PLAYFUL)
-        self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 60))
+        title = render_text(self.font, "WHACK-A-CLOWN", UI_PLAYFUL)
+        SURFACES.blit(self.screen, title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 60))
 
-        for t in self.targets:
-            self.screen.blit(t.image, t.rect.topleft)
+        for i, t in enumerate(self.targets):
+            SURFACES.blit(self.screen, t.image, t.rect.topleft)
+            self.dirty.mark(('target', i), t.rect, t.visible)
 
         time_left = max(0, int(self.duration - (time.time() - self.time_started))) if not self.round_over else 0
-        hud = self.small_font.render(f"Time: {time_left}s   Hits: {self.hits}   Misses: {self.misses}", True, UI_PLAYFUL)
-        self.screen.blit(hud, (10, 10))
+        hud_text = f"Time: {time_left}s   Hits: {self.hits}   Misses: {self.misses}"
+        hud = render_text(self.small_font, hud_text, UI_PLAYFUL)
+        hud_rect = SURFACES.blit(self.screen, hud, (10, 10))
+        self.dirty.mark('hud', hud_rect, hud_text)
 
         lines = wrap_text(self.font, self.message, SCREEN_WIDTH - 60)
         y = SCREEN_HEIGHT - 60 - (len(lines) - 1) * (self.font.get_linesize() // 1)
+        msg_rect = pygame.Rect(SCREEN_WIDTH // 2, y, 0, 0)
         
         for line in lines:
-            t_surf = self.font.render(line, True, UI_PLAYFUL)
-            self.screen.blit(t_surf, (SCREEN_WIDTH // 2 - t_surf.get_width() // 2, y))
+            t_surf = render_text(self.font, line, UI_PLAYFUL)
+            line_rect = SURFACES.blit(self.screen, t_surf, (SCREEN_WIDTH // 2 - t_surf.get_width() // 2, y))
+            msg_rect.union_ip(line_rect)
             y += t_surf.get_height() + 2
+        self.dirty.mark('message', msg_rect, self.message)
 
     # CLEANUP
     def cleanup(self):
@@ -2259,8 +4756,10 @@ class WhackAMoleGame:
 class ArcadeManager:
     # MANAGER INIT
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
+        self.display = self._open_display((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = self.display
+        SURFACES.check_display()
+        self.clock = FrameScheduler(vsync=self.vsync_active)
         self.running = True
         self.title_font = safe_font(size=52)
         self.header_font = safe_font(size=34)
@@ -2277,11 +4776,19 @@ class ArcadeManager:
             STATE_SHELLGAME: 0,
             STATE_WHACK: 0,
         }
+        self.journal_seq = 0
         self._load_scores()
         self.prize_unlocked = {}
         self._load_prizes()
         self.game_unlocked = {}
         self._load_unlocks()
+        self.journal = ScoreJournal(JOURNAL_FILE if JOURNAL_ENABLED else None, self._write_snapshot, seq=self.journal_seq)
+        self._replay_journal(self.journal.open())
+        self.profiles = ProfileStore(PROFILE_DB_FILE if PROFILE_STORE_ENABLED else None)
+        # READ MODEL OF FINISHED GAMES, PURCHASES AND UNLOCKS (NO POINT BALANCE)
+        self.player_id = self.profiles.player_id(DEFAULT_PLAYER_NAME)
+        self.profiles.import_legacy(self.player_id, SCORES_FILE, PRIZE_STATE_FILE, UNLOCK_STATE_FILE)
+        self.leaderboard = {}
         self.state = STATE_MENU
         self.button_rects = {}
         self.stats_button_rect = pygame.Rect(0, 0, 0, 0)
@@ -2307,6 +4814,8 @@ class ArcadeManager:
         self.settings = {
             "slow_game": ACCESSIBILITY_OPTIONS["slow_game"],
             "monochrome": ACCESSIBILITY_OPTIONS["monochrome"],
+            "colorblind_mode": DEFAULT_COLORBLIND_MODE,
+            "scanlines": DEFAULT_SCANLINES,
             "mute_audio": ACCESSIBILITY_OPTIONS["mute"],
             "reticle_alt": ACCESSIBILITY_OPTIONS["reticle_alt"],
             "fps_in_settings": False,
@@ -2323,6 +4832,22 @@ class ArcadeManager:
         self.modal_target = None
         self.settings_toggle_rects = []
         self._menu_last_hovered = None
+        self.post_process = PostProcessPipeline()
+        self._sync_post_filters()
+        self.fixed_timestep = FIXED_TIMESTEP
+        self.sim_step = 1.0 / SIMULATION_HZ
+        self._sim_accumulator = 0.0
+        self.sim_steps_last_frame = 0
+        self.render_alpha = 1.0
+        self.interpolator = RenderInterpolator()
+        self.idle_redraw = IDLE_REDRAW
+        self.idle_states = (STATE_MENU, STATE_STATS, STATE_SETTINGS, STATE_PRIZES)
+        self.needs_redraw = True
+        self._last_drawn_state = None
+        self.window_focused = True
+        self.window_minimized = False
+        self.profiler = None
+        self.menu_background = StaticLayer(self._build_menu_background)
         try:
             self.sound_manager.set_mute(self.settings["mute_audio"])
         except Exception:
@@ -2331,38 +4856,38 @@ class ArcadeManager:
         self.timer_active = False
         self.timer_remaining = 0.0
         self.timed_games_played = 0
-        self.timed_game_records = []
+        self.timed_game_records = TimedRecordRing(TIMED_RECORD_CAPACITY, TIMED_ROLLUP_FILE if TIMED_ROLLUP_ENABLED else None)
+        self.dirty_rect_mode = DIRTY_RECT_RENDERING
+        self.hud_dirty = DirtyRegionTracker()
+        self._last_present_key = None
         try:
             self.sound_manager.play_background_music()
         except Exception:
             pass
 
         self._button_hovered = {}
-        self._selection_sound = None
-        try:
-            sel_candidates = [
-                resource_path(os.path.join("Sounds", "Selection.mp3")),
-                resource_path(os.path.join("Sounds", "selection.mp3")),
-                os.path.join("Sounds", "Selection.mp3"),
-                os.path.join("Sounds", "selection.mp3"),
-            ]
-            sel_path = None
-            for cand in sel_candidates:
-                try:
-                    if cand and os.path.isfile(cand):
-                        sel_path = cand
-                        break
-                except Exception:
-                    pass
-            if sel_path and _HAVE_PYGAME:
-                try:
-                    self._selection_sound = pygame.mixer.Sound(sel_path)
-                except Exception:
-                    self._selection_sound = None
-            else:
-                self._selection_sound = None
-        except Exception:
-            self._selection_sound = None
+        if PROFILER_ENABLED:
+            self.set_profiler(True)
+        self.profile_capture = None
+        self._capture_writers = []
+        if PROFILE_CAPTURE_MODE:
+            self.start_profile_capture(PROFILE_CAPTURE_MODE)
+
+    # START PROFILE CAPTURE
+    def start_profile_capture(self, mode: str = 'sample', frames: int = PROFILE_CAPTURE_FRAMES):
+        if self.profile_capture is not None:
+            return
+        self.profile_capture = ProfileCapture(mode, frames=frames)
+        self.profile_capture.start(STATE_NAMES.get(self.state, str(self.state)))
+
+    # STOP PROFILE CAPTURE
+    def stop_profile_capture(self):
+        capture = self.profile_capture
+        if capture is None:
+            return
+        self.profile_capture = None
+        self._capture_writers = [w for w in self._capture_writers if w.is_alive()]
+        self._capture_writers.append(capture.finish())
 
     # LOAD SCORES
     def _load_scores(self):
@@ -2371,14 +4896,65 @@ class ArcadeManager:
                 data = json.load(f)
                 for k in self.game_high_scores.keys():
                     self.game_high_scores[k] = data.get(str(k), 0)
+                self.total_score = int(data.get('points', 0))
+                self.journal_seq = int(data.get('journal_seq', 0))
         except Exception:
             pass
 
-    # SAVE SCORES
-    def _save_scores(self):
+    # REPLAY JOURNAL EVENTS NEWER THAN THE SNAPSHOT
+    def _replay_journal(self, events):
+        for seq, kind, game, value, text in events:
+            if seq <= self.journal_seq:
+                continue
+            if kind == JOURNAL_POINTS:
+                self.total_score += value
+            elif kind == JOURNAL_HIGH_SCORE:
+                if game in self.game_high_scores and value > self.game_high_scores[game]:
+                    self.game_high_scores[game] = value
+            elif kind == JOURNAL_PRIZE:
+                self.prize_unlocked[text] = True
+                self.total_score -= value
+            elif kind == JOURNAL_UNLOCK:
+                self.game_unlocked[str(game)] = True
+                self.total_score -= value
+            self.journal_seq = seq
+
+    # CURRENT PERSISTENT STATE
+    def _snapshot(self) -> dict:
+        scores = {str(k): v for k, v in self.game_high_scores.items()}
+        scores['points'] = self.total_score
+        scores['journal_seq'] = self.journal.seq
+        return {'scores': scores, 'prizes': dict(self.prize_unlocked), 'unlocks': dict(self.game_unlocked)}
+
+    # WRITE SNAPSHOT FILES (SCORES LAST, THEY CARRY THE JOURNAL POSITION)
+    def _write_snapshot(self, snapshot: dict):
+        PERSISTENCE.save_group((
+            (PRIZE_STATE_FILE, snapshot['prizes']),
+            (UNLOCK_STATE_FILE, snapshot['unlocks']),
+            (SCORES_FILE, snapshot['scores']),
+        ), durable=True)
+        PERSISTENCE.flush()
+
+    # AWARD POINTS
+    def _award_points(self, points: int):
+        self.total_score += points
+        self.current_game_score += points
+        self.journal.append(JOURNAL_POINTS, self.state, points)
+
+    # RECORD FINISHED GAME AND HIGH SCORE
+    def _record_game_result(self, game_state: int, score: int):
+        if score > 0:
+            self.profiles.record_score(self.player_id, game_state, score)
+        if game_state in self.game_high_scores and score > self.game_high_scores[game_state]:
+            self.game_high_scores[game_state] = score
+            self.journal.append(JOURNAL_HIGH_SCORE, game_state, score)
+
+    # SAVE FRAME PACING SUMMARY
+    def _save_pacing_log(self):
+        if not FRAME_PACING_LOG:
+            return
         try:
-            data = {str(k): v for k, v in self.game_high_scores.items()}
-            atomic_write_json(SCORES_FILE, data)
+            PERSISTENCE.save(FRAME_PACING_LOG, self.clock.summary())
         except Exception:
             pass
 
@@ -2396,7 +4972,7 @@ class ArcadeManager:
     # SAVE PRIZES
     def _save_prizes(self):
         try:
-            atomic_write_json(PRIZE_STATE_FILE, self.prize_unlocked)
+            PERSISTENCE.save(PRIZE_STATE_FILE, dict(self.prize_unlocked))
         except Exception:
             pass
 
@@ -2414,7 +4990,7 @@ class ArcadeManager:
     # SAVE UNLOCKS
     def _save_unlocks(self):
         try:
-            atomic_write_json(UNLOCK_STATE_FILE, self.game_unlocked)
+            PERSISTENCE.save(UNLOCK_STATE_FILE, dict(self.game_unlocked))
         except Exception:
             pass
 
@@ -2428,13 +5004,46 @@ class ArcadeManager:
         ACCESSIBILITY_OPTIONS["monochrome"] = self.settings["monochrome"]
         ACCESSIBILITY_OPTIONS["reticle_alt"] = self.settings["reticle_alt"]
         self.show_fps = bool(self.settings.get("fps_in_settings", False))
+        self._sync_post_filters()
+        self.invalidate()
+
+    # CYCLE COLOUR-BLIND SIMULATION MODE
+    def _cycle_colorblind_mode(self):
+        current = self.settings.get("colorblind_mode")
+        index = COLORBLIND_MODES.index(current) if current in COLORBLIND_MODES else 0
+        self.settings["colorblind_mode"] = COLORBLIND_MODES[(index + 1) % len(COLORBLIND_MODES)]
+        self._apply_settings()
+
+    # SYNC POST-PROCESS FILTERS
+    def _sync_post_filters(self):
+        filters = []
+        cb_matrix = COLORBLIND_MATRICES.get(self.settings.get("colorblind_mode"))
+        if cb_matrix is not None:
+            filters.append(ColorMatrixFilter(self.settings["colorblind_mode"], cb_matrix))
+        if self.settings.get("monochrome", False):
+            filters.append(ColorMatrixFilter("grayscale", GRAYSCALE_MATRIX))
+        if self.settings.get("scanlines", False):
+            filters.append(ScanlineFilter())
+        self.post_process.set_filters(filters)
 
     # HANDLE INPUT
-    def _handle_input(self):
-        for event in pygame.event.get():
+    def _handle_input(self, pending=None):
+        events = pygame.event.get()
+        if pending is not None:
+            events.insert(0, pending)
+        for event in events:
+            self.needs_redraw = True
+            self._note_window_event(event)
             if event.type == pygame.QUIT:
                 self.running = False
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    self.set_profiler(self.profiler is None)
+                if event.key == pygame.K_F4:
+                    if self.profile_capture is not None:
+                        self.stop_profile_capture()
+                    else:
+                        self.start_profile_capture('cprofile' if event.mod & pygame.KMOD_SHIFT else 'sample')
                 if event.key == pygame.K_ESCAPE:
                     if self.modal_active:
                         self.modal_active = False
@@ -2444,9 +5053,7 @@ class ArcadeManager:
                         self.modal_target = None
                         continue
                     if self.state != STATE_MENU and self.state != STATE_STATS and self.state != STATE_SETTINGS:
-                        game_state = self.state
-                        if game_state in self.game_high_scores and self.current_game_score > self.game_high_scores[game_state]:
-                            self.game_high_scores[game_state] = self.current_game_score
+                        self._record_game_result(self.state, self.current_game_score)
                         self.current_game_score = 0
                         current_game = self.games.get(self.state)
                         if current_game:
@@ -2528,7 +5135,7 @@ class ArcadeManager:
                     mpos = event.pos
                     if hasattr(self, 'settings_toggle_rects'):
                         toggles = self.settings_toggle_rects
-                        if toggles and len(toggles) >= 6:
+                        if toggles and len(toggles) >= 8:
                             if toggles[0].collidepoint(mpos):
                                 self.settings["slow_game"] = not self.settings["slow_game"]
                                 self._apply_settings()
@@ -2547,6 +5154,11 @@ class ArcadeManager:
                             elif toggles[5].collidepoint(mpos):
                                 self.settings["timer_enabled"] = not self.settings["timer_enabled"]
                                 self._apply_settings()
+                            elif toggles[6].collidepoint(mpos):
+                                self._cycle_colorblind_mode()
+                            elif toggles[7].collidepoint(mpos):
+                                self.settings["scanlines"] = not self.settings["scanlines"]
+                                self._apply_settings()
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_1:
                         self.settings["slow_game"] = not self.settings["slow_game"]
@@ -2566,6 +5178,11 @@ class ArcadeManager:
                     elif event.key == pygame.K_6:
                         self.settings["timer_enabled"] = not self.settings["timer_enabled"]
                         self._apply_settings()
+                    elif event.key == pygame.K_7:
+                        self._cycle_colorblind_mode()
+                    elif event.key == pygame.K_8:
+                        self.settings["scanlines"] = not self.settings["scanlines"]
+                        self._apply_settings()
             elif self.state == STATE_PRIZES:
                 prize_screen = self.games.get(STATE_PRIZES)
                 if prize_screen:
@@ -2573,8 +5190,7 @@ class ArcadeManager:
             elif self.state in self.games:
                 score_change = self.games[self.state].handle_input(event)
                 if score_change > 0:
-                    self.total_score += score_change
-                    self.current_game_score += score_change
+                    self._award_points(score_change)
 
     # CHECK UNLOCK
     def _is_game_unlocked(self, state_id: int) -> bool:
@@ -2598,6 +5214,8 @@ class ArcadeManager:
         if self.total_score >= cost:
             self.total_score -= cost
             self.game_unlocked[str(state_id)] = True
+            self.journal.append(JOURNAL_UNLOCK, state_id, cost)
+            self.profiles.record_unlock(self.player_id, state_id)
             self._save_unlocks()
             self.modal_message = f"{self.game_names.get(state_id)} unlocked! Enjoy the game."
             self.modal_buttons = {'cancel': pygame.Rect(SCREEN_WIDTH // 2 - 60, SCREEN_HEIGHT // 2 + 28, 120, 36)}
@@ -2624,12 +5242,11 @@ class ArcadeManager:
                 if self.timer_remaining <= 0.0:
                     final_score = self.current_game_score
                     try:
-                        if self.state in self.game_high_scores and final_score > self.game_high_scores[self.state]:
-                            self.game_high_scores[self.state] = final_score
+                        self._record_game_result(self.state, final_score)
                     except Exception:
                         pass
-                    record = {'game': self.state, 'score': int(final_score), 'timestamp': time.time()}
-                    self.timed_game_records.append(record)
+                    self.timed_game_records.append(self.state, int(final_score), time.time())
+                    self.timed_game_records.save()
                     self.timed_games_played += 1
                     current_game = self.games.get(self.state)
                     if current_game:
@@ -2646,69 +5263,158 @@ class ArcadeManager:
                     return
             score_change = self.games[self.state].update(scaled_dt)
             if score_change > 0:
-                self.total_score += score_change
-                self.current_game_score += score_change
+                self._award_points(score_change)
         if self.state == STATE_PRIZES:
             prize_game = self.games.get(STATE_PRIZES)
             if prize_game:
                 prize_game.unlocked = self.prize_unlocked
                 prize_game.update(scaled_dt)
 
-    # DRAW MAIN MENU
-    def _draw_menu(self):
-        self.screen.fill(MENU_DARK_BLUE)
-        stripe_width = 40
-        for i in range(0, SCREEN_WIDTH + stripe_width, stripe_width):
-            color = CARNIVAL_RED if (i // stripe_width) % 2 == 0 else WHITE
-            pygame.draw.rect(self.screen, color, (i, 0, stripe_width, SCREEN_HEIGHT))
+    # REQUEST A REDRAW
+    def invalidate(self):
+        self.needs_redraw = True
+
+    # RENDERING PAUSED (FOCUS LOST OR MINIMIZED)
+    @property
+    def render_paused(self) -> bool:
+        return self.window_minimized or (PAUSE_ON_FOCUS_LOSS and not self.window_focused)
+
+    # TRACK WINDOW FOCUS AND VISIBILITY
+    def _note_window_event(self, event):
+        etype = event.type
+        if etype == getattr(pygame, 'WINDOWFOCUSLOST', None):
+            self.window_focused = False
+        elif etype == getattr(pygame, 'WINDOWFOCUSGAINED', None):
+            self.window_focused = True
+        elif etype in (getattr(pygame, 'WINDOWMINIMIZED', None), getattr(pygame, 'WINDOWHIDDEN', None)):
+            self.window_minimized = True
+        elif etype in (getattr(pygame, 'WINDOWRESTORED', None), getattr(pygame, 'WINDOWSHOWN', None),
+                       getattr(pygame, 'WINDOWMAXIMIZED', None)):
+            self.window_minimized = False
+        else:
+            return
+        self.sound_manager.set_suspended(self.render_paused)
+        self._last_present_key = None
+        self.invalidate()
+
+    # IDLE UNTIL AN EVENT ARRIVES
+    def _should_idle(self) -> bool:
+        if self.render_paused:
+            return True
+        return (self.idle_redraw and self.state in self.idle_states
+                and not self.needs_redraw and self.state == self._last_drawn_state)
+
+    # FIXED TIMESTEP TOGGLE
+    def set_fixed_timestep(self, enabled: bool, hz: Optional[int] = None):
+        self.fixed_timestep = bool(enabled)
+        if hz:
+            self.sim_step = 1.0 / max(1, int(hz))
+        self._sim_accumulator = 0.0
+        self.render_alpha = 1.0
+        self.interpolator.reset()
+
+    # INTERPOLATION TARGETS FOR ACTIVE SCENE
+    def _interpolation_targets(self):
+        game = self.games.get(self.state)
+        getter = getattr(game, 'interpolation_targets', None)
+        if getter is None:
+            return []
+        try:
+            return getter()
+        except Exception:
+            return []
+
+    # ADVANCE SIMULATION (VARIABLE OR FIXED STEP)
+    def _advance_simulation(self, dt):
+        if not self.fixed_timestep:
+            self.sim_steps_last_frame = 1
+            self.render_alpha = 1.0
+            self._update_state(dt)
+            return
+        self._sim_accumulator += max(0.0, min(dt, MAX_FRAME_TIME))
+        steps = 0
+        while self._sim_accumulator >= self.sim_step and steps < MAX_CATCHUP_STEPS:
+            state_before = self.state
+            self.interpolator.capture(self._interpolation_targets())
+            self._update_state(self.sim_step)
+            self._sim_accumulator -= self.sim_step
+            steps += 1
+            if self.state != state_before:
+                self.interpolator.reset()
+        if steps >= MAX_CATCHUP_STEPS:
+            self._sim_accumulator %= self.sim_step
+        self.sim_steps_last_frame = steps
+        self.render_alpha = self._sim_accumulator / self.sim_step
+
+    # MENU OVERLAY RECT
+    def _menu_overlay_rect(self):
         overlay_width = 480
         overlay_height = 560
-        overlay_rect = pygame.Rect(
+        return pygame.Rect(
             SCREEN_WIDTH // 2 - overlay_width // 2,
             70,
             overlay_width,
             overlay_height
         )
-        draw_rounded_box(self.screen, overlay_rect, fill_color=(25, 35, 50), border_color=CARNIVAL_YELLOW, border_thickness=5, radius=26)
-        title_surf = self.title_font.render("JAY'S CARNIVAL ARCADE", True, CARNIVAL_YELLOW)
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 58))
-        self.screen.blit(title_surf, title_rect)
+
+    # MENU SIDE BUTTON RECTS
+    def _menu_side_rects(self):
         square_size = 46
         left_margin = 10
         stats_top = SCREEN_HEIGHT - PLAY_AREA_MARGIN - square_size - 10
+        settings_top = stats_top - square_size - 10
+        prize_top = settings_top - square_size - 10
         stats_button_rect = pygame.Rect(left_margin, stats_top, square_size, square_size)
-        draw_rounded_box(self.screen, stats_button_rect, fill_color=(25, 35, 50), border_color=CARNIVAL_YELLOW, border_thickness=3, radius=12)
+        settings_button_rect = pygame.Rect(left_margin, settings_top, square_size, square_size)
+        prize_button_rect = pygame.Rect(left_margin, prize_top, square_size, square_size)
+        return stats_button_rect, settings_button_rect, prize_button_rect
+
+    # BUILD MENU BACKGROUND LAYER
+    def _build_menu_background(self, surf):
+        surf.fill(MENU_DARK_BLUE)
+        stripe_width = 40
+        for i in range(0, SCREEN_WIDTH + stripe_width, stripe_width):
+            color = CARNIVAL_RED if (i // stripe_width) % 2 == 0 else WHITE
+            pygame.draw.rect(surf, color, (i, 0, stripe_width, SCREEN_HEIGHT))
+        overlay_rect = self._menu_overlay_rect()
+        draw_rounded_box(surf, overlay_rect, fill_color=(25, 35, 50), border_color=CARNIVAL_YELLOW, border_thickness=5, radius=26)
+        title_surf = self.title_font.render("JAY'S CARNIVAL ARCADE", True, CARNIVAL_YELLOW)
+        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 58))
+        surf.blit(title_surf, title_rect)
+        stats_button_rect, settings_button_rect, prize_button_rect = self._menu_side_rects()
+        square_size = stats_button_rect.width
+        draw_rounded_box(surf, stats_button_rect, fill_color=(25, 35, 50), border_color=CARNIVAL_YELLOW, border_thickness=3, radius=12)
         bar_w = 8
         gap = 6
         bar_left = stats_button_rect.left + 6
         base_y = stats_button_rect.top + square_size - 12
-        pygame.draw.rect(self.screen, UI_PLAYFUL, (bar_left, base_y - 6, bar_w, 6))
-        pygame.draw.rect(self.screen, UI_PLAYFUL, (bar_left + (bar_w + gap), base_y - 14, bar_w, 14))
-        pygame.draw.rect(self.screen, UI_PLAYFUL, (bar_left + 2 * (bar_w + gap), base_y - 22, bar_w, 22))
-        self.stats_button_rect = stats_button_rect
-        settings_top = stats_top - square_size - 10
-        settings_button_rect = pygame.Rect(left_margin, settings_top, square_size, square_size)
-        draw_rounded_box(self.screen, settings_button_rect, fill_color=(25, 35, 50), border_color=CARNIVAL_YELLOW, border_thickness=3, radius=12)
+        pygame.draw.rect(surf, UI_PLAYFUL, (bar_left, base_y - 6, bar_w, 6))
+        pygame.draw.rect(surf, UI_PLAYFUL, (bar_left + (bar_w + gap), base_y - 14, bar_w, 14))
+        pygame.draw.rect(surf, UI_PLAYFUL, (bar_left + 2 * (bar_w + gap), base_y - 22, bar_w, 22))
+        draw_rounded_box(surf, settings_button_rect, fill_color=(25, 35, 50), border_color=CARNIVAL_YELLOW, border_thickness=3, radius=12)
         gear_center = (settings_button_rect.left + square_size // 2, settings_button_rect.top + square_size // 2)
-        pygame.draw.circle(self.screen, UI_PLAYFUL, gear_center, 10)
+        pygame.draw.circle(surf, UI_PLAYFUL, gear_center, 10)
         tooth_w = 4
         tooth_h = 10
-        pygame.draw.rect(self.screen, UI_PLAYFUL, (gear_center[0] - tooth_w // 2, gear_center[1] - 20, tooth_w, tooth_h))
-        pygame.draw.rect(self.screen, UI_PLAYFUL, (gear_center[0] - tooth_w // 2, gear_center[1] + 10, tooth_w, tooth_h))
-        pygame.draw.rect(self.screen, UI_PLAYFUL, (gear_center[0] - 20, gear_center[1] - tooth_w // 2, tooth_h, tooth_w))
-        pygame.draw.rect(self.screen, UI_PLAYFUL, (gear_center[0] + 10, gear_center[1] - tooth_w // 2, tooth_h, tooth_w))
-        self.settings_button_rect = settings_button_rect
-        prize_top = settings_top - square_size - 10
-        prize_button_rect = pygame.Rect(left_margin, prize_top, square_size, square_size)
-        draw_rounded_box(self.screen, prize_button_rect, fill_color=(25, 35, 50), border_color=CARNIVAL_YELLOW, border_thickness=3, radius=12)
+        pygame.draw.rect(surf, UI_PLAYFUL, (gear_center[0] - tooth_w // 2, gear_center[1] - 20, tooth_w, tooth_h))
+        pygame.draw.rect(surf, UI_PLAYFUL, (gear_center[0] - tooth_w // 2, gear_center[1] + 10, tooth_w, tooth_h))
+        pygame.draw.rect(surf, UI_PLAYFUL, (gear_center[0] - 20, gear_center[1] - tooth_w // 2, tooth_h, tooth_w))
+        pygame.draw.rect(surf, UI_PLAYFUL, (gear_center[0] + 10, gear_center[1] - tooth_w // 2, tooth_h, tooth_w))
+        draw_rounded_box(surf, prize_button_rect, fill_color=(25, 35, 50), border_color=CARNIVAL_YELLOW, border_thickness=3, radius=12)
         gift_center_x = prize_button_rect.left + square_size // 2
         gift_center_y = prize_button_rect.top + square_size // 2
         box_w = 28
         box_h = 18
-        pygame.draw.rect(self.screen, UI_PLAYFUL, (gift_center_x - box_w // 2, gift_center_y - 2, box_w, box_h))
-        pygame.draw.rect(self.screen, CARNIVAL_YELLOW, (gift_center_x - 3, gift_center_y - 6, 6, box_h + 2))
-        pygame.draw.rect(self.screen, CARNIVAL_YELLOW, (gift_center_x - box_w // 2, gift_center_y - 1, box_w, 4))
-        self.prize_button_rect = prize_button_rect
+        pygame.draw.rect(surf, UI_PLAYFUL, (gift_center_x - box_w // 2, gift_center_y - 2, box_w, box_h))
+        pygame.draw.rect(surf, CARNIVAL_YELLOW, (gift_center_x - 3, gift_center_y - 6, 6, box_h + 2))
+        pygame.draw.rect(surf, CARNIVAL_YELLOW, (gift_center_x - box_w // 2, gift_center_y - 1, box_w, 4))
+
+    # DRAW MAIN MENU
+    def _draw_menu(self):
+        self.menu_background.blit(self.screen)
+        overlay_rect = self._menu_overlay_rect()
+        overlay_width = overlay_rect.width
+        self.stats_button_rect, self.settings_button_rect, self.prize_button_rect = self._menu_side_rects()
         y_start = overlay_rect.top + 40
         button_height = 48
         button_width = overlay_width - 60
@@ -2726,12 +5432,6 @@ class ArcadeManager:
                 if self.sound_manager and hasattr(self.sound_manager, 'play_selection'):
                     try:
                         self.sound_manager.play_selection()
-                        return
-                    except Exception:
-                        pass
-                if self._selection_sound:
-                    try:
-                        self._selection_sound.play()
                     except Exception:
                         pass
             except Exception:
@@ -2781,24 +5481,30 @@ class ArcadeManager:
             text_color = BLACK if state_id in (STATE_DARTPOP, STATE_SPLASH, STATE_SHELLGAME, STATE_PRIZES, STATE_WHACK) else WHITE
             draw_button(self.screen, button_text, rect, color, text_color, self.button_font, locked=is_locked, hover=hover)
             self.button_rects[state_id] = rect
-        inst_surf = self.small_font.render("Press ESC to exit Arcade", True, UI_PLAYFUL)
-        self.screen.blit(inst_surf, (SCREEN_WIDTH // 2 - inst_surf.get_width() // 2, SCREEN_HEIGHT - 30))
+        inst_surf = render_text(self.small_font, "Press ESC to exit Arcade", UI_PLAYFUL)
+        SURFACES.blit(self.screen, inst_surf, (SCREEN_WIDTH // 2 - inst_surf.get_width() // 2, SCREEN_HEIGHT - 30))
+
+    # DIMMING OVERLAY
+    def _dim_overlay(self, alpha: int):
+        def build():
+            overlay = SURFACES.new((SCREEN_WIDTH, SCREEN_HEIGHT))
+            overlay.fill((0, 0, 0, alpha))
+            return overlay
+        return SPRITE_BAKER.get(('dim_overlay', SCREEN_WIDTH, SCREEN_HEIGHT, alpha), build)
 
     # DRAW SETTINGS
     def _draw_settings_screen(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        SURFACES.blit(self.screen, self._dim_overlay(180), (0, 0))
         panel_w = 520
-        panel_h = 380
+        panel_h = 472
         panel_rect = pygame.Rect(
             SCREEN_WIDTH // 2 - panel_w // 2,
             SCREEN_HEIGHT // 2 - panel_h // 2,
             panel_w, panel_h
         )
         draw_rounded_box(self.screen, panel_rect, fill_color=MENU_DARK_BLUE, border_color=CARNIVAL_YELLOW, border_thickness=5, radius=16)
-        title_surf = self.header_font.render("SETTINGS", True, UI_PLAYFUL)
-        self.screen.blit(title_surf, title_surf.get_rect(center=(panel_rect.left + panel_w // 2, panel_rect.top + 30)))
+        title_surf = render_text(self.header_font, "SETTINGS", UI_PLAYFUL)
+        SURFACES.blit(self.screen, title_surf, title_surf.get_rect(center=(panel_rect.left + panel_w // 2, panel_rect.top + 30)))
         row_top = panel_rect.top + 50
         row_height = 36
         left_text_x = panel_rect.left + 24
@@ -2807,8 +5513,8 @@ class ArcadeManager:
         toggle_rects = []
         r1_rect = pygame.Rect(panel_rect.left + 12, row_top, panel_rect.width - 24, row_height)
         draw_rounded_box(self.screen, r1_rect, fill_color=(30, 30, 40), border_color=None, border_thickness=0, radius=10)
-        label1 = self.ui_font.render("Velocity Attenuation (-25%)", True, UI_PLAYFUL)
-        self.screen.blit(label1, (left_text_x, row_top + (row_height - label1.get_height()) // 2))
+        label1 = render_text(self.ui_font, "Velocity Attenuation (-25%)", UI_PLAYFUL)
+        SURFACES.blit(self.screen, label1, (left_text_x, row_top + (row_height - label1.get_height()) // 2))
         toggle1_rect = pygame.Rect(toggle_right_x, row_top + (row_height - toggle_box_size) // 2, toggle_box_size, toggle_box_size)
         draw_rounded_box(self.screen, toggle1_rect, fill_color=(60, 60, 60), border_color=CARNIVAL_YELLOW, border_thickness=2, radius=8)
         if self.settings["slow_game"]:
@@ -2817,8 +5523,9 @@ class ArcadeManager:
         row_top += row_height + 10
         r2_rect = pygame.Rect(panel_rect.left + 12, row_top, panel_rect.width - 24, row_height)
         draw_rounded_box(self.screen, r2_rect, fill_color=(30, 30, 40), border_color=None, border_thickness=0, radius=10)
-        label2 = self.ui_font.render("Chromatic Simplification", True, UI_PLAYFUL)
-        self.screen.blit(label2, (left_text_x, row_top + (row_height - label2.get_height()) // 2))
+        mono_text = "Chromatic Simplification" if self.post_process.available("grayscale") else "Chromatic Simplification (Unavailable)"
+        label2 = render_text(self.ui_font, mono_text, UI_PLAYFUL)
+        SURFACES.blit(self.screen, label2, (left_text_x, row_top + (row_height - label2.get_height()) // 2))
         toggle2_rect = pygame.Rect(toggle_right_x, row_top + (row_height - toggle_box_size) // 2, toggle_box_size, toggle_box_size)
         draw_rounded_box(self.screen, toggle2_rect, fill_color=(60, 60, 60), border_color=CARNIVAL_YELLOW, border_thickness=2, radius=8)
         if self.settings["monochrome"]:
@@ -2827,8 +5534,8 @@ class ArcadeManager:
         row_top += row_height + 10
         r3_rect = pygame.Rect(panel_rect.left + 12, row_top, panel_rect.width - 24, row_height)
         draw_rounded_box(self.screen, r3_rect, fill_color=(30, 30, 40), border_color=None, border_thickness=0, radius=10)
-        label3 = self.ui_font.render("Acoustic Output Control", True, UI_PLAYFUL)
-        self.screen.blit(label3, (left_text_x, row_top + (row_height - label3.get_height()) // 2))
+        label3 = render_text(self.ui_font, "Acoustic Output Control", UI_PLAYFUL)
+        SURFACES.blit(self.screen, label3, (left_text_x, row_top + (row_height - label3.get_height()) // 2))
         toggle3_rect = pygame.Rect(toggle_right_x, row_top + (row_height - toggle_box_size) // 2, toggle_box_size, toggle_box_size)
         draw_rounded_box(self.screen, toggle3_rect, fill_color=(60, 60, 60), border_color=CARNIVAL_YELLOW, border_thickness=2, radius=8)
         if self.settings["mute_audio"]:
@@ -2837,8 +5544,8 @@ class ArcadeManager:
         row_top += row_height + 10
         r4_rect = pygame.Rect(panel_rect.left + 12, row_top, panel_rect.width - 24, row_height)
         draw_rounded_box(self.screen, r4_rect, fill_color=(30, 30, 40), border_color=None, border_thickness=0, radius=10)
-        label4 = self.ui_font.render("Reticle Variant", True, UI_PLAYFUL)
-        self.screen.blit(label4, (left_text_x, row_top + (row_height - label4.get_height()) // 2))
+        label4 = render_text(self.ui_font, "Reticle Variant", UI_PLAYFUL)
+        SURFACES.blit(self.screen, label4, (left_text_x, row_top + (row_height - label4.get_height()) // 2))
         toggle4_rect = pygame.Rect(toggle_right_x, row_top + (row_height - toggle_box_size) // 2, toggle_box_size, toggle_box_size)
         draw_rounded_box(self.screen, toggle4_rect, fill_color=(60, 60, 60), border_color=CARNIVAL_YELLOW, border_thickness=2, radius=8)
         if self.settings["reticle_alt"]:
@@ -2847,8 +5554,8 @@ class ArcadeManager:
         row_top += row_height + 10
         r5_rect = pygame.Rect(panel_rect.left + 12, row_top, panel_rect.width - 24, row_height)
         draw_rounded_box(self.screen, r5_rect, fill_color=(30, 30, 40), border_color=None, border_thickness=0, radius=10)
-        label5 = self.ui_font.render("Performance Metrics", True, UI_PLAYFUL)
-        self.screen.blit(label5, (left_text_x, row_top + (row_height - label5.get_height()) // 2))
+        label5 = render_text(self.ui_font, "Performance Metrics", UI_PLAYFUL)
+        SURFACES.blit(self.screen, label5, (left_text_x, row_top + (row_height - label5.get_height()) // 2))
         toggle5_rect = pygame.Rect(toggle_right_x, row_top + (row_height - toggle_box_size) // 2, toggle_box_size, toggle_box_size)
         draw_rounded_box(self.screen, toggle5_rect, fill_color=(60, 60, 60), border_color=CARNIVAL_YELLOW, border_thickness=2, radius=8)
         if self.settings["fps_in_settings"]:
@@ -2857,22 +5564,44 @@ class ArcadeManager:
         row_top += row_height + 10
         r6_rect = pygame.Rect(panel_rect.left + 12, row_top, panel_rect.width - 24, row_height)
         draw_rounded_box(self.screen, r6_rect, fill_color=(30, 30, 40), border_color=None, border_thickness=0, radius=10)
-        label6 = self.ui_font.render(f"Temporal Constraints ({int(self.settings.get('timer_seconds', 60))}s)", True, UI_PLAYFUL)
-        self.screen.blit(label6, (left_text_x, row_top + (row_height - label6.get_height()) // 2))
+        label6 = render_text(self.ui_font, f"Temporal Constraints ({int(self.settings.get('timer_seconds', 60))}s)", UI_PLAYFUL)
+        SURFACES.blit(self.screen, label6, (left_text_x, row_top + (row_height - label6.get_height()) // 2))
         toggle6_rect = pygame.Rect(toggle_right_x, row_top + (row_height - toggle_box_size) // 2, toggle_box_size, toggle_box_size)
         draw_rounded_box(self.screen, toggle6_rect, fill_color=(60, 60, 60), border_color=CARNIVAL_YELLOW, border_thickness=2, radius=8)
         if self.settings["timer_enabled"]:
             pygame.draw.circle(self.screen, UI_PLAYFUL, toggle6_rect.center, toggle_box_size // 3)
         toggle_rects.append(toggle6_rect)
+        row_top += row_height + 10
+        r7_rect = pygame.Rect(panel_rect.left + 12, row_top, panel_rect.width - 24, row_height)
+        draw_rounded_box(self.screen, r7_rect, fill_color=(30, 30, 40), border_color=None, border_thickness=0, radius=10)
+        cb_mode = self.settings.get("colorblind_mode")
+        cb_text = f"Colour Vision Simulation ({cb_mode.title() if cb_mode else 'Off'})"
+        if cb_mode and not self.post_process.available(cb_mode):
+            cb_text = "Colour Vision Simulation (Needs NumPy)"
+        label7 = render_text(self.ui_font, cb_text, UI_PLAYFUL)
+        SURFACES.blit(self.screen, label7, (left_text_x, row_top + (row_height - label7.get_height()) // 2))
+        toggle7_rect = pygame.Rect(toggle_right_x, row_top + (row_height - toggle_box_size) // 2, toggle_box_size, toggle_box_size)
+        draw_rounded_box(self.screen, toggle7_rect, fill_color=(60, 60, 60), border_color=CARNIVAL_YELLOW, border_thickness=2, radius=8)
+        if cb_mode:
+            pygame.draw.circle(self.screen, UI_PLAYFUL, toggle7_rect.center, toggle_box_size // 3)
+        toggle_rects.append(toggle7_rect)
+        row_top += row_height + 10
+        r8_rect = pygame.Rect(panel_rect.left + 12, row_top, panel_rect.width - 24, row_height)
+        draw_rounded_box(self.screen, r8_rect, fill_color=(30, 30, 40), border_color=None, border_thickness=0, radius=10)
+        label8 = render_text(self.ui_font, "Scanline Overlay", UI_PLAYFUL)
+        SURFACES.blit(self.screen, label8, (left_text_x, row_top + (row_height - label8.get_height()) // 2))
+        toggle8_rect = pygame.Rect(toggle_right_x, row_top + (row_height - toggle_box_size) // 2, toggle_box_size, toggle_box_size)
+        draw_rounded_box(self.screen, toggle8_rect, fill_color=(60, 60, 60), border_color=CARNIVAL_YELLOW, border_thickness=2, radius=8)
+        if self.settings.get("scanlines", False):
+            pygame.draw.circle(self.screen, UI_PLAYFUL, toggle8_rect.center, toggle_box_size // 3)
+        toggle_rects.append(toggle8_rect)
         self.settings_toggle_rects = toggle_rects
-        hint_surf = self.small_font.render("Click toggles or press 1/2/3/4/5/6 to toggle. ESC to return.", True, UI_PLAYFUL)
-        self.screen.blit(hint_surf, (panel_rect.left + panel_w // 2 - hint_surf.get_width() // 2, panel_rect.bottom - 25))
+        hint_surf = render_text(self.small_font, "Click toggles or press 1-8 to toggle (7 cycles modes). ESC to return.", UI_PLAYFUL)
+        SURFACES.blit(self.screen, hint_surf, (panel_rect.left + panel_w // 2 - hint_surf.get_width() // 2, panel_rect.bottom - 25))
 
     # DRAW STATS
     def _draw_stats_screen(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        SURFACES.blit(self.screen, self._dim_overlay(200), (0, 0))
         panel_w, panel_h = 520, 420
         panel_rect = pygame.Rect(
             SCREEN_WIDTH // 2 - panel_w // 2,
@@ -2881,146 +5610,721 @@ class ArcadeManager:
         )
         draw_rounded_box(self.screen, panel_rect, fill_color=MENU_DARK_BLUE, border_color=CARNIVAL_YELLOW, border_thickness=5, radius=20)
         panel_center_x = panel_rect.left + panel_w // 2
-        title_surf = self.header_font.render("ARCADE STATS", True, UI_PLAYFUL)
-        self.screen.blit(title_surf, title_surf.get_rect(center=(panel_center_x, panel_rect.top + 30)))
-        total_surf = self.button_font.render(f"GRAND TOTAL: {self.total_score} Points", True, WHITE)
-        self.screen.blit(total_surf, total_surf.get_rect(center=(panel_center_x, panel_rect.top + 80)))
-        header_surf = self.ui_font.render("--- HIGHEST SCORE PER GAME (All Sessions) ---", True, CARNIVAL_RED)
-        self.screen.blit(header_surf, header_surf.get_rect(center=(panel_center_x, panel_rect.top + 130)))
+        title_surf = render_text(self.header_font, "ARCADE STATS", UI_PLAYFUL)
+        SURFACES.blit(self.screen, title_surf, title_surf.get_rect(center=(panel_center_x, panel_rect.top + 30)))
+        total_surf = render_text(self.button_font, f"GRAND TOTAL: {self.total_score} Points", WHITE)
+        SURFACES.blit(self.screen, total_surf, total_surf.get_rect(center=(panel_center_x, panel_rect.top + 80)))
+        header_surf = render_text(self.ui_font, "--- HIGHEST SCORE PER GAME (All Sessions) ---", CARNIVAL_RED)
+        SURFACES.blit(self.screen, header_surf, header_surf.get_rect(center=(panel_center_x, panel_rect.top + 130)))
         y_pos = panel_rect.top + 160
         game_states = [STATE_DARTPOP, STATE_HOOPSHOT, STATE_SPLASH, STATE_SHELLGAME, STATE_WHACK]
+        if self._last_drawn_state != STATE_STATS:
+            self.leaderboard = self.profiles.leaders(game_states)
         for game_state in game_states:
             game_name = self.game_names.get(game_state, "Unknown Game")
             high_score = self.game_high_scores.get(game_state, 0)
             rank_text = f"{game_name}: {high_score} Points"
+            leader = self.leaderboard.get(game_state)
+            if leader and leader[1] > high_score:
+                high_score = leader[1]
+                rank_text = f"{game_name}: {high_score} Points ({leader[0]})"
             color = SPLASH_GREEN if high_score > 0 else WHITE
-            score_surf = self.button_font.render(rank_text, True, color)
-            self.screen.blit(score_surf, score_surf.get_rect(center=(panel_center_x, y_pos)))
+            score_surf = render_text(self.button_font, rank_text, color)
+            SURFACES.blit(self.screen, score_surf, score_surf.get_rect(center=(panel_center_x, y_pos)))
             y_pos += 40
         y_pos += 2
-        timed_header = self.ui_font.render(f"Timed Games Played: {self.timed_games_played}", True, UI_PLAYFUL)
-        self.screen.blit(timed_header, (panel_center_x - timed_header.get_width() // 2, y_pos))
+        timed_header = render_text(self.ui_font, f"Timed Games Played: {self.timed_games_played}", UI_PLAYFUL)
+        SURFACES.blit(self.screen, timed_header, (panel_center_x - timed_header.get_width() // 2, y_pos))
         y_pos += 18
         if self.timed_game_records:
-            last = self.timed_game_records[-1]
-            last_game = self.game_names.get(last.get('game', ''), "Unknown")
-            last_score = last.get('score', 0)
-            last_line = self.small_font.render(f"Last Timed: {last_game} | Score: {last_score}", True, WHITE)
-            self.screen.blit(last_line, (panel_center_x - last_line.get_width() // 2, y_pos))
+            last_id, last_score, _last_time = self.timed_game_records[-1]
+            last_game = self.game_names.get(last_id, "Unknown")
+            last_line = render_text(self.small_font, f"Last Timed: {last_game} | Score: {last_score}", WHITE)
+            SURFACES.blit(self.screen, last_line, (panel_center_x - last_line.get_width() // 2, y_pos))
             y_pos += 30
-        exit_surf = self.ui_font.render("Press SPACE to return to Menu", True, UI_PLAYFUL)
-        self.screen.blit(exit_surf, exit_surf.get_rect(center=(panel_center_x, panel_rect.bottom - 20)))
+        exit_surf = render_text(self.ui_font, "Press SPACE to return to Menu", UI_PLAYFUL)
+        SURFACES.blit(self.screen, exit_surf, exit_surf.get_rect(center=(panel_center_x, panel_rect.bottom - 20)))
 
     # DRAW GAME SCORE HUD
     def _draw_game_score(self):
         session_text = f"SESSION: {self.current_game_score}"
-        session_surf = self.ui_font.render(session_text, True, UI_PLAYFUL)
-        self.screen.blit(session_surf, (SCREEN_WIDTH - session_surf.get_width() - 10, 10))
+        session_surf = render_text(self.ui_font, session_text, UI_PLAYFUL)
+        session_rect = SURFACES.blit(self.screen, session_surf, (SCREEN_WIDTH - session_surf.get_width() - 10, 10))
+        self.hud_dirty.mark('session', session_rect, session_text)
         total_text = f"TOTAL: {self.total_score} | ESC to Menu"
-        total_surf = self.ui_font.render(total_text, True, UI_PLAYFUL)
-        self.screen.blit(total_surf, (SCREEN_WIDTH - total_surf.get_width() - 10, 30))
+        total_surf = render_text(self.ui_font, total_text, UI_PLAYFUL)
+        total_rect = SURFACES.blit(self.screen, total_surf, (SCREEN_WIDTH - total_surf.get_width() - 10, 30))
+        self.hud_dirty.mark('total', total_rect, total_text)
         if self.timer_active:
             try:
                 time_left = max(0, int(self.timer_remaining))
-                timer_surf = self.ui_font.render(f"Timer: {time_left}s", True, UI_PLAYFUL)
-                self.screen.blit(timer_surf, (SCREEN_WIDTH - timer_surf.get_width() - 10, 50))
+                timer_text = f"Timer: {time_left}s"
+                timer_surf = render_text(self.ui_font, timer_text, UI_PLAYFUL)
+                timer_rect = SURFACES.blit(self.screen, timer_surf, (SCREEN_WIDTH - timer_surf.get_width() - 10, 50))
+                self.hud_dirty.mark('timer', timer_rect, timer_text)
             except Exception:
                 pass
+        else:
+            self.hud_dirty.forget('timer')
 
-    # MONOCHROME FILTER
-    def _apply_monochrome_filter(self):
-        surf = self.screen
-        try:
-            import numpy as np
-            arr = pygame.surfarray.array3d(surf)
-            gray = (0.299 * arr[..., 0] + 0.587 * arr[..., 1] + 0.114 * arr[..., 2]).astype(np.uint8)
-            gray3 = np.empty_like(arr)
-            gray3[..., 0] = gray
-            gray3[..., 1] = gray
-            gray3[..., 2] = gray
-            gray_surf = pygame.surfarray.make_surface(gray3)
-            surf.blit(gray_surf, (0, 0))
-        except Exception:
-            w, h = surf.get_size()
-            gray_surf = pygame.Surface((w, h))
-            surf.lock()
-            gray_surf.lock()
-            for y in range(h):
-                for x in range(w):
-                    try:
-                        r, g, b, a = surf.get_at((x, y))
-                    except Exception:
-                        r, g, b = surf.get_at((x, y))[:3]
-                        a = 255
-                    gray = int(0.299 * r + 0.587 * g + 0.114 * b)
-                    gray_surf.set_at((x, y), (gray, gray, gray))
-            surf.unlock()
-            gray_surf.unlock()
-            surf.blit(gray_surf, (0, 0))
+    # OPEN DISPLAY (VSYNC WHEN REQUESTED)
+    def _open_display(self, size, flags: int = 0):
+        self.vsync_active = False
+        if FRAME_VSYNC:
+            try:
+                display = pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+                self.vsync_active = True
+                return display
+            except Exception:
+                pass
+        return pygame.display.set_mode(size, flags)
+
+    # FRAME PROFILER TOGGLE
+    def set_profiler(self, enabled: bool):
+        if enabled == (self.profiler is not None):
+            return
+        if enabled:
+            self.profiler = FrameProfiler()
+        else:
+            self.profiler.draw_counter.uninstall()
+            self.profiler = None
+            self.hud_dirty.forget('profiler')
+
+    # PROFILER OVERLAY
+    def _draw_profiler(self):
+        surf = self.profiler.overlay(self.small_font, 1000.0 / FPS)
+        rect = self.screen.blit(surf, (SCREEN_WIDTH - surf.get_width() - 10, SCREEN_HEIGHT - surf.get_height() - 40))
+        self.hud_dirty.mark('profiler', rect, id(surf))
+        return rect
+
+    # SURFACE FORMAT DEBUG OVERLAY
+    def _draw_surface_debug(self):
+        text = f"UNCONVERTED BLITS: {SURFACES.last_frame_unconverted}"
+        color = CARNIVAL_RED if SURFACES.last_frame_unconverted else UI_PLAYFUL
+        surf = render_text(self.small_font, text, color)
+        rect = self.screen.blit(surf, (10, SCREEN_HEIGHT - 50))
+        self.hud_dirty.mark('surface_debug', rect, text)
+
+    # PRESENT FRAME (NONE MEANS FULL FLIP)
+    def _present(self, rects=None):
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    # POST-PROCESSING (ONLY ROWS THAT WILL BE PRESENTED)
+    def _apply_post_processing(self, rects=None):
+        rows = None if rects is None else [(r.top, r.bottom) for r in rects]
+        self.post_process.apply(self.screen, rows=rows)
+
+    # REGIONS TO PRESENT THIS FRAME (NONE MEANS FULL FRAME)
+    def _present_rects(self):
+        if not self.dirty_rect_mode:
+            return None
+        scene = self.games.get(self.state) if self.state in self.games else None
+        scene_dirty = getattr(scene, 'dirty', None)
+        present_key = (self.state, self.modal_active)
+        full = scene_dirty is None or self.modal_active or present_key != self._last_present_key
+        if present_key != self._last_present_key:
+            self._last_present_key = present_key
+            self.hud_dirty.invalidate()
+            if scene_dirty is not None:
+                scene_dirty.invalidate()
+        rects = []
+        for tracker in (scene_dirty, self.hud_dirty):
+            if tracker is None:
+                continue
+            collected = tracker.collect()
+            if collected is None:
+                full = True
+            else:
+                rects.extend(collected)
+        return None if full else rects
 
     # MAIN RUN LOOP
     def run(self):
-        last_time = time.time()
+        last_time = time.perf_counter_ns()
         while self.running:
-            current_time = time.time()
-            dt = current_time - last_time
+            pending = None
+            if self._should_idle():
+                pending = pygame.event.wait(IDLE_WAIT_TIMEOUT_MS)
+                if pending.type == pygame.NOEVENT:
+                    pending = None
+                last_time = time.perf_counter_ns()
+                self.clock.resync()
+            current_time = time.perf_counter_ns()
+            dt = (current_time - last_time) / 1_000_000_000
             last_time = current_time
-            self._handle_input()
-            self._update_state(dt)
-            if self.state == STATE_MENU:
-                self._draw_menu()
-            elif self.state == STATE_STATS:
-                self._draw_menu()
-                self._draw_stats_screen()
-            elif self.state == STATE_SETTINGS:
-                self._draw_menu()
-                self._draw_settings_screen()
-            elif self.state in self.games:
-                game = self.games[self.state]
-                if self.state == STATE_PRIZES:
-                    try:
-                        game.unlocked = self.prize_unlocked
-                        game.draw(self.total_score)
-                    except Exception:
-                        game.draw(self.total_score)
-                else:
-                    game.draw()
-                if self.state != STATE_PRIZES:
-                    self._draw_game_score()
-            if self.modal_active:
-                panel_w = 540
-                panel_h = 150
-                panel_rect = pygame.Rect(SCREEN_WIDTH // 2 - panel_w // 2, SCREEN_HEIGHT // 2 - panel_h // 2, panel_w, panel_h)
-                draw_rounded_box(self.screen, panel_rect, fill_color=MENU_DARK_BLUE, border_color=CARNIVAL_YELLOW, border_thickness=4, radius=12)
-                title = self.header_font.render("UNLOCK GAME", True, UI_PLAYFUL) if self.modal_type == 'unlock_game' else self.header_font.render("NOTICE", True, UI_PLAYFUL)
-                self.screen.blit(title, (panel_rect.left + 20, panel_rect.top + 12))
-                msg_lines = wrap_text(self.small_font, self.modal_message, panel_w - 40)
-                y = panel_rect.top + 44
-                for line in msg_lines:
-                    surf = self.small_font.render(line, True, WHITE)
-                    self.screen.blit(surf, (panel_rect.left + 20, y))
-                    y += surf.get_height() + 6
-                for name, rect in self.modal_buttons.items():
-                    is_primary = (name in ('purchase', 'purchase', 'ok'))
-                    color = SPLASH_GREEN if is_primary else (60, 60, 60)
-                    draw_button(self.screen, name.upper(), rect, color, BLACK, self.small_font, locked=False, hover=False)
-            if self.show_fps:
-                fps_surf = self.small_font.render(f"FPS: {int(self.clock.get_fps())}", True, UI_PLAYFUL)
-                self.screen.blit(fps_surf, (10, SCREEN_HEIGHT - 30))
-            if self.settings["monochrome"]:
+            SURFACES.begin_frame()
+            profiler = self.profiler
+            if profiler is not None:
+                profiler.begin_frame()
+            self._handle_input(pending)
+            if self.profiler is not profiler:
+                profiler = None
+            if profiler is not None:
+                profiler.mark('input')
+            if self.render_paused:
+                continue
+            self._advance_simulation(dt)
+            self.sound_manager.flush()
+            if self.journal.compaction_due:
+                self.journal.compact(self._snapshot())
+            if profiler is not None:
+                profiler.mark('update')
+            if self._should_idle():
+                continue
+            sampling = profiler is not None and profiler.sampling
+            if sampling:
+                profiler.draw_counter.install()
+                SURFACES.counting = True
+            try:
+                self._render_frame(profiler)
+            finally:
+                if sampling:
+                    profiler.draw_counter.uninstall()
+                    SURFACES.counting = DEBUG_SURFACE_FORMATS
+            if profiler is not None:
+                profiler.end_frame(SURFACES.blit_count)
+            self.needs_redraw = False
+            self._last_drawn_state = self.state
+            if self.profile_capture is not None and not self.profile_capture.frame(STATE_NAMES.get(self.state, str(self.state))):
+                self.stop_profile_capture()
+            self.clock.tick(FPS)
+        self.stop_profile_capture()
+        for writer in self._capture_writers:
+            writer.join()
+        self._save_pacing_log()
+        self.journal.close(self._snapshot())
+        PERSISTENCE.close()
+        self.profiles.close()
+
+    # DRAW, POST-PROCESS AND PRESENT ONE FRAME
+    def _render_frame(self, profiler=None):
+        self._draw_scene()
+        if profiler is not None:
+            profiler.mark('draw')
+        if self.modal_active:
+            self._draw_modal()
+        if self.show_fps:
+            fps_text = f"FPS: {int(self.clock.get_fps())}"
+            fps_surf = render_text(self.small_font, fps_text, UI_PLAYFUL)
+            fps_rect = SURFACES.blit(self.screen, fps_surf, (10, SCREEN_HEIGHT - 30))
+            self.hud_dirty.mark('fps', fps_rect, fps_text)
+        else:
+            self.hud_dirty.forget('fps')
+        if DEBUG_SURFACE_FORMATS:
+            self._draw_surface_debug()
+        if profiler is not None:
+            profiler.mark('modal')
+        rects = self._present_rects()
+        if self.post_process.filters:
+            try:
+                self._apply_post_processing(rects)
+            except Exception:
+                pass
+        if profiler is not None:
+            profiler.mark('post')
+            overlay_rect = self._draw_profiler()
+            if rects is not None:
+                rects.append(overlay_rect)
+        self._present(rects)
+        if profiler is not None:
+            profiler.mark('present')
+
+    # DRAW ACTIVE SCENE
+    def _draw_scene(self):
+        if self.fixed_timestep:
+            self.interpolator.apply(self._interpolation_targets(), self.render_alpha)
+        if self.state == STATE_MENU:
+            self._draw_menu()
+        elif self.state == STATE_STATS:
+            self._draw_menu()
+            self._draw_stats_screen()
+        elif self.state == STATE_SETTINGS:
+            self._draw_menu()
+            self._draw_settings_screen()
+        elif self.state in self.games:
+            game = self.games[self.state]
+            if self.state == STATE_PRIZES:
                 try:
-                    self._apply_monochrome_filter()
+                    game.unlocked = self.prize_unlocked
+                    game.draw(self.total_score)
                 except Exception:
-                    pass
-            pygame.display.flip()
-            self.clock.tick(FPS)
-        self._save_scores()
-        self._save_prizes()
-        self._save_unlocks()
+                    game.draw(self.total_score)
+            else:
+                game.draw()
+            if self.state != STATE_PRIZES:
+                self._draw_game_score()
+        self.interpolator.restore()
+
+    # DRAW MODAL PANEL
+    def _draw_modal(self):
+        panel_w = 540
+        panel_h = 150
+        panel_rect = pygame.Rect(SCREEN_WIDTH // 2 - panel_w // 2, SCREEN_HEIGHT // 2 - panel_h // 2, panel_w, panel_h)
+        draw_rounded_box(self.screen, panel_rect, fill_color=MENU_DARK_BLUE, border_color=CARNIVAL_YELLOW, border_thickness=4, radius=12)
+        title = render_text(self.header_font, "UNLOCK GAME", UI_PLAYFUL) if self.modal_type == 'unlock_game' else render_text(self.header_font, "NOTICE", UI_PLAYFUL)
+        SURFACES.blit(self.screen, title, (panel_rect.left + 20, panel_rect.top + 12))
+        msg_lines = wrap_text(self.small_font, self.modal_message, panel_w - 40)
+        y = panel_rect.top + 44
+        for line in msg_lines:
+            surf = render_text(self.small_font, line, WHITE)
+            SURFACES.blit(self.screen, surf, (panel_rect.left + 20, y))
+            y += surf.get_height() + 6
+        for name, rect in self.modal_buttons.items():
+            is_primary = (name in ('purchase', 'purchase', 'ok'))
+            color = SPLASH_GREEN if is_primary else (60, 60, 60)
+            draw_button(self.screen, name.upper(), rect, color, BLACK, self.small_font, locked=False, hover=False)
+
+# BENCHMARK SETTINGS
+BENCHMARK_FRAMES = 2000
+BENCHMARK_WARMUP_FRAMES = 60
+BENCHMARK_DT = 1.0 / 60.0
+BENCHMARK_SEED = 1234
+BENCHMARK_REGRESSION_THRESHOLD = 0.10
+BENCHMARK_NOISE_FLOOR_MS = 0.05
+MICROBENCH_TARGET_SECONDS = 0.1
+MICROBENCH_ROUNDS = 9
+MICROBENCH_WARMUP_SECONDS = 0.05
+MICROBENCH_NOISE_FLOOR_US = 1.0
+PROFILE_BENCH_PLAYERS = 5000
+BENCHMARK_COMPARE_METRICS = ('mean', 'p95')
+BENCHMARK_SCENES = (
+    ("menu", STATE_MENU),
+    ("stats", STATE_STATS),
+    ("settings", STATE_SETTINGS),
+    ("dartpop", STATE_DARTPOP),
+    ("hoopshot", STATE_HOOPSHOT),
+    ("splash", STATE_SPLASH),
+    ("shellgame", STATE_SHELLGAME),
+    ("whack", STATE_WHACK),
+    ("prizes", STATE_PRIZES),
+)
+
+# BENCHMARK EVENT HELPERS
+def _bench_key(kind, key):
+    return pygame.event.Event(kind, key=key, mod=0, unicode='', scancode=0)
+
+def _bench_click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=tuple(pos), button=1)
+
+# SCRIPTED INPUT: MENU HOVER SWEEP
+def _bench_script_menu(manager, frame):
+    rects = list(manager.button_rects.values())
+    if rects and frame % 10 == 0:
+        target = rects[(frame // 10) % len(rects)].center
+        try:
+            pygame.mouse.set_pos(target)
+        except Exception:
+            pass
+        return [pygame.event.Event(pygame.MOUSEMOTION, pos=target, rel=(0, 0), buttons=(0, 0, 0))]
+    return []
+
+# SCRIPTED INPUT: DART POP
+def _bench_script_dartpop(game, frame):
+    if frame % 90 == 30:
+        return [_bench_key(pygame.KEYDOWN, pygame.K_SPACE)]
+    if frame % 90 == 75:
+        return [_bench_key(pygame.KEYDOWN, pygame.K_r)]
+    if frame % 600 == 599:
+        return [_bench_key(pygame.KEYDOWN, pygame.K_f)]
+    return []
+
+# SCRIPTED INPUT: HOOP SHOT
+def _bench_script_hoopshot(game, frame):
+    if frame % 45 == 0:
+        return [_bench_key(pygame.KEYDOWN, pygame.K_SPACE)]
+    return []
+
+# SCRIPTED INPUT: CLOWN SPLASH
+def _bench_script_splash(game, frame):
+    step = frame % 240
+    if step == 10:
+        return [_bench_key(pygame.KEYDOWN, pygame.K_SPACE)]
+    if step == 150:
+        return [_bench_key(pygame.KEYUP, pygame.K_SPACE)]
+    if step in (180, 200, 220):
+        return [_bench_key(pygame.KEYDOWN, pygame.K_r)]
+    return []
+
+# SCRIPTED INPUT: SHELL GAME
+def _bench_script_shellgame(game, frame):
+    if frame % 120 == 119 and game.cups:
+        cup = game.cups[(frame // 120) % len(game.cups)]
+        return [_bench_click(cup.rect.center)]
+    return []
+
+# SCRIPTED INPUT: WHACK-A-CLOWN
+def _bench_script_whack(game, frame):
+    if frame % 15 != 0:
+        return []
+    for target in game.targets:
+        if target.visible:
+            return [_bench_click(target.rect.center)]
+    return [_bench_click(game.PLAY_AREA_RECT.center)]
+
+# SCRIPTED INPUT: PRIZE ROOM
+def _bench_script_prizes(game, frame):
+    step = frame % 200
+    if step % 20 == 0 and step < 100:
+        return [pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1 if step < 60 else 1)]
+    if step == 120 and game.prize_item_rects:
+        rects = list(game.prize_item_rects.values())
+        return [_bench_click(rects[(frame // 200) % len(rects)].center)]
+    if step == 160:
+        return [_bench_key(pygame.KEYDOWN, pygame.K_ESCAPE)]
+    return []
+
+BENCHMARK_SCRIPTS = {
+    STATE_MENU: _bench_script_menu,
+    STATE_STATS: _bench_script_menu,
+    STATE_SETTINGS: _bench_script_menu,
+    STATE_DARTPOP: _bench_script_dartpop,
+    STATE_HOOPSHOT: _bench_script_hoopshot,
+    STATE_SPLASH: _bench_script_splash,
+    STATE_SHELLGAME: _bench_script_shellgame,
+    STATE_WHACK: _bench_script_whack,
+    STATE_PRIZES: _bench_script_prizes,
+}
+
+# SAMPLE STATISTICS (MILLISECONDS)
+def _bench_stats(samples_ns) -> dict:
+    if not samples_ns:
+        return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+    ordered = sorted(samples_ns)
+    n = len(ordered)
+
+    def pick(pct):
+        return ordered[min(n - 1, int(n * pct))] / 1e6
+
+    return {
+        'mean': sum(ordered) / n / 1e6,
+        'p50': pick(0.50),
+        'p95': pick(0.95),
+        'p99': pick(0.99),
+        'max': ordered[-1] / 1e6,
+    }
+
+# BENCHMARK ONE SCENE
+def _bench_scene(manager, state, frames: int, warmup: int) -> dict:
+    manager.state = state
+    game = manager.games.get(state)
+    if game is not None and hasattr(game, 'reset'):
+        game.reset()
+    script = BENCHMARK_SCRIPTS.get(state)
+    update_ns, draw_ns, present_ns, frame_ns = [], [], [], []
+    pygame.event.clear()
+    for frame in range(warmup + frames):
+        t0 = time.perf_counter_ns()
+        scripted = script(game if game is not None else manager, frame) if script else []
+        if game is not None:
+            for event in pygame.event.get() + scripted:
+                game.handle_input(event)
+            if state == STATE_PRIZES:
+                game.unlocked = manager.prize_unlocked
+            game.update(BENCHMARK_DT)
+        else:
+            for event in scripted:
+                pygame.event.post(event)
+            manager._handle_input()
+            manager.state = state
+            manager._update_state(BENCHMARK_DT)
+        manager.sound_manager.flush()
+        t1 = time.perf_counter_ns()
+        manager._draw_scene()
+        if manager.modal_active:
+            manager._draw_modal()
+        t2 = time.perf_counter_ns()
+        manager._present(manager._present_rects())
+        t3 = time.perf_counter_ns()
+        if frame >= warmup:
+            update_ns.append(t1 - t0)
+            draw_ns.append(t2 - t1)
+            present_ns.append(t3 - t2)
+            frame_ns.append(t3 - t0)
+    if game is not None:
+        try:
+            game.cleanup()
+        except Exception:
+            pass
+    manager.modal_active = False
+    return {
+        'update': _bench_stats(update_ns),
+        'draw': _bench_stats(draw_ns),
+        'present': _bench_stats(present_ns),
+        'frame': _bench_stats(frame_ns),
+    }
+
+# RUN BENCHMARK SUITE
+def run_benchmarks(frames: int = BENCHMARK_FRAMES, scenes=None, warmup: int = BENCHMARK_WARMUP_FRAMES) -> dict:
+    random.seed(BENCHMARK_SEED)
+    manager = ArcadeManager()
+    manager.idle_redraw = False
+    backend = manager.sound_manager.backend
+    results = {}
+    sounds = {}
+    for name, state in BENCHMARK_SCENES:
+        if scenes and name not in scenes:
+            continue
+        if isinstance(backend, RecordingAudioBackend):
+            backend.clear()
+        results[name] = _bench_scene(manager, state, frames, warmup)
+        if isinstance(backend, RecordingAudioBackend):
+            sounds[name] = backend.counts()
+    report = {
+        'meta': {
+            'frames': frames,
+            'warmup': warmup,
+            'dt': BENCHMARK_DT,
+            'python': sys.version.split()[0],
+            'pygame': pygame.version.ver,
+            'numpy': _HAVE_NUMPY,
+            'video_driver': pygame.display.get_driver(),
+            'audio_backend': backend.name,
+            'timestamp': time.time(),
+        },
+        'scenes': results,
+    }
+    if sounds:
+        report['sounds'] = sounds
+    return report
+
+# MICRO-BENCHMARK CASES
+def _microbench_cases() -> dict:
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    SURFACES.check_display()
+    target = SURFACES.new((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+    font = safe_font(size=22)
+    small_font = safe_font(size=16)
+    button_rect = pygame.Rect(100, 100, 240, 56)
+    box_rect = pygame.Rect(80, 80, 320, 180)
+    long_text = ("Hold SPACE to spray water at the clowns and press R to top up the tank "
+                 "before the timer runs out. Bullseyes score bonus points!")
+    clown_surface = SURFACES.new((100, 100))
+    clown_puffs = Clown(50, 50, size=72).hair_puffs
+    gun = WaterGun(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40)
+    gun.is_spraying = True
+    frame_surface = SURFACES.new((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+    frame_surface.fill(CARNIVAL_RED)
+    pipeline = PostProcessPipeline()
+    pipeline.set_filters([ColorMatrixFilter("grayscale", GRAYSCALE_MATRIX)])
+    counter = [0]
+
+    def button_skin_cold():
+        counter[0] += 1
+        create_button_skin(button_rect.size, f"PLAY {counter[0] % 97}", CARNIVAL_YELLOW, BLACK, font)
+
+    def wrap_uncached():
+        _wrap_text_uncached(small_font, long_text, 300)
+
+    cases = {
+        'draw_button': lambda: draw_button(target, "PLAY", button_rect, CARNIVAL_YELLOW, BLACK, font),
+        'create_button_skin': button_skin_cold,
+        'draw_rounded_box': lambda: draw_rounded_box(target, box_rect, fill_color=MENU_DARK_BLUE,
+                                                     border_color=CARNIVAL_YELLOW, border_thickness=4, radius=12),
+        'wrap_text': lambda: wrap_text(small_font, long_text, 300),
+        'wrap_text_uncached': wrap_uncached,
+        'draw_clown_face_centered': lambda: draw_clown_face_centered(clown_surface, 72, False, 100,
+                                                                     hair_puffs=clown_puffs, hair_seed=7),
+        'create_prize_icon_surf': lambda: create_prize_icon_surf("teddy", size=76),
+        'WaterGun.update_stream': lambda: gun.update_stream(120, 0.8, BENCHMARK_DT),
+    }
+    if _HAVE_NUMPY:
+        cases['post_process_numpy'] = lambda: pipeline.apply(frame_surface, use_numpy=True)
+    cases['post_process_surface'] = lambda: pipeline.apply(frame_surface, use_numpy=False)
+    return cases
+
+# TIME ONE MICRO-BENCHMARK
+def _microbench_case(func, rounds: int = MICROBENCH_ROUNDS) -> dict:
+    deadline = time.perf_counter() + MICROBENCH_WARMUP_SECONDS
+    while time.perf_counter() < deadline:
+        func()
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= MICROBENCH_TARGET_SECONDS * 1e9 or number >= 1_000_000:
+            break
+        number *= 2
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        per_call.append((time.perf_counter_ns() - start) / number / 1000.0)
+    per_call.sort()
+    return {
+        'number': number,
+        'rounds': rounds,
+        'min_us': per_call[0],
+        'median_us': per_call[len(per_call) // 2],
+        'mean_us': sum(per_call) / len(per_call),
+        'max_us': per_call[-1],
+    }
+
+# RUN MICRO-BENCHMARK SUITE
+def run_microbenchmarks(names=None, rounds: int = MICROBENCH_ROUNDS) -> dict:
+    random.seed(BENCHMARK_SEED)
+    results = {}
+    for name, func in _microbench_cases().items():
+        if names and name not in names:
+            continue
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            results[name] = _microbench_case(func, rounds=rounds)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return {
+        'meta': {
+            'rounds': rounds,
+            'target_seconds': MICROBENCH_TARGET_SECONDS,
+            'python': sys.version.split()[0],
+            'pygame': pygame.version.ver,
+            'numpy': _HAVE_NUMPY,
+            'video_driver': pygame.display.get_driver(),
+            'timestamp': time.time(),
+        },
+        'micro': results,
+    }
+
+# COMPARE AGAINST BASELINE
+def compare_benchmarks(current: dict, baseline: dict, threshold: float = BENCHMARK_REGRESSION_THRESHOLD):
+    regressions = []
+    for scene, phases in current.get('scenes', {}).items():
+        base_phases = baseline.get('scenes', {}).get(scene)
+        if not base_phases:
+            continue
+        for phase, stats in phases.items():
+            base_stats = base_phases.get(phase, {})
+            for metric in BENCHMARK_COMPARE_METRICS:
+                old = base_stats.get(metric)
+                new = stats.get(metric)
+                if not old or new is None:
+                    continue
+                change = (new - old) / old
+                if change > threshold and new - old > BENCHMARK_NOISE_FLOOR_MS:
+                    regressions.append({'scene': scene, 'phase': phase, 'metric': metric, 'unit': 'ms',
+                                        'baseline': old, 'current': new, 'change': change})
+    for name, stats in current.get('micro', {}).items():
+        old = baseline.get('micro', {}).get(name, {}).get('min_us')
+        new = stats.get('min_us')
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        if change > threshold and new - old > MICROBENCH_NOISE_FLOOR_US:
+            regressions.append({'scene': name, 'phase': 'micro', 'metric': 'min_us', 'unit': 'us',
+                                'baseline': old, 'current': new, 'change': change})
+    return regressions
+
+# PROFILE STORE BENCHMARK (SEEDED DATABASE, SCREEN OPEN TIMES)
+def run_profile_benchmark(rows: int, players: int = PROFILE_BENCH_PLAYERS) -> dict:
+    import shutil
+    import tempfile
+    folder = tempfile.mkdtemp(prefix="arcade-profiles-")
+    path = os.path.join(folder, PROFILE_DB_FILE)
+    games = [STATE_DARTPOP, STATE_HOOPSHOT, STATE_SPLASH, STATE_SHELLGAME, STATE_WHACK]
+    rng = random.Random(BENCHMARK_SEED)
+    results = {'rows': rows, 'players': players}
+    try:
+        store = ProfileStore(path)
+        t0 = time.perf_counter()
+        store.db.execute("BEGIN")
+        store.db.executemany("INSERT INTO players (name, created_at) VALUES (?, ?)",
+                             ((f"Player {i + 1}", 0.0) for i in range(players)))
+        store.db.executemany("INSERT INTO scores (player_id, game, score, played_at) VALUES (?, ?, ?, ?)",
+                             ((rng.randint(1, players), rng.choice(games), rng.randint(1, 20000), 0.0)
+                              for _ in range(rows)))
+        store.db.execute("COMMIT")
+        store.close()
+        results['seed_s'] = time.perf_counter() - t0
+
+        def timed(func):
+            start = time.perf_counter_ns()
+            value = func()
+            return value, (time.perf_counter_ns() - start) / 1e6
+
+        store, results['open_ms'] = timed(lambda: ProfileStore(path))
+        _, results['leaders_ms'] = timed(lambda: store.leaders(games))
+        _, results['top10_ms'] = timed(lambda: store.top_scores(STATE_WHACK, 10))
+        _, results['player_best_ms'] = timed(lambda: store.best_scores(players // 2, games))
+        manager = ArcadeManager()
+        manager.profiles = store
+        manager.player_id = players // 2
+        for name, state in (('menu', STATE_MENU), ('stats', STATE_STATS)):
+            manager.state = state
+            manager._last_drawn_state = None
+            _, results[f'{name}_open_ms'] = timed(manager._draw_scene)
+        store.close()
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return results
+
+# BENCHMARK COMMAND LINE
+def benchmark_main(argv) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(description="Headless Carnival Arcade benchmarks")
+    parser.add_argument('--benchmark', action='store_true')
+    parser.add_argument('--micro', action='store_true', help="time shared drawing helpers instead of scenes")
+    parser.add_argument('--rounds', type=int, default=MICROBENCH_ROUNDS)
+    parser.add_argument('--frames', type=int, default=BENCHMARK_FRAMES)
+    parser.add_argument('--warmup', type=int, default=BENCHMARK_WARMUP_FRAMES)
+    parser.add_argument('--scenes', default="", help="comma separated scene or micro-benchmark names")
+    parser.add_argument('--out', default="benchmark_results.json")
+    parser.add_argument('--baseline', default="", help="baseline JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=BENCHMARK_REGRESSION_THRESHOLD)
+    parser.add_argument('--audio', choices=sorted(AUDIO_BACKENDS), default='null',
+                        help="audio backend for scene runs (recording adds per-scene sound counts)")
+    parser.add_argument('--profile-rows', type=int, default=0,
+                        help="also seed a profile database with this many score rows and time screen opens")
+    args = parser.parse_args(argv)
+    global AUDIO_BACKEND
+    AUDIO_BACKEND = args.audio
+    scenes = [name.strip() for name in args.scenes.split(',') if name.strip()]
+    if args.micro:
+        results = run_microbenchmarks(names=scenes, rounds=args.rounds)
+    else:
+        results = run_benchmarks(frames=args.frames, scenes=scenes, warmup=args.warmup)
+    if args.profile_rows > 0:
+        results['profiles'] = run_profile_benchmark(args.profile_rows)
+    atomic_write_json(args.out, results)
+    for scene, phases in results.get('scenes', {}).items():
+        frame = phases['frame']
+        print(f"{scene:<10} frame mean {frame['mean']:.3f} ms  p50 {frame['p50']:.3f}  p95 {frame['p95']:.3f}  p99 {frame['p99']:.3f}")
+    for name, stats in results.get('micro', {}).items():
+        print(f"{name:<26} min {stats['min_us']:10.2f} us  median {stats['median_us']:10.2f}  x{stats['number']}")
+    if 'profiles' in results:
+        p = results['profiles']
+        print(f"profiles   {p['rows']} rows seeded in {p['seed_s']:.1f} s  open {p['open_ms']:.2f} ms  "
+              f"leaders {p['leaders_ms']:.2f} ms  menu {p['menu_open_ms']:.2f} ms  stats {p['stats_open_ms']:.2f} ms")
+    if not args.baseline:
+        return 0
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except Exception as exc:
+        print(f"Could not read baseline {args.baseline}: {exc}")
+        return 2
+    regressions = compare_benchmarks(results, baseline, args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r['scene']}.{r['phase']}.{r['metric']}: {r['baseline']:.3f} -> {r['current']:.3f} {r['unit']} (+{r['change'] * 100:.1f}%)")
+    if not regressions:
+        print(f"No regressions above {args.threshold * 100:.0f}% against {args.baseline}")
+    return 1 if regressions else 0
 
 # PROGRAM ENTRYPOINT
 if __name__ == '__main__':
+    if "--benchmark" in sys.argv:
+        status = benchmark_main(sys.argv[1:])
+        shutdown_audio_loader()
+        sys.exit(status)
     manager = ArcadeManager()
     manager.run()
+    shutdown_audio_loader()
     pygame.quit()
     sys.exit()